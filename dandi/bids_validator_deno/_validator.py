@@ -1,8 +1,11 @@
 # This file provides definitions to do BIDS validation through the deno-compiled BIDS
 # validator, https://pypi.org/project/bids-validator-deno/.
 
+from collections.abc import Callable
+from functools import cache
 from importlib.metadata import version
 import json
+import os
 from pathlib import Path
 import re
 from subprocess import CompletedProcess, TimeoutExpired, run
@@ -12,6 +15,8 @@ from typing import Optional
 from packaging.version import parse as parse_ver_str
 from pydantic import DirectoryPath, validate_call
 
+from dandi import get_logger
+from dandi.support.bids_tree import TreeFingerprint, scan_bids_tree
 from dandi.utils import find_parent_directory_containing
 from dandi.validate._types import (
     Origin,
@@ -26,6 +31,8 @@ from dandi.validate._types import (
 from ._models import BidsValidationResult, Issue
 from ._models import Severity as BidsSeverity
 
+lgr = get_logger()
+
 DISTRIBUTION_NAME = CMD = "bids-validator-deno"
 TIMEOUT = 600.0  # 10 minutes, in seconds
 
@@ -147,10 +154,16 @@ def bids_validate(
     config: Optional[dict] = None,
     ignore_nifti_headers: bool = False,
     recursive: bool = False,
+    tree_fingerprint: Optional[TreeFingerprint] = None,
 ) -> list[ValidationResult]:
     """
     Validate a file directory as a BIDS dataset with the deno-compiled BIDS validator
 
+    The harmonized results are cached persistently, keyed by the location of the
+    directory, a fingerprint of its tree (the paths, sizes & modification times of
+    its files), the validation options, and the version of the validator, so that
+    validating an unchanged dataset again does not invoke the validator.
+
     Parameters
     ----------
     dir_ : DirectoryPath
@@ -165,6 +178,9 @@ def bids_validate(
     recursive : bool
         If `True`, validate datasets found in derivatives directories in addition to
         root dataset
+    tree_fingerprint : Optional[TreeFingerprint]
+        The fingerprint of the tree of the directory, if already computed, e.g., by
+        `dandi.support.bids_tree.scan_bids_tree()`
 
     Returns
     -------
@@ -174,7 +190,9 @@ def bids_validate(
     """
 
     try:
-        bv_result = _bids_validate(dir_, config, ignore_nifti_headers, recursive)
+        return _cached_bids_validate(
+            dir_, config, ignore_nifti_headers, recursive, tree_fingerprint
+        )
     except ValidatorError as e:
         return [
             ValidationResult(
@@ -195,7 +213,83 @@ def bids_validate(
             )
         ]
 
-    return _harmonize(bv_result, dir_)
+
+def _cached_bids_validate(
+    dir_: DirectoryPath,
+    config: Optional[dict],
+    ignore_nifti_headers: bool,
+    recursive: bool,
+    tree_fingerprint: Optional[TreeFingerprint],
+) -> list[ValidationResult]:
+    """
+    Validate the directory with `_bids_validate()` and harmonize the result,
+    reusing the harmonized results of a previous validation of the directory
+    if neither the tree of the directory (per its `TreeFingerprint`), the
+    validation options, nor the validator version have changed since
+
+    Raises
+    ------
+    ValidatorError
+        If the deno-compiled BIDS validator fails in execution (such failures
+        are never cached)
+    """
+    # Avoid circular import by importing within function:
+    from dandi.files.bases import validation_cache_enabled
+
+    fprint = tree_fingerprint
+    if fprint is None and validation_cache_enabled() and os.path.isdir(dir_):
+        fprint = scan_bids_tree(dir_).fingerprint
+    if fprint is None or fprint.modified_recently() or not validation_cache_enabled():
+        bv_result = _bids_validate(dir_, config, ignore_nifti_headers, recursive)
+        return _harmonize(bv_result, dir_)
+    ds_path = Path(dir_).resolve()
+    dumped = _get_cached_bids_validation()(
+        fprint,
+        str(ds_path),
+        # The harmonized results also refer to the containing Dandiset
+        str(find_parent_directory_containing("dandiset.yaml", ds_path)),
+        json.dumps(config, sort_keys=True),
+        ignore_nifti_headers,
+        recursive,
+        _bids_validation_cache_tokens(),
+        dir_=dir_,
+    )
+    return [ValidationResult.model_validate_json(s) for s in dumped]
+
+
+def _dump_bids_validation(
+    fingerprint: TreeFingerprint,
+    ds_path: str,
+    dandiset_path: str,
+    config: str,
+    ignore_nifti_headers: bool,
+    recursive: bool,
+    tokens: tuple[str, ...],
+    dir_: DirectoryPath,
+) -> list[str]:
+    lgr.debug("No cached BIDS validation results for fingerprint of %s", dir_)
+    bv_result = _bids_validate(
+        dir_, json.loads(config), ignore_nifti_headers, recursive
+    )
+    return [r.model_dump_json() for r in _harmonize(bv_result, dir_)]
+
+
+@cache
+def _get_cached_bids_validation() -> Callable[..., list[str]]:
+    # Avoid heavy import by importing within function:
+    from dandi.pynwb_utils import validate_cache
+
+    return validate_cache.memoize(  # type: ignore[no-any-return]
+        _dump_bids_validation, exclude_kwargs=["dir_"]
+    )
+
+
+@cache
+def _bids_validation_cache_tokens() -> tuple[str, ...]:
+    # Avoid heavy import by importing within function:
+    from dandi.pynwb_utils import validate_cache_tokens
+
+    return tuple(validate_cache_tokens) + (get_version(),)
 
 
 @validate_call
@@ -10,11 +10,20 @@ from .base import devel_debug_option, instance_option, map_to_click_exceptions
     is_flag=True,
     help="Force deletion without requesting interactive confirmation",
 )
+@click.option(
+    "-J",
+    "--jobs",
+    type=click.IntRange(min=1),
+    help=(
+        "Maximum number of assets to delete in parallel.  Fewer are deleted at"
+        " once while the server is responding with errors."
+    ),
+)
 @click.argument("paths", nargs=-1, type=click.Path(exists=False, dir_okay=True))
 @instance_option()
 @devel_debug_option()
 @map_to_click_exceptions
-def delete(paths, skip_missing, dandi_instance, force, devel_debug=False):
+def delete(paths, skip_missing, dandi_instance, force, jobs, devel_debug=False):
     """Delete dandisets and assets from the server.
 
     PATH could be a local path or a URL to an asset, directory, or an entire
@@ -28,4 +37,5 @@ def delete(paths, skip_missing, dandi_instance, force, devel_debug=False):
         devel_debug=devel_debug,
         force=force,
         skip_missing=skip_missing,
+        jobs=jobs,
     )
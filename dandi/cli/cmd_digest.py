@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+import json
+import logging
+import os.path
+
 import click
 
 from .base import map_to_click_exceptions
 
+lgr = logging.getLogger(__name__)
+
 
 @click.command()
 @click.option(
@@ -18,12 +31,96 @@ from .base import map_to_click_exceptions
     help="Digest algorithm to use",
     show_default=True,
 )
+@click.option(
+    "-J",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help=(
+        "Number of files to digest in parallel.  Parts of dandi-etag digests of"
+        " large files are also computed in this many parallel processes."
+    ),
+    show_default=True,
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json_lines"]),
+    default="text",
+    help=(
+        "Output format.  With json_lines, each line also reports whether the"
+        " digest was found in the persistent digest cache."
+    ),
+    show_default=True,
+)
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
 @map_to_click_exceptions
-def digest(paths: tuple[str, ...], digest_alg: str) -> None:
-    """Calculate file digests"""
+def digest(
+    paths: tuple[str, ...], digest_alg: str, jobs: int, output_format: str
+) -> None:
+    """Calculate file digests
+
+    Directories are searched recursively for files to digest, except when
+    computing a zarr-checksum, in which case the checksum of each directory as
+    a whole is calculated.  With --jobs, results are output in the order in
+    which they are completed.
+    """
+    # Avoid heavy import by importing within function:
+    from ..support.digests import digest_file
+
+    targets = list(_iter_targets(paths, digest_alg))
+    part_executor: Executor | None = None
+    if digest_alg == "dandi-etag" and jobs > 1:
+        part_executor = ProcessPoolExecutor(max_workers=jobs)
+    cached = 0
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(digest_file, p, digest_alg, part_executor): p
+                for p in targets
+            }
+            for fut in as_completed(futures):
+                p = futures[fut]
+                try:
+                    value, hit = fut.result()
+                except Exception as e:
+                    lgr.error("%s: failed to compute digest: %s", p, e)
+                    failed += 1
+                    if output_format == "json_lines":
+                        print(json.dumps({"path": p, "error": str(e)}), flush=True)
+                    continue
+                cached += hit
+                if output_format == "json_lines":
+                    record = {
+                        "path": p,
+                        "algorithm": digest_alg,
+                        "digest": value,
+                        "cached": hit,
+                    }
+                    print(json.dumps(record), flush=True)
+                else:
+                    print(f"{p}:", value, flush=True)
+    finally:
+        if part_executor is not None:
+            part_executor.shutdown()
+    lgr.info(
+        "Computed %d digests (%d found in cache, %d failed)",
+        len(targets),
+        cached,
+        failed,
+    )
+    if failed:
+        raise click.ClickException(f"Failed to compute {failed} digest(s)")
+
+
+def _iter_targets(paths: tuple[str, ...], digest_alg: str) -> Iterator[str]:
     # Avoid heavy import by importing within function:
-    from ..support.digests import get_digest
+    from ..utils import find_files
 
     for p in paths:
-        print(f"{p}:", get_digest(p, digest=digest_alg))
+        if os.path.isdir(p) and digest_alg != "zarr-checksum":
+            yield from find_files(".*", paths=[p], exclude_datalad=True)
+        else:
+            yield p
@@ -1,4 +1,5 @@
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import os
 import os.path as op
 
@@ -57,10 +58,18 @@ files/directories.
 @click.option(
     "-J",
     "--jobs",
-    help="Number of parallel download jobs.",
+    help="Number of parallel download jobs.  Metadata of local files is also "
+    "extracted for this many files at a time.",
+    type=click.IntRange(min=1),
     default=6,  # TODO: come up with smart auto-scaling etc
     show_default=True,
 )
+@click.option(
+    "--ordered",
+    help="With formats other than pyout, output records in the order in which "
+    "paths were given or found rather than as soon as each one is ready.",
+    is_flag=True,
+)
 @click.option(
     "--metadata",
     type=click.Choice(["api", "all", "assets"]),
@@ -89,6 +98,7 @@ def ls(
     format="auto",
     recursive=False,
     jobs=6,
+    ordered=False,
 ):
     """List .nwb files and dandisets metadata."""
 
@@ -173,55 +183,75 @@ def ls(
         async_keys = async_keys.intersection(fields)
     async_keys = tuple(async_keys.difference(common_fields))
 
+    # Records are filled in by worker threads (pyout's, or our own with other
+    # formats), which hand CPU-bound metadata extraction off to worker
+    # processes
+    parallel = jobs > 1 and (recursive or len(paths) > 1)
+    extractor = None
+    if async_keys and (format == "pyout" or parallel):
+        # Avoid heavy import by importing within function:
+        from ..metadata.extractor import get_metadata_extractor
+
+        extractor = get_metadata_extractor()
+
     errors = defaultdict(list)  # problem: [] paths
-    with out:
-        for asset in assets_gen():
-            if isinstance(asset, str):  # path
-                rec = {}
-                rec["path"] = asset
-
-                try:
-                    if (not fields or "size" in fields) and not op.isdir(asset):
-                        rec["size"] = os.stat(asset).st_size
-
-                    if async_keys:
-                        cb = get_metadata_ls(
-                            asset,
-                            async_keys,
-                            errors=errors,
-                            flatten=format == "pyout",
-                            schema=schema,
-                            use_fake_digest=use_fake_digest,
-                        )
-                        if format == "pyout":
-                            rec[async_keys] = cb
-                        else:
-                            # TODO: parallel execution
-                            # For now just call callback and get all the fields
-                            cb_res = cb()
-                            # TODO: we should stop masking exceptions in get_metadata_ls,
-                            # and centralize logic regardless either it is for pyout or not
-                            # and do parallelizaion on our end, so at large it is
-                            if cb_res is None:
-                                raise
-                            for k, v in cb_res.items():
-                                rec[k] = v
-                except Exception as exc:
-                    _add_exc_error(asset, rec, errors, exc)
-            elif isinstance(asset, dict):
-                # ready record
-                if schema is not None and asset.get("schemaVersion") != schema:
-                    raise NotImplementedError(
-                        "Record conversion between schema versions is not"
-                        " implemented.  Found schemaVersion="
-                        f"{asset.get('schemaVersion')} where {schema} was"
-                        " requested"
+
+    def make_record(asset):
+        if isinstance(asset, str):  # path
+            rec = {}
+            rec["path"] = asset
+
+            try:
+                if (not fields or "size" in fields) and not op.isdir(asset):
+                    rec["size"] = os.stat(asset).st_size
+
+                if async_keys:
+                    cb = get_metadata_ls(
+                        asset,
+                        async_keys,
+                        errors=errors,
+                        flatten=format == "pyout",
+                        schema=schema,
+                        use_fake_digest=use_fake_digest,
+                        extractor=extractor,
                     )
-                # TODO: harmonization for pyout
-                rec = asset
-            else:
-                raise TypeError(asset)
+                    if format == "pyout":
+                        rec[async_keys] = cb
+                    else:
+                        # Get all the fields now, in one of our worker threads
+                        cb_res = cb()
+                        # TODO: we should stop masking exceptions in get_metadata_ls,
+                        # and centralize logic regardless either it is for pyout or not
+                        if cb_res is None:
+                            raise
+                        for k, v in cb_res.items():
+                            rec[k] = v
+            except Exception as exc:
+                _add_exc_error(asset, rec, errors, exc)
+        elif isinstance(asset, dict):
+            # ready record
+            if schema is not None and asset.get("schemaVersion") != schema:
+                raise NotImplementedError(
+                    "Record conversion between schema versions is not"
+                    " implemented.  Found schemaVersion="
+                    f"{asset.get('schemaVersion')} where {schema} was"
+                    " requested"
+                )
+            # TODO: harmonization for pyout
+            rec = asset
+        else:
+            raise TypeError(asset)
+        return asset, rec
+
+    if format == "pyout" or not async_keys:
+        records = map(make_record, assets_gen())
+    else:
+        records = _map_concurrently(
+            make_record, assets_gen(), jobs if parallel else 1, ordered
+        )
 
+    with out:
+        for asset, rec in records:
             if not rec:
                 errors["Empty record"].append(asset)
                 lgr.debug("Skipping a record for %s since empty", asset)
@@ -234,6 +264,47 @@ def ls(
         )
 
 
+def _map_concurrently(func, items, jobs, ordered):
+    """
+    Yield ``func(item)`` for each of ``items``, calling ``func`` in ``jobs``
+    threads.  Results are yielded as soon as they are ready, or, if
+    ``ordered`` is true, as soon as they and the results for all preceding
+    items are ready.  Only a few times ``jobs`` items are consumed ahead of the
+    results yielded.
+    """
+    if jobs == 1:
+        yield from map(func, items)
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = deque()
+
+        def ready():
+            if ordered:
+                while futures and futures[0].done():
+                    yield futures.popleft().result()
+            else:
+                for fut in [f for f in futures if f.done()]:
+                    futures.remove(fut)
+                    yield fut.result()
+
+        try:
+            for item in items:
+                futures.append(pool.submit(func, item))
+                yield from ready()
+                while len(futures) >= 4 * jobs:
+                    wait(
+                        [futures[0]] if ordered else futures,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    yield from ready()
+            while futures:
+                wait([futures[0]] if ordered else futures, return_when=FIRST_COMPLETED)
+                yield from ready()
+        finally:
+            for fut in futures:
+                fut.cancel()
+
+
 def _add_exc_error(asset, rec, errors, exc):
     """A helper to centralize collection of errors for pyout and non-pyout reporting"""
     lgr.debug("Problem obtaining metadata for %s: %s", asset, exc)
@@ -318,16 +389,36 @@ def flatten_meta_to_pyout(meta):
     return out
 
 
+def _nwb2asset_json(path, schema_version, digest):
+    # Avoid heavy import by importing within function:
+    from ..metadata.nwb import nwb2asset
+
+    return nwb2asset(path, schema_version=schema_version, digest=digest).model_dump(
+        mode="json", exclude_none=True
+    )
+
+
 def get_metadata_ls(
-    path, keys, errors, flatten=False, schema=None, use_fake_digest=False
+    path,
+    keys,
+    errors,
+    flatten=False,
+    schema=None,
+    use_fake_digest=False,
+    extractor=None,
 ):
     # Avoid heavy import by importing within function:
-    from ..metadata.nwb import get_metadata, nwb2asset
+    from ..metadata.nwb import get_metadata
     from ..pynwb_utils import get_nwb_version, ignore_benign_pynwb_warnings
     from ..support.digests import get_digest
 
     ignore_benign_pynwb_warnings()
 
+    def extract(func, path, **kwargs):
+        if extractor is None:
+            return func(path, **kwargs)
+        return extractor.run(func, path, **kwargs)
+
     def fn():
         rec = {}
         # No need for calling get_metadata if no keys are needed from it
@@ -343,11 +434,12 @@ def get_metadata_ls(
                         else:
                             lgr.info("Calculating digest for %s", path)
                             digest = get_digest(path, digest="dandi-etag")
-                        rec = nwb2asset(
+                        rec = extract(
+                            _nwb2asset_json,
                             path,
                             schema_version=schema,
                             digest=Digest.dandi_etag(digest),
-                        ).model_dump(mode="json", exclude_none=True)
+                        )
                 else:
                     if path.endswith(tuple(ZARR_EXTENSIONS)):
                         if use_fake_digest:
@@ -355,14 +447,18 @@ def get_metadata_ls(
                         else:
                             lgr.info("Calculating digest for %s", path)
                             digest = get_digest(path, digest="zarr-checksum")
-                        rec = get_metadata(path, Digest.dandi_zarr(digest))
+                        rec = extract(
+                            get_metadata, path, digest=Digest.dandi_zarr(digest)
+                        )
                     else:
                         if use_fake_digest:
                             digest = "0" * 32 + "-1"
                         else:
                             lgr.info("Calculating digest for %s", path)
                             digest = get_digest(path, digest="dandi-etag")
-                        rec = get_metadata(path, Digest.dandi_etag(digest))
+                        rec = extract(
+                            get_metadata, path, digest=Digest.dandi_etag(digest)
+                        )
             except Exception as exc:
                 _add_exc_error(path, rec, errors, exc)
             if flatten:
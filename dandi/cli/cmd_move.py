@@ -26,12 +26,28 @@ from ..move import MoveExisting, MoveWorkOn
     help="How to handle assets that would be moved to a destination that already exists",
     show_default=True,
 )
-@click.option("-J", "--jobs", type=int, help="Number of assets to move in parallel")
+@click.option(
+    "-J",
+    "--jobs",
+    type=int,
+    help=(
+        "Number of assets to move in parallel.  Moves into paths vacated by"
+        " other moves wait for those moves to finish."
+    ),
+)
 @click.option(
     "--regex",
     is_flag=True,
     help="Perform a regex substitution on all asset paths in the directory",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    help=(
+        "Complete the interrupted (or partially failed) move in the remote"
+        " Dandiset instead of starting a new one.  No paths may be given."
+    ),
+)
 @click.option(
     "-w",
     "--work-on",
@@ -43,9 +59,7 @@ from ..move import MoveExisting, MoveWorkOn
     ),
     show_default=True,
 )
-@click.argument(
-    "paths", nargs=-1, required=True, type=click.Path(exists=False, dir_okay=True)
-)
+@click.argument("paths", nargs=-1, type=click.Path(exists=False, dir_okay=True))
 @instance_option()
 @devel_debug_option()
 @map_to_click_exceptions
@@ -56,6 +70,7 @@ def move(
     existing: MoveExisting,
     jobs: int | None,
     regex: bool,
+    resume: bool,
     work_on: MoveWorkOn,
     dandi_instance: str,
     devel_debug: bool = False,
@@ -85,18 +100,33 @@ def move(
     matches, the matching portion is replaced with the replacement string,
     after expanding any backreferences.
 
+    Moves are performed in an order such that an asset is moved to a path
+    vacated by another asset only after the latter has been moved (with
+    cycles, like swapping two assets, broken by way of a temporary path).
+    Progress of moves in a remote Dandiset is recorded so that, if the command
+    is interrupted or some moves fail, the remaining moves can be performed
+    by running `dandi move --resume` for the same Dandiset.
+
     For more information, including examples, see
     <https://dandi.rtfd.io/en/latest/cmdline/move.html>.
     """
 
     from .. import move as move_mod
 
-    if len(paths) < 2:
+    srcs: tuple[str, ...]
+    if resume:
+        if paths:
+            raise ValueError("No paths may be given with --resume")
+        srcs, dest = (), ""
+    elif len(paths) < 2:
         raise ValueError("At least two paths are required")
+    else:
+        srcs, dest = paths[:-1], paths[-1]
     move_mod.move(
-        *paths[:-1],
-        dest=paths[-1],
+        *srcs,
+        dest=dest,
         regex=regex,
+        resume=resume,
         existing=existing,
         dandi_instance=dandi_instance,
         dandiset=dandiset,
@@ -32,9 +32,12 @@ from ..organize import CopyMode, FileOperationMode, OrganizeInvalid
     help="If 'dry' - no action is performed, suggested renames are printed. "
     "If 'simulate' - hierarchy of empty files at --dandiset-path is created. "
     "Note that previous layout should be removed prior to this operation.  "
-    "If 'auto' - whichever of symlink, hardlink, copy is allowed by system. "
-    "The other modes (copy, move, symlink, hardlink) define how data files "
-    "should be made available.",
+    "If 'auto' - whichever of symlink, hardlink, reflink, copy is allowed by "
+    "system. "
+    "The other modes (copy, move, symlink, hardlink, reflink) define how data "
+    "files should be made available.  'reflink' makes copy-on-write clones "
+    "where the filesystem supports them (e.g., btrfs, XFS), falling back to "
+    "an in-kernel or server-side (NFS) copy, or to a regular copy.",
     type=EnumChoice(FileOperationMode),
     default="auto",
     show_default=True,
@@ -64,8 +67,25 @@ from ..organize import CopyMode, FileOperationMode, OrganizeInvalid
         " file for which it is nonempty.  Can be specified multiple times."
     ),
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help=(
+        "Skip files organized by previous incremental runs (per a journal kept"
+        " under .dandi/ in the Dandiset) if they have not changed since, and"
+        " name new files alongside the organized ones, renaming the latter"
+        " only where needed to disambiguate the names."
+    ),
+)
 @click.argument("paths", nargs=-1, type=click.Path(exists=True))
-@click.option("-J", "--jobs", type=int, help="Number of jobs during organization")
+@click.option(
+    "-J",
+    "--jobs",
+    type=int,
+    help="Number of jobs during organization: processes for metadata extraction"
+    " and threads for file operations",
+)
 @devel_debug_option()
 @map_to_click_exceptions
 def organize(
@@ -77,6 +97,7 @@ def organize(
     media_files_mode: CopyMode | None,
     update_external_file_paths: bool,
     jobs: int | None,
+    incremental: bool,
     devel_debug: bool = False,
 ) -> None:
     """(Re)organize NWB files according to their metadata.
@@ -124,4 +145,5 @@ def organize(
         media_files_mode=media_files_mode,
         required_fields=required_fields,
         jobs=jobs,
+        incremental=incremental,
     )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
 import dataclasses
 import json as json_mod
 import logging
@@ -17,9 +19,9 @@ from .formatter import JSONFormatter, JSONLinesFormatter, TextFormatter, YAMLFor
 from ..utils import pluralize
 from ..validate._core import validate as validate_
 from ..validate._io import (
-    load_validation_jsonl,
+    ValidationLogWriter,
+    iter_validation_jsonl,
     validation_companion_path,
-    write_validation_jsonl,
 )
 from ..validate._types import MissingFileContent, Severity, ValidationResult
 
@@ -51,14 +53,17 @@ def _format_from_ext(path: str) -> str | None:
     return _EXT_TO_FORMAT.get(ext)
 
 
-def _collect_results(
+def _iter_results(
     paths: tuple[str, ...],
     schema: str | None,
     devel_debug: bool,
     allow_any_path: bool,
     missing_file_content: MissingFileContent = MissingFileContent.error,
-) -> list[ValidationResult]:
-    """Run validation and collect all results into a list."""
+    cache: bool = True,
+    jobs: int = 1,
+    ordered: bool = False,
+) -> Iterator[ValidationResult]:
+    """Run validation, yielding results as they are produced."""
     # Avoid heavy import by importing within function:
     from ..pynwb_utils import ignore_benign_pynwb_warnings
 
@@ -76,32 +81,60 @@ def _collect_results(
     # way to get relevant warnings (not errors) from PyNWB
     ignore_benign_pynwb_warnings()
 
-    return list(
-        validate_(
-            *paths,
-            schema_version=schema,
-            devel_debug=devel_debug,
-            allow_any_path=allow_any_path,
-            missing_file_content=missing_file_content,
-        )
+    yield from validate_(
+        *paths,
+        schema_version=schema,
+        devel_debug=devel_debug,
+        allow_any_path=allow_any_path,
+        missing_file_content=missing_file_content,
+        cache=cache,
+        jobs=jobs,
+        ordered=ordered,
     )
 
 
-def _filter_results(
-    results: list[ValidationResult],
+def _iter_filtered(
+    results: Iterable[ValidationResult],
     min_severity: str,
     ignore: str | None,
-) -> list[ValidationResult]:
-    """Filter results by minimum severity and ignore pattern."""
+) -> Iterator[ValidationResult]:
+    """Lazily filter results by minimum severity and ignore pattern."""
     min_severity_value = Severity[min_severity].value
-    filtered = [
-        r
-        for r in results
-        if r.severity is not None and r.severity.value >= min_severity_value
-    ]
-    if ignore is not None:
-        filtered = [r for r in filtered if not re.search(ignore, r.id)]
-    return filtered
+    ignore_re = re.compile(ignore) if ignore is not None else None
+    for r in results:
+        if r.severity is None or r.severity.value < min_severity_value:
+            continue
+        if ignore_re is not None and ignore_re.search(r.id):
+            continue
+        yield r
+
+
+@dataclasses.dataclass
+class ValidationStats:
+    """Counts of validation results, accumulated as the results stream by."""
+
+    total: int = 0
+    by_severity: Counter[str] = dataclasses.field(default_factory=Counter)
+    by_validator: Counter[str] = dataclasses.field(default_factory=Counter)
+    by_standard: Counter[str] = dataclasses.field(default_factory=Counter)
+    #: Whether any result has a severity of ERROR or higher
+    has_errors: bool = False
+
+    def add(self, r: ValidationResult) -> None:
+        self.total += 1
+        self.by_severity[r.severity.name if r.severity is not None else "NONE"] += 1
+        self.by_validator[r.origin.validator.value] += 1
+        self.by_standard[
+            r.origin.standard.value if r.origin.standard is not None else "N/A"
+        ] += 1
+        if r.severity is not None and r.severity >= Severity.ERROR:
+            self.has_errors = True
+
+    def count(self, results: Iterable[ValidationResult]) -> Iterator[ValidationResult]:
+        """Pass through *results*, counting each one."""
+        for r in results:
+            self.add(r)
+            yield r
 
 
 @click.command()
@@ -221,6 +254,25 @@ def validate_bids(
     type=click.Choice(["error", "only-non-data", "skip"], case_sensitive=True),
     default="error",
 )
+@click.option(
+    "-J",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes in which to validate NWB files in parallel.",
+    show_default=True,
+)
+@click.option(
+    "--ordered",
+    is_flag=True,
+    help="Validate files, and report their results, in order of their paths.",
+)
+@click.option(
+    "--cache/--no-cache",
+    help="Reuse the results of validating unchanged files from earlier runs.",
+    default=True,
+    show_default=True,
+)
 @click.option(
     "--load",
     help="Load validation results from JSONL file(s) instead of running validation.",
@@ -243,6 +295,9 @@ def validate(
     summary: bool = False,
     max_per_group: int | None = None,
     missing_file_content: str = "error",
+    jobs: int = 1,
+    ordered: bool = False,
+    cache: bool = True,
     load: tuple[str, ...] = (),
     schema: str | None = None,
     devel_debug: bool = False,
@@ -281,80 +336,92 @@ def validate(
     if load and paths:
         raise click.UsageError("--load and positional paths are mutually exclusive.")
 
+    results: Iterable[ValidationResult]
     if load:
-        results = load_validation_jsonl(load)
+        # Let the indexes of the files skip the results that would be
+        # filtered out below without parsing them
+        results = iter_validation_jsonl(
+            load, min_severity=Severity[min_severity], ignore=ignore
+        )
     else:
         mfc = MissingFileContent(missing_file_content)
-        results = _collect_results(
-            paths, schema, devel_debug, allow_any_path, missing_file_content=mfc
+        results = _iter_results(
+            paths,
+            schema,
+            devel_debug,
+            allow_any_path,
+            missing_file_content=mfc,
+            cache=cache,
+            jobs=jobs,
+            ordered=ordered,
         )
-        # Auto-save companion right after collection, before filtering — so
-        # all results are preserved regardless of display filters.
+        # Auto-save companion as results arrive, before filtering — so all
+        # results are preserved regardless of display filters.
         # Skip when writing to --output (user already gets structured output).
-        if (
-            not output_file
-            and results
-            and (obj := getattr(ctx, "obj", None)) is not None
-        ):
-            _auto_save_companion(results, obj.logfile)
+        if not output_file and (obj := getattr(ctx, "obj", None)) is not None:
+            results = _auto_save_companion(results, obj.logfile)
 
-    filtered = _filter_results(results, min_severity, ignore)
+    stats = ValidationStats()
+    filtered = stats.count(_iter_filtered(results, min_severity, ignore))
 
     if output_file is not None:
         with open(output_file, "w") as fh:
             _render(filtered, output_format, fh, grouping, max_per_group=max_per_group)
         lgr.info("Validation output written to %s", output_file)
         if summary:
-            _print_summary(filtered, sys.stderr)
+            _print_summary(stats, sys.stderr)
     else:
         _render(
             filtered, output_format, sys.stdout, grouping, max_per_group=max_per_group
         )
         if summary:
             summary_out = sys.stdout if output_format == "text" else sys.stderr
-            _print_summary(filtered, summary_out)
+            _print_summary(stats, summary_out)
 
-    _exit_if_errors(filtered)
+    if stats.has_errors:
+        raise SystemExit(1)
 
 
-def _auto_save_companion(results: list[ValidationResult], logfile: str) -> None:
-    """Write validation companion JSONL next to the logfile."""
+def _auto_save_companion(
+    results: Iterable[ValidationResult], logfile: str
+) -> Iterator[ValidationResult]:
+    """Pass through *results*, writing them to the validation companion JSONL
+    next to the logfile.  The companion is only created if there are any
+    results."""
     companion = validation_companion_path(logfile)
-    write_validation_jsonl(results, companion)
-    lgr.info("Validation companion saved to %s", companion)
-
-
-def _print_summary(results: list[ValidationResult], out: IO[str]) -> None:
+    writer: ValidationLogWriter | None = None
+    try:
+        with ExitStack() as stack:
+            for r in results:
+                if writer is None:
+                    writer = stack.enter_context(ValidationLogWriter(companion))
+                writer.write(r)
+                yield r
+    finally:
+        if writer is not None:
+            lgr.info("Validation companion saved to %s", companion)
+
+
+def _print_summary(stats: ValidationStats, out: IO[str]) -> None:
     """Print summary statistics about validation results."""
-    from collections import Counter
-
-    total = len(results)
     print("\n--- Validation Summary ---", file=out)
-    print(f"Total issues: {total}", file=out)
-    if not total:
+    print(f"Total issues: {stats.total}", file=out)
+    if not stats.total:
         return
 
-    severity_counts = Counter(
-        r.severity.name if r.severity is not None else "NONE" for r in results
-    )
     print("By severity:", file=out)
     for sev in ("CRITICAL", "ERROR", "WARNING", "HINT", "INFO"):
-        if sev in severity_counts:
-            print(f"  {sev}: {severity_counts[sev]}", file=out)
+        if sev in stats.by_severity:
+            print(f"  {sev}: {stats.by_severity[sev]}", file=out)
 
-    validator_counts = Counter(r.origin.validator.value for r in results)
-    if validator_counts:
+    if stats.by_validator:
         print("By validator:", file=out)
-        for validator, count in validator_counts.most_common():
+        for validator, count in stats.by_validator.most_common():
             print(f"  {validator}: {count}", file=out)
 
-    standard_counts = Counter(
-        r.origin.standard.value if r.origin.standard is not None else "N/A"
-        for r in results
-    )
-    if standard_counts:
+    if stats.by_standard:
         print("By standard:", file=out)
-        for standard, count in standard_counts.most_common():
+        for standard, count in stats.by_standard.most_common():
             print(f"  {standard}: {count}", file=out)
 
 
@@ -378,7 +445,7 @@ def _get_formatter(
 
 
 def _render(
-    results: list[ValidationResult],
+    results: Iterable[ValidationResult],
     output_format: str,
     out: IO[str],
     grouping: tuple[str, ...] = (),
@@ -387,11 +454,13 @@ def _render(
     """Render validation results in the given format.
 
     Handles both text and structured (JSON/JSONL/YAML) formats, with
-    optional grouping and truncation.
+    optional grouping and truncation.  Ungrouped results are rendered as they
+    arrive; grouped results are collected first.
     """
     is_text = output_format == "text"
 
     if grouping:
+        results = list(results)
         grouped: GroupedResults | TruncatedResults = _group_results(results, grouping)
         if max_per_group is not None:
             grouped = _truncate_leaves(grouped, max_per_group)
@@ -432,30 +501,22 @@ def _render(
                     f"Unsupported format for grouped output: {output_format}"
                 )
     else:
-        # Ungrouped: use formatter per-record
-        if is_text:
-            shown = results
-            omitted = 0
-            if max_per_group is not None and len(results) > max_per_group:
-                shown = results[:max_per_group]
-                omitted = len(results) - max_per_group
-            formatter = _get_formatter(output_format, out=out)
-            with formatter:
-                for r in shown:
+        # Ungrouped: use formatter per-record, as results arrive.  Results
+        # beyond max_per_group are still consumed in order to count them.
+        omitted = 0
+        formatter = _get_formatter(output_format, out=out)
+        with formatter:
+            for i, r in enumerate(results):
+                if max_per_group is not None and i >= max_per_group:
+                    omitted += 1
+                elif is_text:
                     formatter(r)
-            if omitted:
-                click.secho(f"... and {pluralize(omitted, 'more issue')}", fg="cyan")
-        else:
-            items: list[dict] = [r.model_dump(mode="json") for r in results]
-            if max_per_group is not None and len(items) > max_per_group:
-                items = items[:max_per_group]
-                items.append(
-                    {"_truncated": True, "omitted_count": len(results) - max_per_group}
-                )
-            formatter = _get_formatter(output_format, out=out)
-            with formatter:
-                for item in items:
-                    formatter(item)
+                else:
+                    formatter(r.model_dump(mode="json"))
+            if omitted and not is_text:
+                formatter({"_truncated": True, "omitted_count": omitted})
+        if omitted and is_text:
+            click.secho(f"... and {pluralize(omitted, 'more issue')}", fg="cyan")
 
 
 def _exit_if_errors(results: list[ValidationResult]) -> None:
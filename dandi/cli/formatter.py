@@ -54,7 +54,7 @@ class JSONFormatter(Formatter):
         s = json.dumps(
             rec, indent=self.indent, sort_keys=True, default=self._serializer
         )
-        print(indent(s, " " * (self.indent or 2)), end="", file=self.out)
+        print(indent(s, " " * (self.indent or 2)), end="", file=self.out, flush=True)
 
 
 class JSONLinesFormatter(Formatter):
@@ -74,21 +74,31 @@ class JSONLinesFormatter(Formatter):
                 rec, indent=self.indent, sort_keys=True, default=self._serializer
             ),
             file=self.out,
+            flush=True,
         )
 
 
 class YAMLFormatter(Formatter):
+    """
+    Render records as a YAML sequence, written out one item at a time as the
+    records are received
+    """
+
     def __init__(self, out=None):
         self.out = out or sys.stdout
-        self.records = []
+        self.yaml = ruamel.yaml.YAML(typ="safe")
+        self.yaml.default_flow_style = False
+        self.first = True
 
     def __exit__(self, exc_type, exc_value, traceback):
-        yaml = ruamel.yaml.YAML(typ="safe")
-        yaml.default_flow_style = False
-        yaml.dump(self.records, self.out)
+        if self.first:
+            self.yaml.dump([], self.out)
 
     def __call__(self, rec):
-        self.records.append(rec)
+        # Consecutive single-item sequences form a single sequence
+        self.yaml.dump([rec], self.out)
+        self.out.flush()
+        self.first = False
 
 
 class TextFormatter(Formatter):
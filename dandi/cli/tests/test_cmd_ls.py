@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import shutil
+import threading
 from typing import Any
 from unittest.mock import ANY
 
@@ -11,7 +13,7 @@ import pytest
 
 from dandi.tests.skip import mark
 
-from ..cmd_ls import ls
+from ..cmd_ls import _map_concurrently, ls
 from ...utils import yaml_load
 
 
@@ -159,3 +161,69 @@ def test_smoke_local_schema(simple1_nwb: Path) -> None:
     metadata = json.loads(out)
     assert len(metadata) == 1
     assert metadata[0]["digest"] == {"dandi:dandi-etag": ANY}
+
+
+def test_ls_recursive_parallel(simple1_nwb: Path, tmp_path: Path) -> None:
+    paths = []
+    for name in ["c.nwb", "a.nwb", "sub/b.nwb", "sub/d.nwb"]:
+        p = tmp_path / name
+        p.parent.mkdir(exist_ok=True)
+        shutil.copyfile(simple1_nwb, p)
+        paths.append(str(p))
+    runner = CliRunner()
+    r = runner.invoke(
+        ls,
+        ["-f", "json_lines", "-F", "path,size,nwb_version", "-J", "1", *paths],
+    )
+    assert r.exit_code == 0, r.output
+    sequential = [json.loads(ln) for ln in r.stdout.splitlines()]
+    assert [rec["path"] for rec in sequential] == paths
+    r = runner.invoke(
+        ls,
+        [
+            "-f",
+            "json_lines",
+            "-F",
+            "path,size,nwb_version",
+            "-J",
+            "3",
+            "--ordered",
+            *paths,
+        ],
+    )
+    assert r.exit_code == 0, r.output
+    assert [json.loads(ln) for ln in r.stdout.splitlines()] == sequential
+    r = runner.invoke(
+        ls,
+        ["-f", "yaml", "-F", "path,size,nwb_version", "-J", "3", "-r", str(tmp_path)],
+    )
+    assert r.exit_code == 0, r.output
+    data = yaml_load(r.stdout, "safe")
+    assert sorted(rec["path"] for rec in data if rec["path"].endswith(".nwb")) == (
+        sorted(paths)
+    )
+    assert all(rec["nwb_version"].startswith("2.") for rec in data if "size" in rec)
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_map_concurrently(ordered: bool) -> None:
+    # The first item is held up until a later item finishes (when ordered) or
+    # until a result has been yielded (when not)
+    release = threading.Event()
+
+    def func(i: int) -> int:
+        if i == 0:
+            assert release.wait(5)
+        elif i == 9 and ordered:
+            release.set()
+        return i * 2
+
+    results = []
+    for r in _map_concurrently(func, range(10), 4, ordered):
+        results.append(r)
+        release.set()
+    if ordered:
+        assert results == [i * 2 for i in range(10)]
+    else:
+        assert sorted(results) == [i * 2 for i in range(10)]
+        assert results[0] != 0
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from io import StringIO
 import json
 from pathlib import Path
 from typing import cast
@@ -9,8 +12,10 @@ import ruamel.yaml
 from ..cmd_validate import (
     GroupedResults,
     TruncationNotice,
+    ValidationStats,
     _group_results,
     _process_issues,
+    _render,
     _render_text,
     _truncate_leaves,
     validate,
@@ -58,6 +63,8 @@ def test_validate_bids_error(
     from dandi.tests.test_bids_validator_deno.test_validator import mock_bids_validate
 
     monkeypatch.setattr(bids, "bids_validate", mock_bids_validate)
+    # Analyses cached by other tests were made with the unmocked validator
+    monkeypatch.setattr(bids, "_analyses", OrderedDict())
 
     broken_dataset = bids_error_examples / ds_name
 
@@ -203,6 +210,18 @@ def test_validate_format_json_lines(simple2_nwb: Path) -> None:
         assert "record_version" in rec
 
 
+def test_validate_jobs_ordered(organized_nwb_dir4: Path) -> None:
+    args = ["-f", "json_lines", "--ordered", str(organized_nwb_dir4)]
+    serial = CliRunner().invoke(validate, args)
+    assert serial.exit_code == 0
+    paths = [json.loads(line)["path"] for line in serial.output.splitlines()]
+    assert paths
+    assert paths == sorted(paths)
+    parallel = CliRunner().invoke(validate, ["-J", "2", *args])
+    assert parallel.exit_code == 0
+    assert parallel.output == serial.output
+
+
 @pytest.mark.ai_generated
 def test_validate_format_yaml(simple2_nwb: Path) -> None:
     """Test --format yaml outputs valid YAML."""
@@ -785,6 +804,41 @@ def test_max_per_group_json_grouped(tmp_path: Path) -> None:
             assert len(truncated) >= 1
 
 
+@pytest.mark.parametrize("output_format", ["json_lines", "text"])
+def test_render_streams_ungrouped(output_format: str) -> None:
+    """Ungrouped results are rendered & counted as they arrive."""
+    origin = Origin(
+        type=OriginType.VALIDATION,
+        validator=Validator.nwbinspector,
+        validator_version="",
+    )
+    out = StringIO()
+    stats = ValidationStats()
+
+    def produce() -> Iterator[ValidationResult]:
+        for i in range(4):
+            # Everything produced so far has already been rendered & counted
+            assert out.getvalue().count("T.") == min(i, 2)
+            assert stats.total == i
+            yield ValidationResult(
+                id=f"T.{i}",
+                origin=origin,
+                scope=Scope.FILE,
+                severity=Severity.ERROR if i == 3 else Severity.WARNING,
+                message=f"msg{i}",
+                path=Path(f"file{i}.nwb"),
+            )
+
+    _render(stats.count(produce()), output_format, out, max_per_group=2)
+    assert stats.total == 4
+    assert stats.has_errors
+    assert stats.by_severity == {"WARNING": 3, "ERROR": 1}
+    if output_format == "json_lines":
+        lines = [json.loads(ln) for ln in out.getvalue().splitlines()]
+        assert [ln.get("id") for ln in lines[:2]] == ["T.0", "T.1"]
+        assert lines[2] == {"_truncated": True, "omitted_count": 2}
+
+
 @pytest.mark.ai_generated
 def test_truncate_leaves_unit() -> None:
     """Unit test for _truncate_leaves helper."""
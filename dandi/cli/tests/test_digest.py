@@ -1,3 +1,4 @@
+import json
 import os
 from pathlib import Path
 import subprocess
@@ -102,3 +103,22 @@ def test_digest_zarr_with_excluded_dotfiles():
         r = runner.invoke(digest, ["--digest", "zarr-checksum", "sample.zarr"])
         assert r.exit_code == 0
         assert r.output == f"sample.zarr: {expected}\n"
+
+
+def test_digest_directory_json_lines(tmp_path: Path) -> None:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_bytes(b"123")
+    (tmp_path / "sub" / "b.txt").write_bytes(b"123")
+    (tmp_path / ".hidden").write_bytes(b"123")
+    r = CliRunner().invoke(
+        digest, ["--digest", "md5", "--jobs", "2", "-f", "json_lines", str(tmp_path)]
+    )
+    assert r.exit_code == 0, r.output
+    records = sorted(
+        (json.loads(line) for line in r.output.splitlines()), key=lambda r: r["path"]
+    )
+    assert [(r["path"], r["algorithm"], r["digest"]) for r in records] == [
+        (str(tmp_path / "a.txt"), "md5", "202cb962ac59075b964b07152d234b70"),
+        (str(tmp_path / "sub" / "b.txt"), "md5", "202cb962ac59075b964b07152d234b70"),
+    ]
+    assert all(isinstance(r["cached"], bool) for r in records)
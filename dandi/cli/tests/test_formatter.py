@@ -2,7 +2,7 @@ from io import StringIO
 
 import pytest
 
-from ..formatter import JSONFormatter, JSONLinesFormatter
+from ..formatter import JSONFormatter, JSONLinesFormatter, YAMLFormatter
 
 
 def test_json_formatter():
@@ -65,3 +65,24 @@ def test_json_lines_formatter_empty():
     with fmtr:
         pass
     assert out.getvalue() == ""
+
+
+def test_yaml_formatter():
+    out = StringIO()
+    fmtr = YAMLFormatter(out=out)
+    with fmtr:
+        fmtr({"foo": 23, "bar": [1, 2]})
+        # Records are written out as they are received
+        assert out.getvalue() == "- bar:\n  - 1\n  - 2\n  foo: 23\n"
+        fmtr({"bar": "gnusto", "foo": "cleesh"})
+    assert out.getvalue() == (
+        "- bar:\n  - 1\n  - 2\n  foo: 23\n- bar: gnusto\n  foo: cleesh\n"
+    )
+
+
+def test_yaml_formatter_empty():
+    out = StringIO()
+    fmtr = YAMLFormatter(out=out)
+    with fmtr:
+        pass
+    assert out.getvalue() == "[]\n"
@@ -23,6 +23,7 @@ from ..cmd_move import move
                 "existing": "error",
                 "jobs": None,
                 "regex": False,
+                "resume": False,
                 "work_on": "auto",
                 "dandi_instance": "dandi",
                 "devel_debug": False,
@@ -38,6 +39,7 @@ from ..cmd_move import move
                 "existing": "error",
                 "jobs": None,
                 "regex": False,
+                "resume": False,
                 "work_on": "auto",
                 "dandi_instance": "dandi",
                 "devel_debug": False,
@@ -66,11 +68,28 @@ from ..cmd_move import move
                 "existing": "skip",
                 "jobs": 5,
                 "regex": True,
+                "resume": False,
                 "work_on": "remote",
                 "dandi_instance": "dandi-sandbox",
                 "devel_debug": False,
             },
         ),
+        (
+            ["--resume", "--jobs", "8"],
+            [],
+            {
+                "dest": "",
+                "dandiset": None,
+                "dry_run": False,
+                "existing": "error",
+                "jobs": 8,
+                "regex": False,
+                "resume": True,
+                "work_on": "auto",
+                "dandi_instance": "dandi",
+                "devel_debug": False,
+            },
+        ),
     ],
 )
 def test_move_command(
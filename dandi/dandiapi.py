@@ -15,6 +15,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -24,6 +25,7 @@ import os.path
 from pathlib import Path, PurePosixPath
 import posixpath
 import re
+import threading
 from time import sleep, time
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -146,6 +148,8 @@ class RESTFullAPIClient:
         self.page_size: int | None = None
         #: How many pages to fetch at once when parallelizing pagination
         self.page_workers: int = 5
+        #: Per-thread state; see `retry_hook()`
+        self._local = threading.local()
 
     def __enter__(self) -> Self:
         return self
@@ -158,6 +162,20 @@ class RESTFullAPIClient:
     ) -> None:
         self.session.close()
 
+    @contextmanager
+    def retry_hook(self, hook: Callable[[BaseException], Any]) -> Iterator[None]:
+        """
+        Within the context, call ``hook`` with the error of every failed
+        attempt at a request made by the current thread that `request()` is
+        about to retry
+        """
+        hooks = self._local.__dict__.setdefault("retry_hooks", [])
+        hooks.append(hook)
+        try:
+            yield
+        finally:
+            hooks.remove(hook)
+
     def request(
         self,
         method: str,
@@ -234,6 +252,13 @@ class RESTFullAPIClient:
             if data is not None and hasattr(data, "seek"):
                 data.seek(0)
 
+        def _before_retry(retry_state: tenacity.RetryCallState) -> None:
+            _rewind_data(retry_state)
+            assert retry_state.outcome is not None
+            if (exc := retry_state.outcome.exception()) is not None:
+                for hook in getattr(self._local, "retry_hooks", ()):
+                    hook(exc)
+
         try:
             for i, attempt in enumerate(
                 tenacity.Retrying(
@@ -247,7 +272,7 @@ class RESTFullAPIClient:
                     ),
                     stop=tenacity.stop_after_attempt(REQUEST_RETRIES),
                     reraise=True,
-                    before_sleep=_rewind_data,
+                    before_sleep=_before_retry,
                 )
             ):
                 with attempt:
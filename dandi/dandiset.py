@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os.path
 from pathlib import Path, PurePath, PurePosixPath
 from typing import TYPE_CHECKING
@@ -10,9 +10,23 @@ from typing import TYPE_CHECKING
 from dandischema.models import get_schema_version
 
 from . import get_logger
-from .consts import dandiset_metadata_file
-from .files import DandisetMetadataFile, LocalAsset, dandi_file, find_dandi_files
-from .utils import find_parent_directory_containing, under_paths, yaml_dump, yaml_load
+from .consts import ZARR_EXTENSIONS, dandiset_metadata_file
+from .files import (
+    BIDSDatasetDescriptionAsset,
+    DandisetMetadataFile,
+    LocalAsset,
+    dandi_file,
+    find_bids_dataset_description,
+    find_dandi_files,
+)
+from .files._private import is_empty_zarr
+from .utils import (
+    PathTrie,
+    find_parent_directory_containing,
+    split_relpath,
+    yaml_dump,
+    yaml_load,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -158,15 +172,7 @@ class Dandiset:
         return id_
 
     def assets(self, allow_all: bool = False) -> AssetView:
-        data = {}
-        for df in find_dandi_files(
-            self.path, dandiset_path=self.path, allow_all=allow_all
-        ):
-            if isinstance(df, DandisetMetadataFile):
-                continue
-            assert isinstance(df, LocalAsset)
-            data[PurePosixPath(df.path)] = df
-        return AssetView(data)
+        return AssetView(self.path_obj, allow_all=allow_all)
 
     def metadata_file(self) -> DandisetMetadataFile:
         df = dandi_file(self._metadata_file_obj, dandiset_path=self.path)
@@ -177,18 +183,91 @@ class Dandiset:
 @dataclass
 class AssetView:
     """
-    A collection of all assets in a local Dandiset, used to ensure that
+    A collection of the assets in a local Dandiset, used to ensure that
     `BIDSDatasetDescriptionAsset` objects are stored and remain alive while
     working with only a subset of the files in a Dandiset.
+
+    Assets are discovered lazily, one requested subtree at a time; a subtree
+    lying within a BIDS dataset is discovered together with the rest of that
+    dataset, so that all of its assets share one
+    `BIDSDatasetDescriptionAsset`.
     """
 
-    data: dict[PurePosixPath, LocalAsset]
+    dandiset_path: Path
+    allow_all: bool = False
+    #: Assets discovered so far, keyed by their paths within the Dandiset
+    _assets: PathTrie[LocalAsset] = field(
+        init=False, default_factory=PathTrie, repr=False
+    )
+    #: Paths (as tuples of path components) of the subtrees discovered so far
+    _scanned: set[tuple[str, ...]] = field(init=False, default_factory=set, repr=False)
+    #: All `BIDSDatasetDescriptionAsset` instances created for the Dandiset,
+    #: including ones whose subtrees were later rediscovered as part of
+    #: larger subtrees, as assets referring to them may still be in use
+    _bids_descriptions: list[BIDSDatasetDescriptionAsset] = field(
+        init=False, default_factory=list, repr=False
+    )
+
+    @property
+    def data(self) -> dict[PurePosixPath, LocalAsset]:
+        """All assets in the Dandiset, keyed by their paths within it"""
+        self._discover(())
+        return dict(self._assets.items_under(""))
 
     def __iter__(self) -> Iterator[LocalAsset]:
-        return iter(self.data.values())
+        return self.under_paths([""])
 
     def under_paths(self, paths: Iterable[str | PurePath]) -> Iterator[LocalAsset]:
         # The given paths must be relative to the Dandiset root and may not
         # contain '.' or '..'
-        for p in under_paths(self.data.keys(), paths):
-            yield self.data[p]
+        requested: list[tuple[str, ...]] = []
+        for parts in sorted(set(map(split_relpath, paths))):
+            if not requested or parts[: len(requested[-1])] != requested[-1]:
+                requested.append(parts)
+        for parts in requested:
+            self._discover(parts)
+            for _, asset in self._assets.items_under(PurePosixPath(*parts)):
+                yield asset
+
+    def _is_scanned(self, parts: tuple[str, ...]) -> bool:
+        return any(parts[:i] in self._scanned for i in range(len(parts) + 1))
+
+    def _discover(self, parts: tuple[str, ...]) -> None:
+        if self._is_scanned(parts):
+            return
+        filepath = self.dandiset_path.joinpath(*parts)
+        if not os.path.lexists(filepath):
+            return
+        # Skip paths that a walk from the root of the Dandiset would never
+        # reach
+        for i in range(1, len(parts)):
+            d = self.dandiset_path.joinpath(*parts[:i])
+            if (
+                parts[i - 1].startswith(".")
+                or d.is_symlink()
+                or (d.suffix in ZARR_EXTENSIONS and d.is_dir() and not is_empty_zarr(d))
+            ):
+                return
+        if parts:
+            bidsdd = find_bids_dataset_description(
+                filepath.parent, dandiset_path=self.dandiset_path
+            )
+            if bidsdd is not None:
+                # Discover the whole BIDS dataset
+                parts = bidsdd.bids_root.relative_to(self.dandiset_path).parts
+                if self._is_scanned(parts):
+                    return
+                filepath = bidsdd.bids_root
+        # Forget any previously-discovered subtrees within the new one
+        self._assets.prune(PurePosixPath(*parts))
+        self._scanned = {sc for sc in self._scanned if sc[: len(parts)] != parts}
+        for df in find_dandi_files(
+            filepath, dandiset_path=self.dandiset_path, allow_all=self.allow_all
+        ):
+            if isinstance(df, DandisetMetadataFile):
+                continue
+            assert isinstance(df, LocalAsset)
+            if isinstance(df, BIDSDatasetDescriptionAsset):
+                self._bids_descriptions.append(df)
+            self._assets[df.path] = df
+        self._scanned.add(parts)
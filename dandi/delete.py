@@ -6,25 +6,137 @@ from DANDI Archive instances. It supports:
 - Dandiset deletion with confirmation
 - URL-based and path-based deletion
 - Skip-missing option for non-existent resources
+- Concurrent deletion of many assets, deleting fewer at once when the
+  server is overloaded
 """
 
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from operator import attrgetter
 from pathlib import Path
+import threading
+from typing import Any
 
 import click
+import requests
 from yarl import URL
 
+from . import get_logger
 from .consts import DRAFT, ZARR_EXTENSIONS, DandiInstance, dandiset_metadata_file
 from .dandiapi import DandiAPIClient, RemoteAsset, RemoteDandiset
 from .dandiarchive import BaseAssetIDURL, DandisetURL, ParsedDandiURL, parse_dandi_url
 from .dandiset import Dandiset
-from .exceptions import NotFoundError
+from .exceptions import HTTP404Error, NotFoundError
 from .support import pyout as pyouts
-from .utils import get_instance, is_url
+from .utils import PathTrie, get_instance, is_url
+
+lgr = get_logger()
+
+#: The default maximum number of assets to delete concurrently
+DELETE_JOBS = 8
+
+#: HTTP statuses with which the server reports being overloaded
+OVERLOAD_STATUSES = (429, 503)
+
+#: The number of assets per page of an asset listing, used to estimate the
+#: number of requests needed to list all of a Dandiset's assets
+ASSET_PAGE_SIZE = 100
+
+
+class ConcurrencyLimit:
+    """
+    A limit on the number of requests in flight at once that adapts to the
+    server: it is halved whenever a request fails because the server is
+    overloaded, and it is raised by one after
+    as many requests in a row succeed as the limit, up to `maximum`.  Use
+    instances as context managers around each request.
+    """
+
+    def __init__(self, maximum: int) -> None:
+        #: The initial & highest limit
+        self.maximum = maximum
+        #: The current limit
+        self.limit = maximum
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    def __exit__(self, *_exc: Any) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def succeeded(self) -> None:
+        """Record that a request succeeded"""
+        with self._cond:
+            self._successes += 1
+            if self.limit < self.maximum and self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def throttle(self) -> None:
+        """Record that a request failed because of the server's load"""
+        with self._cond:
+            self.limit = max(self.limit // 2, 1)
+            self._successes = 0
+
+
+def delete_asset(asset: RemoteAsset, limit: ConcurrencyLimit) -> None:
+    """
+    Delete ``asset`` from the server within the given concurrency limit,
+    throttling the limit whenever the client retries a request that the
+    server rejected as overloaded
+    """
+    retried = False
+
+    def on_retry(e: BaseException) -> None:
+        nonlocal retried
+        retried = True
+        if (
+            isinstance(e, requests.HTTPError)
+            and e.response is not None
+            and e.response.status_code in OVERLOAD_STATUSES
+        ):
+            limit.throttle()
+
+    with limit:
+        try:
+            with asset.client.retry_hook(on_retry):
+                asset.delete()
+        except HTTP404Error:
+            if not retried:
+                raise
+            # An earlier attempt succeeded but its response was lost
+        limit.succeeded()
+
+
+def delete_assets(
+    assets: Iterable[RemoteAsset], jobs: int | None = None
+) -> Iterator[tuple[RemoteAsset, BaseException | None]]:
+    """
+    Delete the given assets from the server, up to ``jobs`` (default
+    `DELETE_JOBS`) at a time, and yield each asset along with the exception
+    that deleting it raised (or `None`) in the order in which the deletions
+    complete
+    """
+    limit = ConcurrencyLimit(jobs or DELETE_JOBS)
+    with ThreadPoolExecutor(max_workers=limit.maximum) as pool:
+        futures = {pool.submit(delete_asset, a, limit): a for a in assets}
+        try:
+            for fut in as_completed(futures):
+                yield (futures[fut], fut.exception())
+        finally:
+            for fut in futures:
+                fut.cancel()
 
 
 @dataclass
@@ -39,9 +151,22 @@ class Deleter:
     deleting_dandiset: bool = False
     skip_missing: bool = False
     remote_assets: list[RemoteAsset] = field(default_factory=list)
+    #: The maximum number of assets to look up or delete concurrently
+    jobs: int = DELETE_JOBS
+    #: Identifiers of the assets in `remote_assets`
+    _asset_ids: set[str] = field(init=False, default_factory=set, repr=False)
+    #: Asset paths & folder paths (the latter ending in a slash) registered
+    #: for deletion that have yet to be looked up
+    _unresolved: list[str] = field(init=False, default_factory=list, repr=False)
+    _limit: ConcurrencyLimit = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._limit = ConcurrencyLimit(self.jobs)
 
     def __bool__(self) -> bool:
-        return self.deleting_dandiset or bool(self.remote_assets)
+        return (
+            self.deleting_dandiset or bool(self.remote_assets) or bool(self._unresolved)
+        )
 
     def set_dandiset(self, instance: DandiInstance, dandiset_id: str) -> bool:
         """
@@ -68,7 +193,8 @@ class Deleter:
     def add_asset(self, asset: RemoteAsset) -> None:
         # Ensure the list is free of duplicates so that we don't try to delete
         # the same asset twice
-        if not any(a.identifier == asset.identifier for a in self.remote_assets):
+        if asset.identifier not in self._asset_ids:
+            self._asset_ids.add(asset.identifier)
             self.remote_assets.append(asset)
 
     def register_dandiset(self, instance: DandiInstance, dandiset_id: str) -> None:
@@ -85,17 +211,8 @@ class Deleter:
     ) -> None:
         if not self.set_dandiset(instance, dandiset_id):
             return
-        assert self.dandiset is not None
-        try:
-            asset = self.dandiset.get_asset_by_path(asset_path)
-        except NotFoundError:
-            if self.skip_missing:
-                return
-            else:
-                raise NotFoundError(
-                    f"Asset at path {asset_path!r} not found in Dandiset {dandiset_id}"
-                )
-        self.add_asset(asset)
+        # Looked up by resolve()
+        self._unresolved.append(asset_path.rstrip("/"))
 
     def register_asset_folder(
         self,
@@ -106,15 +223,70 @@ class Deleter:
     ) -> None:
         if not self.set_dandiset(instance, dandiset_id):
             return
-        any_assets = False
+        # Looked up by resolve()
+        self._unresolved.append(folder_path.rstrip("/") + "/")
+
+    def resolve(self) -> None:
+        """
+        Look up the assets at the paths registered with `register_asset()` and
+        under the folders registered with `register_asset_folder()`.  If there
+        are more paths than it would take requests to list all of the
+        Dandiset's assets, the assets are listed once and the paths are looked
+        up in the listing; otherwise, the paths are looked up concurrently.
+        """
+        if not self._unresolved:
+            return
         assert self.dandiset is not None
-        for asset in self.dandiset.get_assets_with_path_prefix(folder_path):
-            self.add_asset(asset)
-            any_assets = True
-        if not any_assets and not self.skip_missing:
-            raise NotFoundError(
-                f"No assets under path {folder_path!r} found in Dandiset {dandiset_id}"
+        paths, self._unresolved = self._unresolved, []
+        pages = -(-self.dandiset.version.asset_count // ASSET_PAGE_SIZE)
+        found: Iterable[list[RemoteAsset]]
+        if len(paths) > pages:
+            lgr.debug(
+                "Listing assets of Dandiset %s to look up %d paths",
+                self.dandiset.identifier,
+                len(paths),
+            )
+            index: PathTrie[RemoteAsset] = PathTrie()
+            for asset in self.dandiset.get_assets():
+                index[asset.path.strip("/")] = asset
+            found = (
+                (
+                    [a for _, a in index.items_under(p)]
+                    if p.endswith("/")
+                    else [a for a in [index.get(p)] if a is not None]
+                )
+                for p in paths
             )
+            self._add_found(paths, found)
+        else:
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                self._add_found(paths, pool.map(self._lookup, paths))
+
+    def _lookup(self, path: str) -> list[RemoteAsset]:
+        assert self.dandiset is not None
+        if path.endswith("/"):
+            return list(self.dandiset.get_assets_with_path_prefix(path))
+        try:
+            return [self.dandiset.get_asset_by_path(path)]
+        except NotFoundError:
+            return []
+
+    def _add_found(self, paths: list[str], found: Iterable[list[RemoteAsset]]) -> None:
+        assert self.dandiset is not None
+        for path, assets in zip(paths, found):
+            if not assets and not self.skip_missing:
+                if path.endswith("/"):
+                    raise NotFoundError(
+                        f"No assets under path {path!r} found in Dandiset"
+                        f" {self.dandiset.identifier}"
+                    )
+                else:
+                    raise NotFoundError(
+                        f"Asset at path {path!r} not found in Dandiset"
+                        f" {self.dandiset.identifier}"
+                    )
+            for asset in assets:
+                self.add_asset(asset)
 
     def register_assets_url(self, url: str, parsed_url: ParsedDandiURL) -> None:
         if isinstance(parsed_url, BaseAssetIDURL):
@@ -161,6 +333,7 @@ class Deleter:
     def confirm(self) -> bool:
         if self.dandiset is None:
             raise ValueError("confirm() called before registering anything to delete")
+        self.resolve()
         if self.deleting_dandiset:
             msg = f"Delete Dandiset {self.dandiset.identifier}?"
         else:
@@ -182,13 +355,14 @@ class Deleter:
     def _process_asset(self, asset: RemoteAsset) -> Iterator[dict]:
         yield {"status": "Deleting"}
         try:
-            asset.delete()
+            delete_asset(asset, self._limit)
         except Exception as e:
             yield {"status": "Error", "message": f"{type(e).__name__}: {e}"}
         else:
             yield {"status": "Deleted"}
 
     def process_assets_pyout(self) -> Iterator[dict]:
+        self.resolve()
         for asset in sorted(self.remote_assets, key=attrgetter("path")):
             yield {
                 "path": asset.path,
@@ -196,6 +370,7 @@ class Deleter:
             }
 
     def process_assets_debug(self) -> Iterator[Iterator[dict]]:
+        self.resolve()
         for asset in sorted(self.remote_assets, key=attrgetter("path")):
             yield ({"path": asset.path, **d} for d in self._process_asset(asset))
 
@@ -213,12 +388,13 @@ def delete(
     PATH could be a local path or a URL to an asset, directory, or an entire
     dandiset.
     """
-    deleter = Deleter(skip_missing=skip_missing)
+    deleter = Deleter(skip_missing=skip_missing, jobs=jobs or DELETE_JOBS)
     for p in paths:
         if is_url(p):
             deleter.register_url(p)
         else:
             deleter.register_local_path_equivalent(dandi_instance, p)
+    deleter.resolve()
     if deleter and (force or deleter.confirm()):
         if deleter.deleting_dandiset:
             deleter.delete_dandiset()
@@ -229,8 +405,9 @@ def delete(
         else:
             pyout_style = pyouts.get_style(hide_if_missing=False)
             rec_fields = ("path", "status", "message")
+            # Deletions are further limited by the Deleter's ConcurrencyLimit
             out = pyouts.LogSafeTabular(
-                style=pyout_style, columns=rec_fields, max_workers=jobs
+                style=pyout_style, columns=rec_fields, max_workers=deleter.jobs
             )
             with out:
                 for r in deleter.process_assets_pyout():
@@ -639,7 +639,7 @@ def _download_file(
       will be used to verify download
     """
     # Avoid heavy import by importing within function:
-    from .support.digests import get_digest
+    from .support.digests import get_digest, rank_digests
 
     if op.lexists(path):
         annex_path = op.join(toplevel_path, ".git", "annex")
@@ -675,16 +675,8 @@ def _download_file(
                     )
             elif (
                 digests is not None
-                and "dandi-etag" in digests
-                and get_digest(path, "dandi-etag") == digests["dandi-etag"]
-            ):
-                yield _skip_file("already exists")
-                return
-            elif (
-                digests is not None
-                and "dandi-etag" not in digests
-                and "md5" in digests
-                and get_digest(path, "md5") == digests["md5"]
+                and (local_algo := _choose_local_digest(path, digests)) is not None
+                and get_digest(path, local_algo) == digests[local_algo]
             ):
                 yield _skip_file("already exists")
                 return
@@ -734,9 +726,9 @@ def _download_file(
     digest: str | None = None
     downloaded_digest: Hasher | None = None
     if digests:
-        # choose first available for now.
-        # TODO: reuse that sorting based on speed
-        for algo, digest in digests.items():
+        # choose the fastest one to compute on this host
+        for algo in rank_digests(digests):
+            digest = digests[algo]
             if algo == "dandi-etag" and size is not None:
                 # Instantiate outside the lambda so that mypy is assured that
                 # `size` is not None:
@@ -864,6 +856,26 @@ def _download_file(
     yield {"status": "done"}
 
 
+def _choose_local_digest(path: Path, digests: dict[str, str]) -> str | None:
+    """
+    Of the digests provided by the server, return the name of the one to
+    compare against the local file at ``path``: the dandi-etag if it is
+    already cached for the file, otherwise the one fastest to compute, or
+    `None` if none can be computed
+    """
+    # Avoid heavy import by importing within function:
+    from .support.digests import SPEED_RANKED_DIGESTS, is_digest_cached, rank_digests
+
+    if not digests:
+        return None
+    if "dandi-etag" in digests and is_digest_cached(path, "dandi-etag"):
+        return "dandi-etag"
+    for algo in rank_digests(digests):
+        if algo in SPEED_RANKED_DIGESTS:
+            return algo
+    return None
+
+
 class DownloadDirectory:
     def __init__(self, filepath: str | Path, digests: dict[str, str]) -> None:
         #: The path to which to save the file after downloading
@@ -13,13 +13,16 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Iterator
-import os.path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import os
 from pathlib import Path
+from typing import NamedTuple
 
 from dandi import get_logger
 from dandi.consts import (
     BIDS_DATASET_DESCRIPTION,
     BIDS_IGNORE_FILE,
+    ZARR_EXTENSIONS,
     dandiset_metadata_file,
 )
 from dandi.exceptions import UnknownAssetError
@@ -42,7 +45,7 @@ from .bids import (
     NWBBIDSAsset,
     ZarrBIDSAsset,
 )
-from .zarr import LocalZarrEntry, ZarrAsset, ZarrStat
+from .zarr import LocalZarrEntry, ZarrAsset, ZarrSnapshot, ZarrStat
 
 __all__ = [
     "BIDSAsset",
@@ -60,6 +63,7 @@ __all__ = [
     "VideoAsset",
     "ZarrAsset",
     "ZarrBIDSAsset",
+    "ZarrSnapshot",
     "ZarrStat",
     "dandi_file",
     "find_dandi_files",
@@ -69,11 +73,37 @@ __all__ = [
 lgr = get_logger()
 
 
+class _PathInfo(NamedTuple):
+    """
+    A path plus the results of the filesystem queries about it that
+    `find_dandi_files()` needs, as obtained from an `os.DirEntry` where
+    possible
+    """
+
+    path: Path
+    is_dir: bool
+    is_file: bool
+    is_symlink: bool
+
+    @classmethod
+    def from_path(cls, p: Path) -> _PathInfo:
+        return cls(p, p.is_dir(), p.is_file(), p.is_symlink())
+
+
+def _scan_dir(dirpath: Path) -> list[_PathInfo]:
+    with os.scandir(dirpath) as entries:
+        return [
+            _PathInfo(Path(e.path), e.is_dir(), e.is_file(), e.is_symlink())
+            for e in entries
+        ]
+
+
 def find_dandi_files(
     *paths: str | Path,
     dandiset_path: str | Path | None = None,
     allow_all: bool = False,
     include_metadata: bool = False,
+    jobs: int | None = None,
 ) -> Iterator[DandiFile]:
     """
     Yield all DANDI files at or under the paths in ``paths`` (which may be
@@ -82,6 +112,10 @@ def find_dandi_files(
     they are of a type represented by a `LocalDirectoryAsset` subclass, in
     which case they are not recursed into.
 
+    Directories are listed in parallel, and files are yielded as soon as the
+    listings of their parent directories are available, so the order of the
+    results is unspecified.
+
     :param dandiset_path:
         The path to the root of the Dandiset in which the paths are located.
         All paths in ``paths`` must be equal to or subpaths of
@@ -95,12 +129,15 @@ def find_dandi_files(
         If true, the Dandiset's :file:`dandiset.yaml` file is returned as a
         `DandisetMetadataFile` instance.  If false, it is not returned at all
         (unless ``allow_all`` is true).
+    :param jobs:
+        Maximum number of directories to list in parallel; defaults to the
+        `~concurrent.futures.ThreadPoolExecutor` default
     """
 
     # A pair of each file or directory being considered plus the most recent
     # BIDS dataset_description.json file at the path (if a directory) or in a
     # parent path
-    path_queue: deque[tuple[Path, BIDSDatasetDescriptionAsset | None]] = deque()
+    path_queue: deque[tuple[_PathInfo, BIDSDatasetDescriptionAsset | None]] = deque()
     for p in map(Path, paths):
         if dandiset_path is not None:
             try:
@@ -109,54 +146,80 @@ def find_dandi_files(
                 raise ValueError(
                     f"Path {str(p)!r} is not inside Dandiset path {str(dandiset_path)!r}"
                 )
-        path_queue.append((Path(p), None))
-    bids_roots = []
-    while path_queue:
-        p, bidsdd = path_queue.popleft()
-        if p.name.startswith("."):
-            # Allow .bidsignore files within BIDS datasets to be uploaded
-            if not (p.name == BIDS_IGNORE_FILE and bidsdd is not None):
-                continue
-        if p.is_dir():
-            if p.is_symlink():
-                lgr.warning("%s: Ignoring unsupported symbolic link to directory", p)
-            elif dandiset_path is not None and p == Path(dandiset_path):
-                if os.path.lexists(p / BIDS_DATASET_DESCRIPTION):
-                    bids = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
-                    assert isinstance(bids, BIDSDatasetDescriptionAsset)
-                    bidsdd = bids
-                    bids_roots.append(p)
-                path_queue.extend((q, bidsdd) for q in p.iterdir())
-            elif any(p.iterdir()):
-                try:
-                    df = dandi_file(p, dandiset_path, bids_dataset_description=bidsdd)
-                except UnknownAssetError:
-                    # The directory does not have a recognized file extension
-                    # (ie., it's not a Zarr or any other directory asset type
-                    # we may add later), so traverse through it as a regular
-                    # directory.
-                    if os.path.lexists(p / BIDS_DATASET_DESCRIPTION) and not any(
-                        i in p.parents for i in bids_roots
+        path_queue.append((_PathInfo.from_path(p), None))
+    root = Path(dandiset_path) if dandiset_path is not None else None
+    # Pending directory listings, mapped to the directory being listed and the
+    # BIDS dataset_description.json file in effect for it
+    listings: dict[
+        Future[list[_PathInfo]], tuple[Path, BIDSDatasetDescriptionAsset | None]
+    ] = {}
+    bids_roots: list[Path] = []
+    executor = ThreadPoolExecutor(
+        max_workers=jobs, thread_name_prefix="find_dandi_files"
+    )
+    try:
+        while path_queue or listings:
+            if not path_queue:
+                done, _ = wait(listings, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    p, bidsdd = listings.pop(fut)
+                    entries = fut.result()
+                    if not entries:
+                        continue
+                    has_bidsdd = any(
+                        e.path.name == BIDS_DATASET_DESCRIPTION for e in entries
+                    )
+                    if has_bidsdd and (
+                        p == root or not any(i in p.parents for i in bids_roots)
                     ):  # No nested BIDS
-                        bids2 = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
-                        assert isinstance(bids2, BIDSDatasetDescriptionAsset)
-                        bidsdd = bids2
+                        bids = dandi_file(p / BIDS_DATASET_DESCRIPTION, dandiset_path)
+                        assert isinstance(bids, BIDSDatasetDescriptionAsset)
+                        bidsdd = bids
                         bids_roots.append(p)
-                    path_queue.extend((q, bidsdd) for q in p.iterdir())
+                    path_queue.extend((e, bidsdd) for e in entries)
+                continue
+            info, bidsdd = path_queue.popleft()
+            p = info.path
+            if p.name.startswith("."):
+                # Allow .bidsignore files within BIDS datasets to be uploaded
+                if not (p.name == BIDS_IGNORE_FILE and bidsdd is not None):
+                    continue
+            if info.is_dir:
+                if info.is_symlink:
+                    lgr.warning(
+                        "%s: Ignoring unsupported symbolic link to directory", p
+                    )
+                    continue
+                if p != root and p.suffix in ZARR_EXTENSIONS:
+                    try:
+                        df = _dandi_file(
+                            p, dandiset_path, bidsdd, is_dir=True, is_file=False
+                        )
+                    except UnknownAssetError:
+                        # The directory is not a valid Zarr (e.g., it contains
+                        # no files), so traverse through it as a regular
+                        # directory.
+                        pass
+                    else:
+                        yield df
+                        continue
+                listings[executor.submit(_scan_dir, p)] = (p, bidsdd)
+            else:
+                df = _dandi_file(
+                    p, dandiset_path, bidsdd, is_dir=False, is_file=info.is_file
+                )
+                # Don't use isinstance() here, as GenericBIDSAsset's should
+                # still be returned
+                if type(df) is GenericAsset and not allow_all:
+                    pass
+                elif isinstance(df, DandisetMetadataFile) and not (
+                    allow_all or include_metadata
+                ):
+                    pass
                 else:
                     yield df
-        else:
-            df = dandi_file(p, dandiset_path, bids_dataset_description=bidsdd)
-            # Don't use isinstance() here, as GenericBIDSAsset's should still
-            # be returned
-            if type(df) is GenericAsset and not allow_all:
-                pass
-            elif isinstance(df, DandisetMetadataFile) and not (
-                allow_all or include_metadata
-            ):
-                pass
-            else:
-                yield df
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def dandi_file(
@@ -184,7 +247,17 @@ def dandi_file(
     A regular file that is not of a known type will be represented by a
     `GenericAsset` instance.
     """
-    filepath = Path(filepath)
+    return _dandi_file(Path(filepath), dandiset_path, bids_dataset_description)
+
+
+def _dandi_file(
+    filepath: Path,
+    dandiset_path: str | Path | None,
+    bids_dataset_description: BIDSDatasetDescriptionAsset | None,
+    is_dir: bool | None = None,
+    is_file: bool | None = None,
+) -> DandiFile:
+    # `is_dir` and `is_file`, if known, spare us from stat'ing the path again
     if dandiset_path is not None:
         dandiset_path = Path(dandiset_path)
         path = filepath.relative_to(dandiset_path).as_posix()
@@ -192,13 +265,15 @@ def dandi_file(
             raise ValueError("DANDI file path cannot equal Dandiset path")
     else:
         path = filepath.name
-    if filepath.is_file() and path == dandiset_metadata_file:
+    if path == dandiset_metadata_file and (
+        filepath.is_file() if is_file is None else is_file
+    ):
         return DandisetMetadataFile(filepath=filepath, dandiset_path=dandiset_path)
     if bids_dataset_description is None:
         factory = DandiFileFactory()
     else:
         factory = BIDSFileFactory(bids_dataset_description)
-    return factory(filepath, path, dandiset_path)
+    return factory(filepath, path, dandiset_path, is_dir)
 
 
 def find_bids_dataset_description(
@@ -14,7 +14,14 @@ from dandi.consts import (
 )
 from dandi.exceptions import UnknownAssetError
 
-from .bases import DandiFile, GenericAsset, LocalAsset, NWBAsset, VideoAsset
+from .bases import (
+    DandiFile,
+    GenericAsset,
+    LocalAsset,
+    LocalDirectoryAsset,
+    NWBAsset,
+    VideoAsset,
+)
 from .bids import (
     BIDSAsset,
     BIDSDatasetDescriptionAsset,
@@ -35,8 +42,15 @@ class DandiFileType(Enum):
     BIDS_DATASET_DESCRIPTION = 5
 
     @staticmethod
-    def classify(path: Path) -> DandiFileType:
-        if path.is_dir():
+    def classify(path: Path, is_dir: bool | None = None) -> DandiFileType:
+        """
+        Determine the type of the file or directory at ``path``.  If
+        ``is_dir`` is given (e.g., from an `os.DirEntry`), it is used instead
+        of querying the filesystem again.
+        """
+        if is_dir is None:
+            is_dir = path.is_dir()
+        if is_dir:
             if path.suffix in ZARR_EXTENSIONS:
                 if is_empty_zarr(path):
                     raise UnknownAssetError("Empty directories cannot be Zarr assets")
@@ -66,9 +80,13 @@ class DandiFileFactory:
     }
 
     def __call__(
-        self, filepath: Path, path: str, dandiset_path: Path | None
+        self,
+        filepath: Path,
+        path: str,
+        dandiset_path: Path | None,
+        is_dir: bool | None = None,
     ) -> DandiFile:
-        return self.CLASSES[DandiFileType.classify(filepath)](
+        return self.CLASSES[DandiFileType.classify(filepath, is_dir)](
             filepath=filepath, path=path, dandiset_path=dandiset_path
         )
 
@@ -87,9 +105,13 @@ class BIDSFileFactory(DandiFileFactory):
     }
 
     def __call__(
-        self, filepath: Path, path: str, dandiset_path: Path | None
+        self,
+        filepath: Path,
+        path: str,
+        dandiset_path: Path | None,
+        is_dir: bool | None = None,
     ) -> DandiFile:
-        ftype = DandiFileType.classify(filepath)
+        ftype = DandiFileType.classify(filepath, is_dir)
         if ftype is DandiFileType.BIDS_DATASET_DESCRIPTION:
             if filepath == self.bids_dataset_description.filepath:
                 return self.bids_dataset_description
@@ -108,4 +130,6 @@ class BIDSFileFactory(DandiFileFactory):
 def is_empty_zarr(path: Path) -> bool:
     """:meta private:"""
     zf = ZarrAsset(filepath=path, path=path.name, dandiset_path=None)
-    return not any(zf.iterfiles())
+    # Walk the tree lazily rather than taking a full snapshot, as we can stop
+    # at the first file found
+    return not any(LocalDirectoryAsset.iterfiles(zf))
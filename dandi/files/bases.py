@@ -2,15 +2,19 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cache, wraps
+from importlib.metadata import version as get_dist_version
 import os
 from pathlib import Path
 import re
 from threading import Lock
-from typing import IO, Any, Generic
+from typing import IO, TYPE_CHECKING, Any, Generic, TypeVar
 from xml.etree.ElementTree import fromstring
 
 import dandischema
@@ -47,11 +51,130 @@ from dandi.validate._types import (
     Validator,
 )
 
+if TYPE_CHECKING:
+    from nwbinspector import InspectorMessage
+
+    from dandi.pynwb_utils import NWBFileSession
+
 lgr = dandi.get_logger()
 
 # TODO -- should come from schema.  This is just a simplistic example for now
 _required_dandiset_metadata_fields = ["identifier", "name", "description"]
 
+_validation_cache_enabled: ContextVar[bool] = ContextVar(
+    "_validation_cache_enabled", default=True
+)
+
+
+@contextmanager
+def validation_cache_disabled() -> Iterator[None]:
+    """
+    Within this context, `DandiFile.get_validation_errors()` (and BIDS dataset
+    validation) neither consults nor updates the persistent cache of
+    validation results
+    """
+    token = _validation_cache_enabled.set(False)
+    try:
+        yield
+    finally:
+        _validation_cache_enabled.reset(token)
+
+
+def validation_cache_enabled() -> bool:
+    """
+    Whether validation results may currently be retrieved from & stored in the
+    persistent cache; see `validation_cache_disabled()`
+    """
+    return _validation_cache_enabled.get()
+
+
+ValidationMethod = TypeVar("ValidationMethod", bound=Callable[..., Any])
+
+
+def _memoize_validation_errors(method: ValidationMethod) -> ValidationMethod:
+    """
+    Cache the return values of a ``get_validation_errors()`` method in
+    `dandi.pynwb_utils.validate_cache`, keyed by the content fingerprint &
+    paths of the file, the method arguments, and the versions of the
+    validators.  Files that cannot be fingerprinted (e.g., directories or
+    broken symlinks) and calls with ``devel_debug`` (which should raise rather
+    than report errors) bypass the cache.
+    """
+
+    @wraps(method)
+    def wrapper(
+        self: DandiFile,
+        schema_version: str | None = None,
+        devel_debug: bool = False,
+        missing_file_content: MissingFileContent | None = None,
+    ) -> list[ValidationResult]:
+        # Avoid heavy import by importing within function:
+        from dandi.support.digests import get_file_fingerprint
+
+        if not devel_debug and validation_cache_enabled():
+            try:
+                fprint = get_file_fingerprint(self.filepath)
+            except OSError:
+                fprint = None
+            if fprint is not None and not fprint.modified_recently():
+                key = (
+                    f"{type(self).__module__}.{type(self).__qualname__}",
+                    method.__qualname__,
+                    str(self.filepath),
+                    getattr(self, "path", None),
+                    str(self.dandiset_path),
+                )
+                dumped = _get_cached_validation_errors()(
+                    fprint,
+                    key,
+                    _validation_cache_tokens(),
+                    schema_version,
+                    missing_file_content,
+                    df=self,
+                    method=method,
+                )
+                return [ValidationResult.model_validate_json(s) for s in dumped]
+        results: list[ValidationResult] = method(
+            self, schema_version, devel_debug, missing_file_content
+        )
+        return results
+
+    return wrapper  # type: ignore[return-value]
+
+
+@cache
+def _validation_cache_tokens() -> tuple[str, ...]:
+    # Avoid heavy import by importing within function:
+    from dandi.pynwb_utils import validate_cache_tokens
+
+    return tuple(validate_cache_tokens) + (get_dist_version("nwbinspector"),)
+
+
+@cache
+def _get_cached_validation_errors() -> Callable[..., list[str]]:
+    # Avoid heavy import by importing within function:
+    from dandi.pynwb_utils import validate_cache
+
+    return validate_cache.memoize(  # type: ignore[no-any-return]
+        _dump_validation_errors, exclude_kwargs=["df", "method"]
+    )
+
+
+def _dump_validation_errors(
+    fingerprint: Any,
+    key: tuple,
+    tokens: tuple[str, ...],
+    schema_version: str | None,
+    missing_file_content: MissingFileContent | None,
+    df: DandiFile,
+    method: Callable[..., list[ValidationResult]],
+) -> list[str]:
+    lgr.debug("No cached validation results for fingerprint of %s", df.filepath)
+    return [
+        r.model_dump_json()
+        for r in method(df, schema_version, False, missing_file_content)
+    ]
+
 
 NWBI_IMPORTANCE_TO_DANDI_SEVERITY: dict[str, Severity] = {
     "ERROR": Severity.ERROR,
@@ -126,7 +249,7 @@ class DandisetMetadataFile(DandiFile):
             meta = yaml_load(f, typ="safe")
         return DandisetMeta.model_construct(**meta)
 
-    # TODO: @validate_cache.memoize_path
+    @_memoize_validation_errors
     def get_validation_errors(
         self,
         schema_version: str | None = None,
@@ -196,7 +319,7 @@ class LocalAsset(DandiFile):
         """Return the DANDI metadata for the asset"""
         ...
 
-    # TODO: @validate_cache.memoize_path
+    @_memoize_validation_errors
     def get_validation_errors(
         self,
         schema_version: str | None = None,
@@ -530,7 +653,7 @@ class NWBAsset(LocalFileAsset):
         metadata.path = self.path
         return metadata
 
-    # TODO: @validate_cache.memoize_path
+    @_memoize_validation_errors
     def get_validation_errors(
         self,
         schema_version: str | None = None,
@@ -555,62 +678,65 @@ class NWBAsset(LocalFileAsset):
             pass
         else:
             # Avoid heavy import by importing within function:
-            from nwbinspector import Importance, inspect_nwbfile, load_config
+            from nwbinspector import Importance, load_config
 
             # Avoid heavy import by importing within function:
+            from dandi.pynwb_utils import nwb_file_session
             from dandi.pynwb_utils import validate as pynwb_validate
 
-            errors.extend(pynwb_validate(self.filepath, devel_debug=devel_debug))
-            if schema_version is not None:
-                errors.extend(
-                    super().get_validation_errors(
-                        schema_version=schema_version, devel_debug=devel_debug
-                    )
-                )
-            else:
-                # make sure that we have some basic metadata fields we require
-                try:
-                    origin_validation_nwbinspector = Origin(
-                        type=OriginType.VALIDATION,
-                        validator=Validator.nwbinspector,
-                        validator_version=str(_get_nwb_inspector_version()),
+            # Open the file only once for both pynwb and nwbinspector
+            with nwb_file_session(self.filepath) as session:
+                errors.extend(pynwb_validate(self.filepath, devel_debug=devel_debug))
+                if schema_version is not None:
+                    errors.extend(
+                        super().get_validation_errors(
+                            schema_version=schema_version, devel_debug=devel_debug
+                        )
                     )
+                else:
+                    # make sure that we have some basic metadata fields we require
+                    try:
+                        origin_validation_nwbinspector = Origin(
+                            type=OriginType.VALIDATION,
+                            validator=Validator.nwbinspector,
+                            validator_version=str(_get_nwb_inspector_version()),
+                        )
 
-                    for error in inspect_nwbfile(
-                        nwbfile_path=self.filepath,
-                        skip_validate=True,
-                        config=load_config(filepath_or_keyword="dandi"),
-                        importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
-                    ):
-                        severity = NWBI_IMPORTANCE_TO_DANDI_SEVERITY[
-                            error.importance.name
-                        ]
-                        kw: Any = {}
-                        if error.location:
-                            kw["within_asset_paths"] = {
-                                error.file_path: error.location,
-                            }
-                        errors.append(
-                            ValidationResult(
-                                origin=origin_validation_nwbinspector,
-                                severity=severity,
-                                id=f"NWBI.{error.check_function_name}",
-                                scope=Scope.FILE,
-                                origin_result=error,
-                                path=Path(error.file_path),
-                                message=error.message,
-                                dataset_path=Path(error.file_path).parent.parent,
-                                dandiset_path=Path(error.file_path).parent,
-                                **kw,
+                        for error in _inspect_nwb_session(
+                            session,
+                            self.filepath,
+                            config=load_config(filepath_or_keyword="dandi"),
+                            importance_threshold=Importance.BEST_PRACTICE_VIOLATION,
+                        ):
+                            severity = NWBI_IMPORTANCE_TO_DANDI_SEVERITY[
+                                error.importance.name
+                            ]
+                            kw: Any = {}
+                            if error.location:
+                                kw["within_asset_paths"] = {
+                                    error.file_path: error.location,
+                                }
+                            errors.append(
+                                ValidationResult(
+                                    origin=origin_validation_nwbinspector,
+                                    severity=severity,
+                                    id=f"NWBI.{error.check_function_name}",
+                                    scope=Scope.FILE,
+                                    origin_result=error,
+                                    path=Path(error.file_path),
+                                    message=error.message,
+                                    dataset_path=Path(error.file_path).parent.parent,
+                                    dandiset_path=Path(error.file_path).parent,
+                                    **kw,
+                                )
                             )
+                    except Exception as e:
+                        if devel_debug:
+                            raise
+                        # TODO: might reraise instead of making it into an error
+                        return _pydantic_errors_to_validation_results(
+                            [e], self.filepath, scope=Scope.FILE
                         )
-                except Exception as e:
-                    if devel_debug:
-                        raise
-                    # TODO: might reraise instead of making it into an error
-                    return _pydantic_errors_to_validation_results(
-                        [e], self.filepath, scope=Scope.FILE
-                    )
 
         # Avoid circular imports by importing within function:
         from .bids import NWBBIDSAsset
@@ -798,6 +924,27 @@ def _get_nwb_inspector_version():
     return _current_nwbinspector_version
 
 
+def _inspect_nwb_session(
+    session: NWBFileSession, filepath: Path, **kwargs: Any
+) -> Iterator[InspectorMessage]:
+    """
+    Run nwbinspector on the `~pynwb.NWBFile` already read by ``session``
+    rather than having it open & read the file again
+    """
+    # Avoid heavy import by importing within function:
+    from nwbinspector import inspect_nwbfile, inspect_nwbfile_object
+
+    try:
+        nwbfile = session.nwbfile
+    except Exception:
+        # Let nwbinspector itself report the failure to read the file
+        yield from inspect_nwbfile(nwbfile_path=filepath, skip_validate=True, **kwargs)
+        return
+    for message in inspect_nwbfile_object(nwbfile_object=nwbfile, **kwargs):
+        message.file_path = str(filepath)
+        yield message
+
+
 def _pydantic_errors_to_validation_results(
     errors: list[dict | Exception] | ValidationError,
     file_path: Path,
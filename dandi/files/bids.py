@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
+from importlib.metadata import version as get_dist_version
 from pathlib import Path
 from threading import Lock
+from typing import Any
 import weakref
 
 from dandischema.models import BareAsset
@@ -16,6 +20,8 @@ from .zarr import ZarrAsset
 from ..consts import ZARR_MIME_TYPE, dandiset_metadata_file
 from ..metadata.core import add_common_metadata, prepare_metadata
 from ..misctypes import Digest
+from ..support.bids_tree import BIDSTreeScan, TreeFingerprint, scan_bids_tree
+from ..validate._compact import ValidationResultStore
 from ..validate._types import (
     ORIGIN_VALIDATION_DANDI_LAYOUT,
     MissingFileContent,
@@ -27,6 +33,226 @@ from ..validate._types import (
 BIDS_ASSET_ERRORS = ("BIDS.NON_BIDS_PATH_PLACEHOLDER",)
 BIDS_DATASET_ERRORS = ("BIDS.MANDATORY_FILE_MISSING_PLACEHOLDER",)
 
+#: The maximum number of `BIDSDatasetAnalysis` objects kept in memory by
+#: `analyze_bids_dataset()`
+MAX_CACHED_ANALYSES = 8
+
+_analyses: OrderedDict[tuple, BIDSDatasetAnalysis] = OrderedDict()
+_analyses_lock = Lock()
+
+
+@dataclass
+class BIDSDatasetAnalysis:
+    """
+    The validation results & per-asset metadata for a BIDS dataset, derived
+    from a single scan of the dataset's tree.  Each part is computed when first
+    requested.  Instances are shared by all `BIDSDatasetDescriptionAsset`\\s
+    for a dataset via `analyze_bids_dataset()`.
+    """
+
+    #: The scan of the dataset's tree
+    scan: BIDSTreeScan
+
+    _errors: ValidationResultStore | None = None
+    #: Indices of `_errors` keyed by the paths of the results relative to
+    #: the dataset root
+    _errors_by_path: dict[str, list[int]] | None = None
+    _metadata: dict[str, dict[str, Any]] | None = None
+    _lock: Lock = field(init=False, default_factory=Lock, repr=False, compare=False)
+
+    @property
+    def bids_root(self) -> Path:
+        return self.scan.root
+
+    def _get_errors(self) -> tuple[ValidationResultStore, dict[str, list[int]]]:
+        with self._lock:
+            if self._errors is None or self._errors_by_path is None:
+                errors = ValidationResultStore()
+                for result in bids_validate(
+                    self.bids_root, tree_fingerprint=self.scan.fingerprint
+                ):
+                    errors.append(result)
+                    if (
+                        result.path is not None
+                        and result.dataset_path is not None
+                        and result.path.relative_to(result.dataset_path).as_posix()
+                        == dandiset_metadata_file
+                    ):
+                        errors.append(_bidsignore_hint(result))
+                self._errors_by_path = errors.index_by_path(self.bids_root)
+                self._errors = errors
+            return self._errors, self._errors_by_path
+
+    def get_errors(self) -> list[ValidationResult]:
+        """
+        Return the results of validating the dataset with the deno-compiled
+        BIDS validator, each `dandiset.yaml` error followed by a hint to
+        ignore the file
+        """
+        errors, _ = self._get_errors()
+        return list(errors)
+
+    def get_asset_errors(self, bids_path: str) -> list[ValidationResult]:
+        """
+        Return the validation results pertaining to the asset at the given
+        path relative to the dataset root
+        """
+        errors, by_path = self._get_errors()
+        return errors.select(by_path.get(bids_path, ()))
+
+    def get_bids_version(self) -> str | None:
+        """Return the version of BIDS reported in the validation results"""
+        errors, _ = self._get_errors()
+        return errors[0].origin.standard_version if len(errors) else None
+
+    def _get_metadata(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            if self._metadata is None:
+                if self.scan.fingerprint.modified_recently():
+                    self._metadata = _match_bids_paths(self.scan.paths)
+                else:
+                    self._metadata = _get_cached_bids_matches()(
+                        self.scan.fingerprint,
+                        _bids_match_cache_tokens(),
+                        paths=self.scan.paths,
+                    )
+            return self._metadata
+
+    def get_metadata(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the BIDS entities (named as in DANDI metadata) of the assets in
+        the dataset that match a BIDS naming pattern, keyed by their paths
+        relative to the dataset root.  The paths are matched against the
+        patterns of bidsschematools' bundled schema, which is what
+        `dandi.validate._core.validate_bids()` uses.
+        """
+        return {k: v.copy() for k, v in self._get_metadata().items()}
+
+    def get_asset_metadata(self, bids_path: str) -> dict[str, Any] | None:
+        """
+        Return the BIDS entities of the asset at the given path relative to
+        the dataset root, or `None` if it does not match a BIDS naming pattern
+        """
+        meta = self._get_metadata().get(bids_path)
+        return meta.copy() if meta is not None else None
+
+
+def analyze_bids_dataset(bids_root: Path) -> BIDSDatasetAnalysis:
+    """
+    Scan the BIDS dataset at ``bids_root`` and return its
+    `BIDSDatasetAnalysis`.  Analyses are kept in memory (up to
+    `MAX_CACHED_ANALYSES` of them) keyed by the dataset's location and tree
+    fingerprint, so a dataset is only analyzed again once its tree has
+    changed.
+    """
+    scan = scan_bids_tree(
+        bids_root,
+        pseudofile_suffixes=_bids_pseudofile_suffixes(),
+        exclude_files=[dandiset_metadata_file],
+    )
+    key = (str(bids_root), scan.fingerprint)
+    with _analyses_lock:
+        try:
+            _analyses.move_to_end(key)
+            return _analyses[key]
+        except KeyError:
+            pass
+        analysis = BIDSDatasetAnalysis(scan=scan)
+        if not scan.fingerprint.modified_recently():
+            _analyses[key] = analysis
+            while len(_analyses) > MAX_CACHED_ANALYSES:
+                _analyses.popitem(last=False)
+        return analysis
+
+
+def _bidsignore_hint(result: ValidationResult) -> ValidationResult:
+    """
+    Return a hint, following a BIDS validation error about the
+    `dandiset.yaml` file, suggesting to add the file to `.bidsignore`
+    """
+    return ValidationResult(
+        id="DANDI.BIDSIGNORE_DANDISET_YAML",
+        origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+        scope=Scope.DATASET,
+        origin_result=result,
+        severity=Severity.HINT,
+        dandiset_path=result.dandiset_path,
+        dataset_path=result.dataset_path,
+        path=result.path,
+        message=(
+            f"Consider creating or updating a `.bidsignore` file "
+            f"in the root of your BIDS dataset to ignore "
+            f"`{dandiset_metadata_file}`. "
+            f"Add the following line to `.bidsignore`:\n"
+            f"{dandiset_metadata_file}"
+        ),
+    )
+
+
+@cache
+def _load_bids_regex_schema() -> tuple[list[dict[str, Any]], Any]:
+    # Avoid heavy import by importing within function:
+    import bidsschematools.rules
+    import bidsschematools.schema  # noqa: F401
+
+    # `None` selects the schema bundled with bidsschematools
+    return bidsschematools.rules.regexify_all(None)  # type: ignore[no-any-return]
+
+
+def _bids_pseudofile_suffixes() -> list[str]:
+    """
+    Return the suffixes of directories that BIDS treats as single files, like
+    ``".ome.zarr"``
+    """
+    _, schema = _load_bids_regex_schema()
+    return [
+        ext.value[:-1]
+        for ext in schema.objects.extensions.values()
+        if len(ext.value) > 1 and ext.value.endswith("/")
+    ]
+
+
+def _match_bids_paths(paths: list[str]) -> dict[str, dict[str, Any]]:
+    # Avoid heavy import by importing within function:
+    from bidsschematools.validator import validate_all
+
+    from ..validate._core import BIDS_TO_DANDI
+
+    regex_schema, _ = _load_bids_regex_schema()
+    matches: dict[str, dict[str, Any]] = {}
+    for meta in validate_all(paths, regex_schema)["match_listing"]:
+        bids_path = meta.pop("path").rstrip("/")
+        matches[bids_path] = {
+            BIDS_TO_DANDI[k]: v for k, v in meta.items() if k in BIDS_TO_DANDI
+        }
+    return matches
+
+
+@cache
+def _bids_match_cache_tokens() -> tuple[str, ...]:
+    # Avoid heavy import by importing within function:
+    from dandi.pynwb_utils import validate_cache_tokens
+
+    return tuple(validate_cache_tokens) + (get_dist_version("bidsschematools"),)
+
+
+@cache
+def _get_cached_bids_matches() -> Callable[..., dict[str, dict[str, Any]]]:
+    # Avoid heavy import by importing within function:
+    from dandi.pynwb_utils import validate_cache
+
+    return validate_cache.memoize(  # type: ignore[no-any-return]
+        _fingerprinted_bids_matches, exclude_kwargs=["paths"]
+    )
+
+
+def _fingerprinted_bids_matches(
+    fingerprint: TreeFingerprint, tokens: tuple[str, ...], paths: list[str]
+) -> dict[str, dict[str, Any]]:
+    # The paths are determined by the fingerprint, so they need not be part of
+    # the cache key
+    return _match_bids_paths(paths)
+
 
 @dataclass
 class BIDSDatasetDescriptionAsset(LocalFileAsset):
@@ -40,25 +266,17 @@ class BIDSDatasetDescriptionAsset(LocalFileAsset):
     #: A list of all other assets in the dataset
     dataset_files: list[BIDSAsset] = field(default_factory=list)
 
-    #: A list of all the validation results pertaining to the containing dataset
-    #: as a BIDS dataset populated by `_validate()`
-    _dataset_errors: list[ValidationResult] | None = None
-
-    #: A list of validation error messages for individual assets in the
-    #: dataset, keyed by `bids_path` properties; populated by `_validate()`
-    _asset_errors: defaultdict[str, list[ValidationResult]] | None = None
-
     #: Asset metadata for individual assets in the dataset, keyed by
-    #: `bids_path` properties; populated by `_get_metadata()`
-    _asset_metadata: defaultdict[str, BareAsset] | None = None
+    #: `bids_path` properties; populated by `get_asset_metadata()`
+    _asset_metadata: dict[str, BareAsset] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
-    #: Version of BIDS used in the validation
-    #: (not necessarily the same as the value of the `"BIDSVersion"` field in the
-    #: represented `dataset_description.json` file);
-    #: populated by `_validate()`
-    #: In future this might be removed and the information included in the
-    #: BareAsset via dandischema.
-    _bids_version: str | None = None
+    #: The analysis of the dataset, from which validation results and asset
+    #: metadata are obtained
+    _analysis: BIDSDatasetAnalysis | None = field(
+        default=None, repr=False, compare=False
+    )
 
     #: Threading lock needed in case multiple assets are validated in parallel
     #: during upload
@@ -81,105 +299,36 @@ class BIDSDatasetDescriptionAsset(LocalFileAsset):
             This value is not necessarily the same as the value of the `"BIDSVersion"`
             field in the represented `dataset_description.json` file.
         """
-        self._validate()
-        return self._bids_version
-
-    def _get_metadata(self) -> None:
-        """
-        Get metadata for all assets in the dataset
+        return self._get_analysis().get_bids_version()
 
-        This populates `self._asset_metadata`
-        """
-        with self._lock:
-            if self._asset_metadata is None:
-                # Import here to avoid circular import
-                from dandi.validate._core import validate_bids
-
-                # === Validate the dataset using bidsschematools ===
-                #   This is done to obtain the metadata for each asset in the dataset
-                results = validate_bids(self.bids_root)
-                # Don't apply eta-reduction to the lambda, as mypy needs to be
-                # assured that defaultdict's argument takes no parameters.
-                self._asset_metadata = defaultdict(
-                    lambda: BareAsset.model_construct()  # type: ignore[call-arg]
-                )
-                for result in results:
-                    if result.id == "BIDS.MATCH":
-                        assert result.path
-                        bids_path = result.path.relative_to(self.bids_root).as_posix()
-                        assert result.metadata is not None
-                        self._asset_metadata[bids_path] = prepare_metadata(
-                            result.metadata
-                        )
-
-    def _validate(self) -> None:
+    def _get_analysis(self) -> BIDSDatasetAnalysis:
         with self._lock:
-            if self._dataset_errors is None:
-
-                # Obtain BIDS validation results of the entire dataset through the
-                # deno-compiled BIDS validator
-                v_results = bids_validate(self.bids_root)
-
-                # Validation results from the deno BIDS validator with an additional
-                # hint, represented as a `ValidationResult` object, following
-                # each `dandiset.yaml` error, suggesting to add the `dandiset.yaml` file
-                # to `.bidsignore`.
-                v_results_extended: list[ValidationResult] = []
-
-                for result in v_results:
-                    v_results_extended.append(result)
-                    if (
-                        result.path is not None
-                        and result.dataset_path is not None
-                        and result.path.relative_to(result.dataset_path).as_posix()
-                        == dandiset_metadata_file
-                    ):
-                        hint = ValidationResult(
-                            id="DANDI.BIDSIGNORE_DANDISET_YAML",
-                            origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
-                            scope=Scope.DATASET,
-                            origin_result=result,
-                            severity=Severity.HINT,
-                            dandiset_path=result.dandiset_path,
-                            dataset_path=result.dataset_path,
-                            path=result.path,
-                            message=(
-                                f"Consider creating or updating a `.bidsignore` file "
-                                f"in the root of your BIDS dataset to ignore "
-                                f"`{dandiset_metadata_file}`. "
-                                f"Add the following line to `.bidsignore`:\n"
-                                f"{dandiset_metadata_file}"
-                            ),
-                        )
-                        v_results_extended.append(hint)
-
-                self._dataset_errors = v_results_extended
-
-                # Categorized validation results related to individual assets by the
-                # path of the asset in the BIDS dataset
-                self._asset_errors = defaultdict(list)
-                for result in self._dataset_errors:
-                    if result.path is not None:
-                        self._asset_errors[
-                            result.path.relative_to(self.bids_root).as_posix()
-                        ].append(result)
-
-                # Obtain BIDS standard version from one of the validation results
-                if self._dataset_errors:
-                    bids_version = self._dataset_errors[0].origin.standard_version
-                    self._bids_version = bids_version
+            if self._analysis is None:
+                self._analysis = analyze_bids_dataset(self.bids_root)
+            return self._analysis
 
     def get_asset_errors(self, asset: BIDSAsset) -> list[ValidationResult]:
         """:meta private:"""
-        self._validate()
-        assert self._asset_errors is not None
-        return self._asset_errors[asset.bids_path].copy()
+        return self._get_analysis().get_asset_errors(asset.bids_path)
 
     def get_asset_metadata(self, asset: BIDSAsset) -> BareAsset:
         """:meta private:"""
-        self._get_metadata()
-        assert self._asset_metadata is not None
-        return self._asset_metadata[asset.bids_path]
+        bids_path = asset.bids_path
+        with self._lock:
+            try:
+                return self._asset_metadata[bids_path]
+            except KeyError:
+                pass
+        meta = self._get_analysis().get_asset_metadata(bids_path)
+        with self._lock:
+            return self._asset_metadata.setdefault(
+                bids_path,
+                (
+                    prepare_metadata(meta)
+                    if meta is not None
+                    else BareAsset.model_construct()  # type: ignore[call-arg]
+                ),
+            )
 
     def get_validation_errors(
         self,
@@ -190,9 +339,7 @@ class BIDSDatasetDescriptionAsset(LocalFileAsset):
         """
         Return all validation results for the containing dataset per the BIDS standard
         """
-        self._validate()
-        assert self._dataset_errors is not None
-        return self._dataset_errors.copy()
+        return self._get_analysis().get_errors()
 
     # get_metadata(): inherit use of default metadata from LocalFileAsset
 
@@ -3,11 +3,18 @@ from __future__ import annotations
 from base64 import b64encode
 from collections import Counter
 from collections.abc import Generator, Iterator
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from contextlib import closing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import closing, contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 import json
 import math
 import os
@@ -303,6 +310,11 @@ class LocalZarrEntry(BasePath):
     #: The path to the root of the Zarr file tree
     zarr_basepath: Path
 
+    #: If set, the `ZarrSnapshot` that the entry was obtained from, which is
+    #: then used to answer questions about the entry's type, size, children,
+    #: and digest without touching the filesystem again
+    snapshot: ZarrSnapshot | None = field(default=None, compare=False, repr=False)
+
     @property
     def filepath(self) -> Path:
         """The path to the actual file or directory on disk"""
@@ -326,15 +338,25 @@ class LocalZarrEntry(BasePath):
             return replace(self, parts=self.parts[:-1])
 
     def exists(self) -> bool:
+        if self.snapshot is not None:
+            return self.is_file() or self.is_dir()
         return os.path.lexists(self.filepath)
 
     def is_file(self) -> bool:
+        if self.snapshot is not None:
+            return str(self) in self.snapshot.files
         return self.filepath.is_file()
 
     def is_dir(self) -> bool:
+        if self.snapshot is not None:
+            return str(self) in self.snapshot.directories
         return self.filepath.is_dir()
 
     def iterdir(self) -> Iterator[LocalZarrEntry]:
+        if self.snapshot is not None:
+            for name in self.snapshot._children.get(self.parts, []):
+                yield self._get_subpath(name)
+            return
         for p in self.filepath.iterdir():
             if exclude_from_zarr(p):
                 continue
@@ -354,6 +376,11 @@ class LocalZarrEntry(BasePath):
 
         if self.is_dir():
             return Digest.dandi_zarr(get_zarr_checksum(self.filepath))
+        elif self.snapshot is not None:
+            return Digest(
+                algorithm=DigestType.md5,
+                value=self.snapshot.get_file_digest(str(self)),
+            )
         else:
             return Digest(
                 algorithm=DigestType.md5, value=get_digest(self.filepath, "md5")
@@ -365,7 +392,9 @@ class LocalZarrEntry(BasePath):
         The size of the entry.  For a directory, this is the total size of all
         entries within it.
         """
-        if self.is_dir():
+        if self.snapshot is not None and self.is_file():
+            return self.snapshot.files[str(self)][0]
+        elif self.is_dir():
             return sum(p.size for p in self.iterdir())
         else:
             return os.path.getsize(self.filepath)
@@ -389,6 +418,146 @@ class ZarrStat:
     files: list[LocalZarrEntry]
 
 
+@dataclass
+class ZarrSnapshot:
+    """
+    A listing of all files in a Zarr directory tree, produced by a single
+    parallel scan and shared by the `ZarrAsset` operations that would
+    otherwise each walk the tree on their own (size calculation, validation,
+    `~ZarrAsset.stat()`, checksumming, and upload).
+
+    A snapshot is not updated when the Zarr changes; see
+    `ZarrAsset.snapshot()` for how snapshots are reused.
+    """
+
+    #: The path to the root of the Zarr file tree
+    zarr_basepath: Path
+    #: A mapping from forward-slash-separated paths of files relative to the
+    #: root of the Zarr to pairs of their sizes and modification times (in
+    #: nanoseconds)
+    files: dict[str, tuple[int, int]]
+    #: The forward-slash-separated paths of directories relative to the root of
+    #: the Zarr, with the root itself represented by an empty string
+    directories: set[str]
+    #: MD5 digests of files, keyed by their relative paths, filled in as they
+    #: are computed
+    digests: dict[str, str] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def scan(cls, zarr_basepath: Path, jobs: int | None = None) -> ZarrSnapshot:
+        """
+        Scan the Zarr at ``zarr_basepath``, listing directories in parallel
+        using ``jobs`` threads (default: 60)
+        """
+        files: dict[str, tuple[int, int]] = {}
+        directories: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=jobs or 60, thread_name_prefix="zarr_scan"
+        ) as executor:
+            pending = {executor.submit(_scan_zarr_dir, zarr_basepath, "")}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        relpath, dirfiles, subdirs = fut.result()
+                        directories.add(relpath)
+                        files.update(dirfiles)
+                        for sd in subdirs:
+                            pending.add(
+                                executor.submit(_scan_zarr_dir, zarr_basepath, sd)
+                            )
+            except BaseException:
+                for fut in pending:
+                    fut.cancel()
+                raise
+        lgr.debug(
+            "%s: Scanned Zarr: %s in %s",
+            zarr_basepath,
+            pluralize(len(files), "file"),
+            pluralize(len(directories), "directory", "directories"),
+        )
+        return cls(zarr_basepath=zarr_basepath, files=files, directories=directories)
+
+    @property
+    def size(self) -> int:
+        """The total size of all files in the Zarr"""
+        return sum(size for size, _ in self.files.values())
+
+    @property
+    def max_depth(self) -> int:
+        """The largest number of path components of any file in the Zarr"""
+        return max((p.count("/") + 1 for p in self.files), default=0)
+
+    @cached_property
+    def _children(self) -> dict[tuple[str, ...], list[str]]:
+        # Mapping from the path components of each directory containing at
+        # least one file (at any depth) to the names of its non-empty entries
+        children: dict[tuple[str, ...], dict[str, None]] = {}
+        for p in self.files:
+            parts = tuple(p.split("/"))
+            for i in range(len(parts)):
+                children.setdefault(parts[:i], {})[parts[i]] = None
+        return {k: list(v) for k, v in children.items()}
+
+    def iterfiles(self) -> Iterator[LocalZarrEntry]:
+        """Yield a `LocalZarrEntry` for each file in the snapshot"""
+        for p in self.files:
+            yield LocalZarrEntry(
+                parts=tuple(p.split("/")),
+                zarr_basepath=self.zarr_basepath,
+                snapshot=self,
+            )
+
+    def get_file_digest(self, relpath: str) -> str:
+        """
+        Return the MD5 digest of the file at the given relative path,
+        computing it if it is not already known
+        """
+        try:
+            return self.digests[relpath]
+        except KeyError:
+            # Avoid heavy import by importing within function:
+            from dandi.support.digests import md5file_nocache
+
+            dgst = md5file_nocache(self.zarr_basepath / relpath)
+            self.digests[relpath] = dgst
+            return dgst
+
+    def get_checksum(self, jobs: int | None = None) -> str:
+        """
+        Compute the Zarr checksum of the snapshot, digesting any files whose
+        digests are not yet known using ``jobs`` threads (default: 60)
+        """
+        missing = [p for p in self.files if p not in self.digests]
+        if missing:
+            with ThreadPoolExecutor(max_workers=jobs or 60) as executor:
+                for _ in executor.map(self.get_file_digest, missing):
+                    pass
+        zcc = ZarrChecksumTree()
+        for p, (size, _) in self.files.items():
+            zcc.add_leaf(Path(p), size, self.digests[p])
+        return str(zcc.process())
+
+
+def _scan_zarr_dir(
+    zarr_basepath: Path, relpath: str
+) -> tuple[str, dict[str, tuple[int, int]], list[str]]:
+    dirpath = zarr_basepath / relpath
+    files: dict[str, tuple[int, int]] = {}
+    subdirs: list[str] = []
+    with os.scandir(dirpath) as entries:
+        for e in entries:
+            if exclude_from_zarr(Path(e.path)):
+                continue
+            p = f"{relpath}/{e.name}" if relpath else e.name
+            if e.is_dir():
+                subdirs.append(p)
+            else:
+                st = e.stat()
+                files[p] = (st.st_size, st.st_mtime_ns)
+    return (relpath, files, subdirs)
+
+
 class UploadStatus(Enum):
     SUCCESS = "success"
     RETRY_NEEDED = "retry_needed"  # 403 error - need new URL
@@ -418,41 +587,73 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
         """
         return LocalZarrEntry(zarr_basepath=self.filepath, parts=())
 
-    def stat(self) -> ZarrStat:
-        """Return various details about the Zarr asset"""
+    #: The most recent snapshot of the asset's file tree; see `snapshot()`
+    _snapshot: ZarrSnapshot | None = None
+    #: The snapshot held by `hold_snapshot()`, if any
+    _held_snapshot: ZarrSnapshot | None = None
 
-        def dirstat(dirpath: LocalZarrEntry) -> ZarrStat:
-            # Avoid heavy import by importing within function:
-            from dandi.support.digests import checksum_zarr_dir, md5file_nocache
-
-            size = 0
-            dir_info = {}
-            file_info = {}
-            files = []
-            for p in dirpath.iterdir():
-                if p.is_dir():
-                    st = dirstat(p)
-                    size += st.size
-                    dir_info[p.name] = (st.digest.value, st.size)
-                    files.extend(st.files)
-                else:
-                    size += p.size
-                    file_info[p.name] = (md5file_nocache(p.filepath), p.size)
-                    files.append(p)
-            return ZarrStat(
-                size=size,
-                digest=Digest.dandi_zarr(checksum_zarr_dir(file_info, dir_info)),
-                files=files,
-            )
+    def snapshot(self, jobs: int | None = None) -> ZarrSnapshot:
+        """
+        Return a `ZarrSnapshot` of the asset's file tree.  While a snapshot is
+        held with `hold_snapshot()`, that snapshot is returned.  Otherwise,
+        the tree is scanned anew, keeping the known digests of files whose
+        size & modification time are unchanged since the previous scan.
+        """
+        if self._held_snapshot is not None:
+            return self._held_snapshot
+        old = self._snapshot
+        new = ZarrSnapshot.scan(self.filepath, jobs=jobs)
+        if old is not None:
+            new.digests = {
+                p: d for p, d in old.digests.items() if new.files.get(p) == old.files[p]
+            }
+        self._snapshot = new
+        return new
 
-        return dirstat(self.filetree)
+    @contextmanager
+    def hold_snapshot(self, jobs: int | None = None) -> Iterator[ZarrSnapshot]:
+        """
+        Scan the asset's file tree once and have all operations on the asset
+        within the context use that snapshot instead of each rescanning the
+        tree.  The Zarr must not be modified while its snapshot is held.
+        """
+        if self._held_snapshot is not None:
+            yield self._held_snapshot
+            return
+        self._held_snapshot = self.snapshot(jobs=jobs)
+        try:
+            yield self._held_snapshot
+        finally:
+            self._held_snapshot = None
+
+    def iterfiles(self, include_dirs: bool = False) -> Iterator[LocalZarrEntry]:
+        """Yield all files within the Zarr, as listed by `snapshot()`"""
+        snapshot = self.snapshot()
+        if include_dirs:
+            for parts in snapshot._children:
+                if parts:
+                    yield LocalZarrEntry(
+                        parts=parts, zarr_basepath=self.filepath, snapshot=snapshot
+                    )
+        yield from snapshot.iterfiles()
+
+    @property
+    def size(self) -> int:
+        """The total size of the files in the Zarr"""
+        return self.snapshot().size
+
+    def stat(self) -> ZarrStat:
+        """Return various details about the Zarr asset"""
+        snapshot = self.snapshot()
+        return ZarrStat(
+            size=snapshot.size,
+            digest=Digest.dandi_zarr(snapshot.get_checksum()),
+            files=list(snapshot.iterfiles()),
+        )
 
     def get_digest(self) -> Digest:
         """Calculate a dandi-zarr-checksum digest for the asset"""
-        # Avoid heavy import by importing within function:
-        from dandi.support.digests import get_zarr_checksum
-
-        return Digest.dandi_zarr(get_zarr_checksum(self.filepath))
+        return Digest.dandi_zarr(self.snapshot().get_checksum())
 
     def get_metadata(
         self,
@@ -547,10 +748,7 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
         )
 
     def _is_too_deep(self) -> bool:
-        for e in self.iterfiles():
-            if len(e.parts) >= MAX_ZARR_DEPTH + 1:
-                return True
-        return False
+        return self.snapshot().max_depth > MAX_ZARR_DEPTH
 
     def iter_upload(
         self,
@@ -645,6 +843,10 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
         mismatched = True
         first_run = True
         while mismatched:
+            snapshot = self.snapshot(jobs=jobs)
+            if not first_run:
+                # Digests may have been the cause of the mismatch; recompute
+                snapshot.digests.clear()
             zcc = ZarrChecksumTree()
             old_zarr_entries: dict[str, RemoteZarrEntry] = {
                 str(e): e for e in a.iterfiles()
@@ -656,7 +858,7 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
                 digesting: list[Future[tuple[LocalZarrEntry, str, bool]]] = []
                 yield {"status": "comparing against remote Zarr"}
                 with ThreadPoolExecutor(max_workers=jobs or 5) as executor:
-                    for local_entry in self.iterfiles():
+                    for local_entry in snapshot.iterfiles():
                         total_size += local_entry.size
                         try:
                             remote_entry = old_zarr_entries.pop(str(local_entry))
@@ -731,7 +933,7 @@ class ZarrAsset(LocalDirectoryAsset[LocalZarrEntry]):
                     )
             else:
                 yield {"status": "traversing local Zarr"}
-                for local_entry in self.iterfiles():
+                for local_entry in snapshot.iterfiles():
                     total_size += local_entry.size
                     to_upload.register(local_entry)
             yield {"status": "initiating upload", "size": total_size}
@@ -1044,11 +1246,7 @@ class EntryUploadTracker:
 
     @staticmethod
     def _mkitem(e: LocalZarrEntry) -> UploadItem:
-        # Avoid heavy import by importing within function:
-        from dandi.support.digests import md5file_nocache
-
-        digest = md5file_nocache(e.filepath)
-        return UploadItem.from_entry(e, digest)
+        return UploadItem.from_entry(e, _entry_md5(e))
 
     def get_items(self, jobs: int = 5) -> Generator[UploadItem, None, None]:
         # Note: In order for the ThreadPoolExecutor to be closed if an error
@@ -1122,13 +1320,20 @@ class UploadItem:
         return {"path": self.entry_path, "base64md5": self.base64_digest}
 
 
+def _entry_md5(e: LocalZarrEntry) -> str:
+    if e.snapshot is not None:
+        return e.snapshot.get_file_digest(str(e))
+    else:
+        # Avoid heavy import by importing within function:
+        from dandi.support.digests import md5file_nocache
+
+        return md5file_nocache(e.filepath)
+
+
 def _cmp_digests(
     asset_path: str, local_entry: LocalZarrEntry, remote_digest: str
 ) -> tuple[LocalZarrEntry, str, bool]:
-    # Avoid heavy import by importing within function:
-    from dandi.support.digests import md5file_nocache
-
-    local_digest = md5file_nocache(local_entry.filepath)
+    local_digest = _entry_md5(local_entry)
     if local_digest != remote_digest:
         lgr.debug(
             "%s: Path %s in Zarr differs from local file; re-uploading",
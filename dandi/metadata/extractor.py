@@ -0,0 +1,251 @@
+"""
+A process pool for extracting metadata from many files at once
+
+Extracting metadata from NWB files is Python (pynwb) intensive rather than I/O
+bound, so threads give little to no speedup.  `MetadataExtractor` runs
+extraction functions in a persistent pool of worker processes that have
+already imported pynwb & h5py, and hands results (or the exceptions, with
+their tracebacks, raised in the workers) back to the calling process.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import traceback
+from typing import Any, Generic, TypeVar
+
+from .. import get_logger
+
+lgr = get_logger()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class ExtractionError:
+    """An exception raised by a metadata extraction function"""
+
+    #: The exception.  If the original exception could not be transferred
+    #: from a worker process, this is a `RuntimeError` with the same message.
+    exc: BaseException
+    #: The formatted traceback of the exception, from the process in which it
+    #: was raised
+    traceback: list[str]
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> ExtractionError:
+        return cls(exc=exc, traceback=traceback.format_exception(exc))
+
+    @property
+    def exc_type(self) -> type[BaseException]:
+        return type(self.exc)
+
+
+@dataclass
+class ExtractionResult(Generic[T, R]):
+    """The outcome of extracting metadata from one item"""
+
+    #: The item passed to the extraction function
+    item: T
+    #: The value returned by the extraction function, if it succeeded
+    value: R | None = None
+    #: The error raised by the extraction function, if it failed
+    error: ExtractionError | None = None
+
+    def unwrap(self) -> R:
+        """
+        Return the extracted value, or re-raise the extraction function's
+        exception
+        """
+        if self.error is not None:
+            raise self.error.exc
+        return self.value  # type: ignore[return-value]
+
+
+def _warm_up() -> None:
+    """Pool initializer: do the heavy imports once per worker process"""
+    # Avoid heavy import by importing within function:
+    import h5py  # noqa: F401
+    import pynwb  # noqa: F401
+
+    from . import nwb  # noqa: F401
+    from ..pynwb_utils import ignore_benign_pynwb_warnings
+
+    ignore_benign_pynwb_warnings()
+
+
+def _call(
+    func: Callable[..., R], item: Any, kwargs: dict[str, Any]
+) -> tuple[R | None, ExtractionError | None]:
+    """Run ``func(item, **kwargs)`` in a worker process"""
+    try:
+        return func(item, **kwargs), None
+    except Exception as e:
+        error = ExtractionError.from_exception(e)
+    try:
+        pickle.loads(pickle.dumps(error.exc))
+    except Exception:
+        error.exc = RuntimeError(f"{error.exc_type.__name__}: {error.exc}")
+    return None, error
+
+
+class MetadataExtractor:
+    """
+    Runs metadata extraction functions in a persistent pool of worker
+    processes.  With ``jobs == 1``, functions are instead run in the calling
+    process, one at a time.
+
+    Functions (and the items & keyword arguments passed to them) must be
+    picklable, i.e., defined at module level, and are always called as
+    ``func(item, **kwargs)``.  Exceptions raised by a function are captured in
+    the `ExtractionResult` rather than propagated.
+    """
+
+    def __init__(self, jobs: int | None = None) -> None:
+        #: The number of worker processes; defaults to the number of CPUs
+        self.jobs: int = jobs if jobs is not None and jobs > 0 else os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> MetadataExtractor:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.shutdown()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                lgr.debug("Starting %d metadata extraction processes", self.jobs)
+                # Forking a process that may be running other threads (e.g.,
+                # pyout's workers) is unsafe, so start workers afresh
+                method = (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn"
+                )
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.jobs,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_warm_up,
+                )
+            return self._pool
+
+    def submit(
+        self, func: Callable[..., R], item: T, **kwargs: Any
+    ) -> Future[ExtractionResult[T, R]]:
+        """
+        Schedule ``func(item, **kwargs)`` to be run and return a future for
+        its `ExtractionResult`
+        """
+        out: Future[ExtractionResult[T, R]] = Future()
+        if self.jobs == 1:
+            try:
+                out.set_result(ExtractionResult(item=item, value=func(item, **kwargs)))
+            except Exception as e:
+                out.set_result(
+                    ExtractionResult(item=item, error=ExtractionError.from_exception(e))
+                )
+            return out
+        pool = self._get_pool()
+
+        def done(fut: Future[tuple[R | None, ExtractionError | None]]) -> None:
+            try:
+                value, error = fut.result()
+            except Exception as e:
+                # Raised if the result could not be transferred from the
+                # worker or if a worker died
+                if isinstance(e, BrokenProcessPool):
+                    with self._lock:
+                        if self._pool is pool:
+                            self._pool = None
+                    pool.shutdown(wait=False)
+                value, error = None, ExtractionError.from_exception(e)
+            out.set_result(ExtractionResult(item=item, value=value, error=error))
+
+        pool.submit(_call, func, item, kwargs).add_done_callback(done)
+        return out
+
+    def run(self, func: Callable[..., R], item: T, **kwargs: Any) -> R:
+        """
+        Run ``func(item, **kwargs)`` in the pool, wait for it to finish, and
+        return its return value or re-raise its exception
+        """
+        return self.submit(func, item, **kwargs).result().unwrap()
+
+    def map(
+        self, func: Callable[..., R], items: Iterable[T], **kwargs: Any
+    ) -> Iterator[ExtractionResult[T, R]]:
+        """
+        Run ``func(item, **kwargs)`` for each item in ``items`` and yield the
+        `ExtractionResult`\\s in the order in which they complete, logging
+        progress along the way
+        """
+        items = list(items)
+        total = len(items)
+        step = max(total // 10, 1)
+        results: Iterable[Future[ExtractionResult[T, R]]]
+        if self.jobs == 1:
+            # Extract lazily so that results are still streamed
+            results = (self.submit(func, item, **kwargs) for item in items)
+        else:
+            results = as_completed(
+                [self.submit(func, item, **kwargs) for item in items]
+            )
+        for done, fut in enumerate(results, start=1):
+            r = fut.result()
+            lgr.log(
+                logging.INFO if done % step == 0 or done == total else 5,
+                "Extracted metadata for %d out of %d items",
+                done,
+                total,
+            )
+            yield r
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any are running"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+_extractors: dict[int | None, MetadataExtractor] = {}
+_extractors_lock = threading.Lock()
+_atexit_registered = False
+
+
+def get_metadata_extractor(jobs: int | None = None) -> MetadataExtractor:
+    """
+    Return the `MetadataExtractor` shared by all commands run in this process
+    with the given number of ``jobs``.  Its worker processes are kept running
+    (with their imports warm) until the process exits.
+    """
+    global _atexit_registered
+    with _extractors_lock:
+        if not _atexit_registered:
+            atexit.register(_shutdown_extractors)
+            _atexit_registered = True
+        try:
+            return _extractors[jobs]
+        except KeyError:
+            extractor = _extractors[jobs] = MetadataExtractor(jobs)
+            return extractor
+
+
+def _shutdown_extractors() -> None:
+    with _extractors_lock:
+        extractors = list(_extractors.values())
+        _extractors.clear()
+    for e in extractors:
+        e.shutdown()
@@ -4,7 +4,7 @@ from datetime import datetime
 import os.path
 from pathlib import Path
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from dandischema import models
 
@@ -20,10 +20,15 @@ from ..pynwb_utils import (
     get_nwb_version,
     ignore_benign_pynwb_warnings,
     metadata_cache,
+    metadata_cache_tokens,
+    nwb_file_session,
     nwb_has_external_links,
 )
 from ..utils import find_parent_directory_containing
 
+if TYPE_CHECKING:
+    from ..support.digests import FileFingerprint
+
 lgr = get_logger()
 
 
@@ -83,6 +88,47 @@ def get_metadata(
                         meta[key] = value
 
     if r.get_filename().endswith((".NWB", ".nwb")):
+        meta.update(_get_nwb_metadata(r))
+    if not meta:
+        raise RuntimeError(
+            f"Unable to get metadata from non-BIDS, non-NWB asset: `{path}`."
+        )
+    return meta
+
+
+def _get_nwb_metadata(r: Readable) -> dict[str, Any]:
+    """
+    Get the metadata stored inside the NWB file ``r``.  For a local file, this
+    is cached by a fingerprint of the file's content rather than by its path,
+    so that it survives moves and renames of the file (e.g., by ``dandi
+    organize``).
+    """
+    if isinstance(r, LocalReadableFile):
+        # Avoid heavy import by importing within function:
+        from ..support.digests import get_file_fingerprint
+
+        fprint = get_file_fingerprint(r.filepath)
+        if not fprint.modified_recently():
+            meta = _get_fingerprinted_nwb_metadata(
+                fprint, tuple(metadata_cache_tokens), filepath=r.filepath
+            )
+            assert isinstance(meta, dict)
+            return meta
+    return _read_nwb_metadata(r)
+
+
+@metadata_cache.memoize(exclude_kwargs=["filepath"])
+def _get_fingerprinted_nwb_metadata(
+    fingerprint: FileFingerprint, tokens: tuple[str, ...], filepath: str | Path
+) -> dict[str, Any]:
+    lgr.debug("No cached NWB metadata for fingerprint of %s", filepath)
+    return _read_nwb_metadata(LocalReadableFile(filepath))
+
+
+def _read_nwb_metadata(r: Readable) -> dict[str, Any]:
+    meta: dict[str, Any] = {}
+    # Open the file only once for all of the readers below
+    with nwb_file_session(r):
         if nwb_has_external_links(r):
             raise NotImplementedError(
                 f"NWB files with external links are not supported: {r}"
@@ -127,10 +173,6 @@ def get_metadata(
                 __import__(import_mod)
 
         meta["nd_types"] = get_neurodata_types(r)
-    if not meta:
-        raise RuntimeError(
-            f"Unable to get metadata from non-BIDS, non-NWB asset: `{path}`."
-        )
     return meta
 
 
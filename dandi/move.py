@@ -7,6 +7,8 @@ locally and remotely in DANDI Archive instances. Features include:
 - Combined local and remote moves
 - Conflict resolution (skip, overwrite, error)
 - Validation of move operations
+- Concurrent, dependency-ordered execution of moves that can be resumed
+  after an interruption
 """
 
 from __future__ import annotations
@@ -14,14 +16,21 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import ExitStack
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
+import hashlib
 from itertools import zip_longest
+import json
 import os.path
 from pathlib import Path, PurePosixPath
 import posixpath
 import re
+import threading
 from typing import NewType
+from uuid import uuid4
+
+import platformdirs
+import requests
 
 from . import get_logger
 from .consts import DandiInstance, dandiset_metadata_file
@@ -29,8 +38,9 @@ from .dandiapi import DandiAPIClient, RemoteAsset, RemoteDandiset
 from .dandiarchive import DandisetURL, parse_dandi_url
 from .dandiset import Dandiset
 from .exceptions import NotFoundError
-from .files import DandisetMetadataFile, LocalAsset, find_dandi_files
+from .files import LocalAsset, find_dandi_files
 from .support import pyout as pyouts
+from .utils import PathTrie
 
 lgr = get_logger()
 
@@ -80,6 +90,12 @@ class Movement:
     skip: bool = False
     #: Whether to delete the asset at the destination before moving
     delete: bool = False
+    #: The source path of the movement that vacates this movement's
+    #: destination and so has to be performed first, if any
+    after: AssetPath | None = None
+    #: Whether the movement is being resumed from an interrupted run, in
+    #: which case it may already have been (partially) performed
+    resumed: bool = False
 
     @property
     def dest_exists(self) -> bool:
@@ -131,18 +147,28 @@ class Mover(ABC):
         ...
 
     def process_moves_pyout(
-        self, plan: list[Movement], dry_run: bool = False
+        self,
+        plan: list[Movement],
+        dry_run: bool = False,
+        progress: MoveProgress | None = None,
     ) -> Iterator[dict]:
-        """Yield a `dict` to pass to pyout for each `Movement` in ``plan``"""
+        """
+        Yield a `dict` to pass to pyout for each `Movement` in ``plan``.  If
+        ``progress`` is given, each movement waits for the movement named by
+        its `~Movement.after` to finish first.
+        """
         for m in plan:
             yield {
                 "source": m.src,
                 "target": m.dest,
-                self.updating_fields: self.process_movement(m, dry_run),
+                self.updating_fields: self.track_movement(m, dry_run, progress),
             }
 
     def process_moves_debug(
-        self, plan: list[Movement], dry_run: bool = False
+        self,
+        plan: list[Movement],
+        dry_run: bool = False,
+        progress: MoveProgress | None = None,
     ) -> Iterator[Iterator[dict]]:
         """
         For each `Movement` in ``plan``, yield an iterator of `dict`\\s to
@@ -151,9 +177,39 @@ class Mover(ABC):
         for m in plan:
             yield (
                 {"source": m.src, "target": m.dest, **d}
-                for d in self.process_movement(m, dry_run)
+                for d in self.track_movement(m, dry_run, progress)
             )
 
+    def track_movement(
+        self, m: Movement, dry_run: bool = False, progress: MoveProgress | None = None
+    ) -> Iterator[dict[str, str]]:
+        """
+        Like `process_movement()`, but first wait for the movement that the
+        `Movement` depends on (if any) to finish, and afterwards record in
+        ``progress`` whether the movement succeeded
+        """
+        if progress is None:
+            yield from self.process_movement(m, dry_run)
+            return
+        status_fields = self.updating_fields[:-1]
+        ok = False
+        try:
+            if not progress.wait(m):
+                yield {
+                    **{f: "skipped" for f in status_fields},
+                    "message": f"Moving {m.after!r} failed",
+                }
+                return
+            errored = False
+            for state in self.process_movement(m, dry_run):
+                errored = errored or any(
+                    state.get(f, "").lower() == "error" for f in status_fields
+                )
+                yield state
+            ok = not errored
+        finally:
+            progress.finish(m, ok)
+
     @abstractmethod
     def process_movement(
         self, m: Movement, dry_run: bool = False
@@ -368,6 +424,23 @@ class LocalizedMover(Mover):
         Given a `dict` mapping source paths to destination paths, produce a
         sorted list of `Movement` instances.
         """
+        # A destination that is the source of another movement is vacated by
+        # that movement, unless it is skipped.  Skipping a movement in turn
+        # means that its source is not vacated.
+        skipped: set[AssetPath] = set()
+        if existing is MoveExisting.SKIP:
+            rev = {dest: src for src, dest in moves.items()}
+            queue = [
+                src
+                for src, dest in moves.items()
+                if dest not in moves and self.is_file(dest)
+            ]
+            while queue:
+                src = queue.pop()
+                skipped.add(src)
+                prev = rev.get(src)
+                if prev is not None and prev not in skipped:
+                    queue.append(prev)
         motions: list[Movement] = []
         for src, dest in sorted(moves.items()):
             if self.is_dir(dest):
@@ -375,6 +448,10 @@ class LocalizedMover(Mover):
                     f"Cannot move {src!r} to {dest!r}, as {self.placename}"
                     " destination is a directory"
                 )
+            elif src in skipped:
+                motions.append(Movement(src, dest, skip=True))
+            elif dest in moves and dest not in skipped:
+                motions.append(Movement(src, dest))
             elif self.is_file(dest):
                 if existing is MoveExisting.OVERWRITE:
                     motions.append(Movement(src, dest, delete=True))
@@ -399,7 +476,16 @@ class LocalizedMover(Mover):
             )
             yield {self.status_field: "skipped", "message": "Destination exists"}
             return
-        if m.delete:
+        if m.resumed and not self.is_file(m.src) and self.is_file(m.dest):
+            lgr.debug(
+                "%s asset %r was already moved to %r",
+                self.placename.title(),
+                m.src,
+                m.dest,
+            )
+            yield {self.status_field: "Moved", "message": "Already moved"}
+            return
+        if m.delete and not (m.resumed and not self.is_file(m.dest)):
             yield {self.status_field: "Deleting"}
             lgr.debug("Moving %r to %r: destination exists, so deleting", m.src, m.dest)
             if not dry_run:
@@ -436,11 +522,34 @@ class LocalMover(LocalizedMover):
     #: are operating
     subpath: Path
 
+    #: The paths of all assets in the Dandiset; built on first use and kept
+    #: up to date as assets are moved or deleted
+    _index: PathTrie[bool] | None = field(init=False, default=None, repr=False)
+
+    #: Serializes moves & deletions, which may be performed from multiple
+    #: threads, so that the cleanup of emptied directories by one cannot
+    #: race with the creation of a destination directory by another
+    _lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False
+    )
+
     @property
     def status_field(self) -> str:
         """Name of the pyout status column"""
         return "local"
 
+    def _get_index(self) -> PathTrie[bool]:
+        if self._index is None:
+            self._index = PathTrie()
+            for df in find_dandi_files(
+                self.dandiset_path,
+                dandiset_path=self.dandiset_path,
+                allow_all=True,
+            ):
+                if isinstance(df, LocalAsset):
+                    self._index[df.path] = True
+        return self._index
+
     @property
     def placename(self) -> str:
         """A description of the mover to show in messages"""
@@ -455,19 +564,10 @@ class LocalMover(LocalizedMover):
         starts with ``"../"``).  If ``subpath_only`` is true, only assets
         underneath `subpath` are returned.
         """
-        root = self.dandiset_path
-        if subpath_only:
-            root /= self.subpath
-        for df in find_dandi_files(
-            root,
-            dandiset_path=self.dandiset_path,
-            allow_all=True,
-        ):
-            if isinstance(df, DandisetMetadataFile):
-                continue
-            assert isinstance(df, LocalAsset)
-            relpath = posixpath.relpath(df.path, self.subpath.as_posix())
-            yield (AssetPath(df.path), relpath)
+        subpath = self.subpath.as_posix()
+        for path, _ in self._get_index().items_under(subpath if subpath_only else ""):
+            relpath = posixpath.relpath(path, subpath)
+            yield (AssetPath(str(path)), relpath)
 
     def get_path(self, path: str, is_src: bool = True) -> File | Folder:
         """
@@ -493,11 +593,8 @@ class LocalMover(LocalizedMover):
                         "Change to a different directory before moving this location."
                     )
                 files = [
-                    df.filepath.relative_to(p).as_posix()
-                    for df in find_dandi_files(
-                        p, dandiset_path=self.dandiset_path, allow_all=True
-                    )
-                    if isinstance(df, LocalAsset)
+                    posixpath.relpath(asset_path, rpath)
+                    for asset_path, _ in self._get_index().items_under(rpath)
                 ]
             else:
                 files = []
@@ -512,11 +609,18 @@ class LocalMover(LocalizedMover):
 
     def is_dir(self, path: AssetPath) -> bool:
         """Returns true if the given path points to a directory"""
+        index = self._get_index()
+        if index.is_dir(path) and path not in index:
+            return True
+        # Directories without any assets in them
         p = self.dandiset_path / path
         return p.is_dir() and p.suffix not in (".ngff", ".zarr")
 
     def is_file(self, path: AssetPath) -> bool:
         """Returns true if the given path points to an asset"""
+        if path in self._get_index():
+            return True
+        # Files that are not assets, e.g., dotfiles
         p = self.dandiset_path / path
         return (
             p.is_file()
@@ -531,37 +635,44 @@ class LocalMover(LocalizedMover):
         """
         lgr.debug("Moving local file %r to %r", src, dest)
         target = self.dandiset_path / dest
-        try:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            (self.dandiset_path / src).rename(target)
-        except Exception as e:
-            lgr.error(
-                "Failed to move local file %r to %r: %s: %s",
-                src,
-                dest,
-                type(e).__name__,
-                e,
-            )
-            raise
-        # Remove residual empty directories up to subpath
-        d = (self.dandiset_path / src).parent
-        while d != (self.dandiset_path / self.subpath) and not any(d.iterdir()):
+        with self._lock:
             try:
-                d.rmdir()
-            except OSError:
-                break
-            d = d.parent
+                target.parent.mkdir(parents=True, exist_ok=True)
+                (self.dandiset_path / src).rename(target)
+            except Exception as e:
+                lgr.error(
+                    "Failed to move local file %r to %r: %s: %s",
+                    src,
+                    dest,
+                    type(e).__name__,
+                    e,
+                )
+                raise
+            if self._index is not None and src in self._index:
+                self._index.prune(src)
+                self._index[dest] = True
+            # Remove residual empty directories up to subpath
+            d = (self.dandiset_path / src).parent
+            while d != (self.dandiset_path / self.subpath) and not any(d.iterdir()):
+                try:
+                    d.rmdir()
+                except OSError:
+                    break
+                d = d.parent
 
     def delete(self, path: AssetPath) -> None:
         """Delete the asset at ``path``"""
         lgr.debug("Deleting local file %r", path)
-        try:
-            (self.dandiset_path / path).unlink()
-        except Exception as e:
-            lgr.error(
-                "Failed to delete local file %r: %s: %s", path, type(e).__name__, e
-            )
-            raise
+        with self._lock:
+            try:
+                (self.dandiset_path / path).unlink()
+            except Exception as e:
+                lgr.error(
+                    "Failed to delete local file %r: %s: %s", path, type(e).__name__, e
+                )
+                raise
+            if self._index is not None:
+                self._index.prune(path)
 
 
 @dataclass
@@ -582,14 +693,20 @@ class RemoteMover(LocalizedMover):
     #: inside a `LocalRemoteMover`
     local_dandiset_path: Path | None = None
 
-    #: A collection of all assets in the Dandiset, keyed by their paths
-    assets: dict[AssetPath, RemoteAsset] = field(init=False)
+    #: A collection of all assets in the Dandiset, keyed by their paths; kept
+    #: up to date as assets are moved or deleted
+    assets: PathTrie[RemoteAsset] = field(init=False)
+
+    #: Guards `assets` against concurrent updates
+    _lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False
+    )
 
     def __post_init__(self) -> None:
         lgr.info("Fetching list of assets for Dandiset %s", self.dandiset.identifier)
-        self.assets = {}
+        self.assets = PathTrie()
         for asset in self.dandiset.get_assets():
-            self.assets[AssetPath(asset.path.strip("/"))] = asset
+            self.assets[asset.path.strip("/")] = asset
 
     @property
     def status_field(self) -> str:
@@ -610,11 +727,10 @@ class RemoteMover(LocalizedMover):
         starts with ``"../"``).  If ``subpath_only`` is true, only assets
         underneath `subpath` are returned.
         """
-        for path in self.assets.keys():
-            relpath = posixpath.relpath(path, self.subpath.as_posix())
-            if subpath_only and relpath.startswith("../"):
-                continue
-            yield (path, relpath)
+        subpath = self.subpath.as_posix()
+        for path, _ in self.assets.items_under(subpath if subpath_only else ""):
+            relpath = posixpath.relpath(path, subpath)
+            yield (AssetPath(str(path)), relpath)
 
     def get_path(self, path: str, is_src: bool = True) -> File | Folder:
         """
@@ -626,8 +742,6 @@ class RemoteMover(LocalizedMover):
         will be populated iff ``is_src`` is given.
         """
         rpath, needs_dir = self.resolve(path)
-        relcontents: list[str] = []
-        file_found = False
         if rpath == self.subpath.as_posix():
             if is_src:
                 raise ValueError(
@@ -636,19 +750,19 @@ class RemoteMover(LocalizedMover):
                 )
             else:
                 return Folder(rpath, [])
-        for p in self.assets.keys():
-            if p == rpath:
-                if needs_dir:
-                    file_found = True
-                else:
-                    return File(rpath)
-            elif p.startswith(f"{rpath}/"):
-                if is_src:
-                    relcontents.append(posixpath.relpath(p, rpath))
-                else:
-                    return Folder(rpath, [])
-        if relcontents:
-            return Folder(rpath, relcontents)
+        file_found = rpath in self.assets
+        if file_found and not needs_dir:
+            return File(rpath)
+        if self.assets.is_dir(rpath):
+            if is_src:
+                relcontents = [
+                    posixpath.relpath(p, rpath)
+                    for p, _ in self.assets.items_under(rpath)
+                    if str(p) != rpath
+                ]
+                return Folder(rpath, relcontents)
+            else:
+                return Folder(rpath, [])
         if needs_dir and file_found:
             raise ValueError(
                 f"Remote path {path!r} is a file but a directory was expected. "
@@ -673,7 +787,7 @@ class RemoteMover(LocalizedMover):
 
     def is_dir(self, path: AssetPath) -> bool:
         """Returns true if the given path points to a directory"""
-        return any(p.startswith(f"{path}/") for p in self.assets.keys())
+        return self.assets.is_dir(path)
 
     def is_file(self, path: AssetPath) -> bool:
         """Returns true if the given path points to an asset"""
@@ -686,17 +800,55 @@ class RemoteMover(LocalizedMover):
         """
         lgr.debug("Moving remote asset %r to %r", src, dest)
         assert src in self.assets
+        asset = self.assets[src]
+        # The client retries failed requests on its own; note whether it did
+        retried = False
+
+        def note_retry(_e: BaseException) -> None:
+            nonlocal retried
+            retried = True
+
         try:
-            self.assets[src].rename(dest)
+            with self.dandiset.client.retry_hook(note_retry):
+                asset.rename(dest)
         except Exception as e:
-            lgr.error(
-                "Failed to move remote asset %r to %r: %s: %s",
+            # If the response to a request was lost (or a retried request
+            # failed because an earlier attempt had succeeded), the asset may
+            # have been moved on the server regardless
+            moved: RemoteAsset | None = None
+            if retried or isinstance(e, requests.ConnectionError):
+                moved = self._get_moved(dest)
+            if moved is None:
+                lgr.error(
+                    "Failed to move remote asset %r to %r: %s: %s",
+                    src,
+                    dest,
+                    type(e).__name__,
+                    e,
+                )
+                raise
+            lgr.debug(
+                "Remote asset %r was moved to %r despite error: %s: %s",
                 src,
                 dest,
                 type(e).__name__,
                 e,
             )
-            raise
+            asset = moved
+        with self._lock:
+            self.assets.prune(src)
+            self.assets[dest] = asset
+
+    def _get_moved(self, dest: AssetPath) -> RemoteAsset | None:
+        """
+        Return the asset now at ``dest`` on the server, which (as destinations
+        are vacant before moving) can only be the one being moved there, or
+        `None` if there is none or the server cannot be queried
+        """
+        try:
+            return self.dandiset.get_asset_by_path(dest)
+        except Exception:
+            return None
 
     def delete(self, path: AssetPath) -> None:
         """Delete the asset at ``path``"""
@@ -709,6 +861,8 @@ class RemoteMover(LocalizedMover):
                 "Failed to delete remote asset %r: %s: %s", path, type(e).__name__, e
             )
             raise
+        with self._lock:
+            self.assets.prune(path)
 
 
 @dataclass  # type: ignore[misc]
@@ -812,6 +966,174 @@ class LocalRemoteMover(Mover):
         yield from self.remote.process_movement(m, dry_run)
 
 
+def order_movements(plan: list[Movement]) -> list[Movement]:
+    """
+    Arrange the movements in ``plan`` so that each one comes after the
+    movement (if any) that vacates its destination, and record the latter's
+    source in the former's `~Movement.after`.  Cycles of movements (e.g.,
+    swapping two assets) are broken by first moving one of their assets to a
+    temporary path in the same directory.
+    """
+    by_src = {m.src: m for m in plan if not m.skip}
+    token = uuid4().hex[:8]
+    ordered: list[Movement] = []
+    done: set[AssetPath] = set()
+
+    def after(m: Movement) -> AssetPath | None:
+        nxt = by_src.get(m.dest)
+        return None if nxt is None else nxt.src
+
+    for m in plan:
+        if m.skip:
+            ordered.append(m)
+            continue
+        # Follow the movements that have to be performed before `m`
+        chain: list[Movement] = []
+        onchain: set[AssetPath] = set()
+        cur: Movement | None = m
+        while cur is not None and cur.src not in done and cur.src not in onchain:
+            chain.append(cur)
+            onchain.add(cur.src)
+            cur = by_src.get(cur.dest)
+        done |= onchain
+        if cur is not None and cur.src in onchain:
+            i = chain.index(cur)
+            tmp = AssetPath(
+                posixpath.join(
+                    posixpath.dirname(cur.src),
+                    f"dandi-move-{token}-{posixpath.basename(cur.src)}",
+                )
+            )
+            lgr.debug(
+                "Breaking cycle of %d movements by moving %r to %r first",
+                len(chain) - i,
+                cur.src,
+                tmp,
+            )
+            ordered.append(Movement(cur.src, tmp))
+            ordered.extend(replace(c, after=after(c)) for c in reversed(chain[i + 1 :]))
+            ordered.append(replace(cur, src=tmp, after=after(cur)))
+            chain = chain[:i]
+        ordered.extend(replace(c, after=after(c)) for c in reversed(chain))
+    return ordered
+
+
+class MoveProgress:
+    """
+    Tracks which movements in a plan have finished so that movements can wait
+    for the ones they depend on, optionally recording completed movements in a
+    `MoveJournal`
+    """
+
+    def __init__(self, plan: list[Movement], journal: MoveJournal | None = None):
+        self._finished = {m.src: threading.Event() for m in plan}
+        self._failed: set[AssetPath] = set()
+        self._lock = threading.Lock()
+        self.journal = journal
+
+    @property
+    def nfailed(self) -> int:
+        """
+        The number of movements that have failed or were skipped due to the
+        failure of a movement they depended on
+        """
+        return len(self._failed)
+
+    def wait(self, m: Movement) -> bool:
+        """
+        Wait for the movement that ``m`` depends on (if any) to finish, and
+        return true iff it did not fail
+        """
+        if m.after is None or m.after not in self._finished:
+            # Movements not in the plan were completed by an earlier run
+            return True
+        self._finished[m.after].wait()
+        return m.after not in self._failed
+
+    def finish(self, m: Movement, ok: bool) -> None:
+        """Record that ``m`` has finished, successfully or not"""
+        if ok:
+            if self.journal is not None:
+                self.journal.record(m)
+        else:
+            with self._lock:
+                self._failed.add(m.src)
+        self._finished[m.src].set()
+
+
+class MoveJournal:
+    """
+    A record, kept in the user's state directory, of the plan of movements
+    being performed on a remote Dandiset and of which of them have been
+    completed, so that an interrupted `move()` can be resumed.  The journal is
+    a JSON Lines file whose first line holds the plan and whose subsequent
+    lines each hold the source path of a completed movement.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_dandiset(cls, dandiset: RemoteDandiset) -> MoveJournal:
+        """Return the journal for moves in the given remote Dandiset"""
+        key = hashlib.md5(dandiset.client.api_url.encode("utf-8")).hexdigest()[:8]
+        return cls(
+            Path(
+                platformdirs.user_state_dir("dandi-cli", "dandi"),
+                "move",
+                f"{dandiset.identifier}-{key}.jsonl",
+            )
+        )
+
+    def load(self) -> list[Movement] | None:
+        """
+        Return the movements in the journaled plan that have not been
+        completed (marked as `~Movement.resumed`), or `None` if there is no
+        journal
+        """
+        try:
+            with self.path.open(encoding="utf-8") as fp:
+                lines = [json.loads(line) for line in fp if line.strip()]
+        except FileNotFoundError:
+            return None
+        if not lines or "plan" not in lines[0]:
+            raise ValueError(f"Corrupt move journal {self.path}")
+        completed = {ln["done"] for ln in lines[1:] if "done" in ln}
+        return [
+            Movement(**m, resumed=True)
+            for m in lines[0]["plan"]
+            if m["src"] not in completed
+        ]
+
+    def start(self, plan: list[Movement]) -> None:
+        """Begin a new journal for the given plan"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "plan": [
+                {
+                    "src": m.src,
+                    "dest": m.dest,
+                    "skip": m.skip,
+                    "delete": m.delete,
+                    "after": m.after,
+                }
+                for m in plan
+            ]
+        }
+        with self.path.open("w", encoding="utf-8") as fp:
+            print(json.dumps(entry), file=fp)
+
+    def record(self, m: Movement) -> None:
+        """Record that the movement ``m`` has been completed"""
+        with self._lock, self.path.open("a", encoding="utf-8") as fp:
+            print(json.dumps({"done": m.src}), file=fp)
+
+    def finish(self) -> None:
+        """Delete the journal once all of its movements have been completed"""
+        self.path.unlink(missing_ok=True)
+
+
 def move(
     *srcs: str,
     dest: str,
@@ -823,14 +1145,16 @@ def move(
     devel_debug: bool = False,
     jobs: int | None = None,
     dry_run: bool = False,
+    resume: bool = False,
 ) -> None:
-    if not srcs:
+    if not srcs and not resume:
         raise ValueError("No source paths given")
     if dandiset is None:
         dandiset = Path()
     with ExitStack() as stack:
         mover: Mover
         client: DandiAPIClient | None = None
+        journal: MoveJournal | None = None
         if work_on is MoveWorkOn.AUTO:
             work_on = (
                 MoveWorkOn.REMOTE if isinstance(dandiset, str) else MoveWorkOn.BOTH
@@ -845,6 +1169,7 @@ def move(
             remote_ds = client.get_dandiset(
                 local_ds.identifier, version_id="draft", lazy=False
             )
+            journal = MoveJournal.for_dandiset(remote_ds)
             mover = LocalRemoteMover(
                 local=LocalMover(
                     dandiset_path=Path(local_ds.path),
@@ -876,6 +1201,7 @@ def move(
                 remote_ds = client.get_dandiset(
                     local_ds.identifier, version_id="draft", lazy=False
                 )
+            journal = MoveJournal.for_dandiset(remote_ds)
             mover = RemoteMover(dandiset=remote_ds, subpath=subpath)
         elif work_on is MoveWorkOn.LOCAL:
             if isinstance(dandiset, str):
@@ -884,31 +1210,66 @@ def move(
             mover = LocalMover(dandiset_path=Path(local_ds.path), subpath=subpath)
         else:
             raise AssertionError(f"Unexpected value for 'work_on': {work_on!r}")
-        if regex:
-            try:
-                (find,) = srcs
-            except ValueError:
+        pending = journal.load() if journal is not None else None
+        if resume:
+            if journal is None:
+                raise ValueError("Only moves in a remote Dandiset can be resumed")
+            if pending is None:
+                raise ValueError("There is no interrupted move to resume")
+            plan = pending
+        else:
+            if pending is not None:
+                assert journal is not None
                 raise ValueError(
-                    "Cannot take multiple source paths when `regex` is True"
+                    f"An interrupted move has {len(pending)} movement(s) left to"
+                    " perform.  Complete it with `--resume` or discard it by"
+                    f" deleting {journal.path}"
                 )
-            plan = mover.calculate_moves_by_regex(find, dest, existing=existing)
-        else:
-            plan = mover.calculate_moves(*srcs, dest=dest, existing=existing)
+            if regex:
+                try:
+                    (find,) = srcs
+                except ValueError:
+                    raise ValueError(
+                        "Cannot take multiple source paths when `regex` is True"
+                    )
+                plan = mover.calculate_moves_by_regex(find, dest, existing=existing)
+            else:
+                plan = mover.calculate_moves(*srcs, dest=dest, existing=existing)
+            plan = order_movements(plan)
+        if dry_run:
+            journal = None
         if not plan:
             lgr.info("Nothing to move")
+            if journal is not None:
+                journal.finish()
             return
+        if journal is not None and not resume:
+            journal.start(plan)
+        progress = MoveProgress(plan, journal)
         if devel_debug:
-            for gen in mover.process_moves_debug(plan, dry_run):
+            for gen in mover.process_moves_debug(plan, dry_run, progress):
                 for r in gen:
                     print(r, flush=True)
         else:
+            # Movements are handed to pyout's worker pool (of `jobs` threads)
+            # in dependency order, and the pool starts them in the order
+            # received, so a movement waiting on another never keeps the
+            # latter from running.
             pyout_style = pyouts.get_style(hide_if_missing=False)
             out = pyouts.LogSafeTabular(
                 style=pyout_style, columns=mover.columns, max_workers=jobs
             )
             with out:
-                for r in mover.process_moves_pyout(plan, dry_run):
+                for r in mover.process_moves_pyout(plan, dry_run, progress):
                     out(r)
+        if journal is not None:
+            if progress.nfailed:
+                lgr.warning(
+                    "%d movement(s) failed; retry them with `--resume`",
+                    progress.nfailed,
+                )
+            else:
+                journal.finish()
 
 
 def find_dandiset_and_subpath(path: Path) -> tuple[Dandiset, Path]:
@@ -13,15 +13,17 @@ from __future__ import annotations
 
 import binascii
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from copy import deepcopy
 from enum import StrEnum
+import json
 import os
 import os.path as op
 from pathlib import Path, PurePosixPath
 import posixpath
 import re
-import traceback
+from typing import Any
 import uuid
 
 import ruamel.yaml
@@ -30,11 +32,11 @@ from . import get_logger
 from .consts import dandi_layout_fields
 from .dandiset import Dandiset
 from .exceptions import OrganizeImpossibleError
+from .metadata.extractor import MetadataExtractor, get_metadata_extractor
 from .utils import (
     AnyPath,
-    Parallel,
+    clone_file,
     copy_file,
-    delayed,
     ensure_datetime,
     find_files,
     flattened,
@@ -42,6 +44,7 @@ from .utils import (
     load_jsonl,
     move_file,
     pluralize,
+    reflink_file,
     yaml_load,
 )
 from .validate._types import (
@@ -61,6 +64,7 @@ class FileOperationMode(StrEnum):
     MOVE = "move"
     HARDLINK = "hardlink"
     SYMLINK = "symlink"
+    REFLINK = "reflink"
     AUTO = "auto"
 
     def as_copy_mode(self) -> CopyMode:
@@ -73,6 +77,7 @@ class CopyMode(StrEnum):
     COPY = "copy"
     MOVE = "move"
     HARDLINK = "hardlink"
+    REFLINK = "reflink"
 
     def copy(self, old_path: AnyPath, new_path: AnyPath) -> None:
         if self is CopyMode.SYMLINK:
@@ -83,6 +88,8 @@ class CopyMode(StrEnum):
             copy_file(old_path, new_path)
         elif self is CopyMode.MOVE:
             move_file(old_path, new_path)
+        elif self is CopyMode.REFLINK:
+            reflink_file(old_path, new_path)
         else:
             raise AssertionError(f"Unhandled CopyMode member: {self!r}")
 
@@ -94,6 +101,13 @@ class OrganizeInvalid(StrEnum):
 
 dandi_path = op.join("sub-{subject_id}", "{dandi_filename}")
 
+#: Path, relative to the root of a Dandiset, of the journal of the files that
+#: incremental runs of `organize()` have organized into it
+ORGANIZE_JOURNAL = op.join(".dandi", "organize.jsonl")
+
+#: Fields of organized records that are not stored in the journal's metadata
+_UNJOURNALED_FIELDS = ("path", "dandi_path", "dandi_filename", "external_file_objects")
+
 
 def filter_invalid_metadata_rows(metadata_rows):
     """Split into two lists - valid and invalid entries"""
@@ -135,6 +149,25 @@ def create_unique_filenames_from_metadata(
     # side effects to original metadata
     metadata = deepcopy(metadata)
 
+    # TODO this does not act in a greedy fashion
+    # i.e., only using enough fields to ensure uniqueness of filenames, but that
+    # greedy field set could break if another file is incrementally added to the set
+    # of filenames from which the greedy fields were determined.
+
+    # TODO what to do if not all files have values for the same set of fields, i.e. some rows
+    # are empty for certain fields?
+
+    _prepare_records(metadata, required_fields)
+    unique_values = _assign_dandi_names(metadata)
+    _disambiguate_dandi_names(metadata, unique_values)
+    return metadata
+
+
+def _prepare_records(metadata, required_fields=None):
+    """
+    Add the layout fields deduced from other metadata to the records (in
+    place) and sanitize them, as needed before assigning DANDI names
+    """
     # sanity check -- should all be known
     if required_fields:
         unknown = set(required_fields).difference(dandi_layout_fields)
@@ -144,14 +177,6 @@ def create_unique_filenames_from_metadata(
                 f"  Known fields are: {', '.join(dandi_layout_fields)}"
             )
 
-    # TODO this does not act in a greedy fashion
-    # i.e., only using enough fields to ensure uniqueness of filenames, but that
-    # greedy field set could break if another file is incrementally added to the set
-    # of filenames from which the greedy fields were determined.
-
-    # TODO what to do if not all files have values for the same set of fields, i.e. some rows
-    # are empty for certain fields?
-
     #
     # Additional fields
     #
@@ -180,13 +205,19 @@ def create_unique_filenames_from_metadata(
         if required_fields:
             r.setdefault("_required_if_not_empty", []).extend(required_fields)
 
-    _assign_dandi_names(metadata)
 
+def _disambiguate_dandi_names(metadata, unique_values):
+    """
+    Rename the records (in place) that were assigned the same ``dandi_path``
+    by adding disambiguation fields to their names, raising
+    `OrganizeImpossibleError` if that does not suffice
+    """
     non_unique = _get_non_unique_paths(metadata)
 
     additional_nonunique = []
 
     if non_unique:
+        by_path = _group_by(metadata, "path")
         # Consider additional fields which might provide disambiguation
         # but which we otherwise do not include ATM
         for field, field_rec in dandi_layout_fields.items():
@@ -201,18 +232,22 @@ def create_unique_filenames_from_metadata(
             # The use case of 000022 - there is a common to many probes file (has many probe_ids)
             # but listing them all in filename -- does not scale, so we only limit to where
             # needs disambiguation.
-            # Cconsider conflicting groups and adjust their records
+            # Cconsider conflicting groups and adjust their records.  Only the
+            # names of records in a conflicting group can change, so only
+            # those are reassigned, and records are looked up via their
+            # current dandi_path (which renames within this loop may change).
+            by_dandi_path = _group_by(metadata, "dandi_path")
             for conflicting_path, paths in non_unique.items():
                 # I think it might not work out entirely correctly if we have multiple
                 # instances of non-unique, but then will consider not within each group...
                 # yoh: TODO
-                values = _get_unique_values_among_non_unique(metadata, paths, field)
+                values = _get_unique_values_among_non_unique(by_path, paths, field)
                 if values:  # helps disambiguation, but might still be non-unique
                     # add to all files in the group
-                    for r in metadata:
-                        if r["dandi_path"] == conflicting_path:
-                            r.setdefault("_required_if_not_empty", []).append(field)
-                _assign_dandi_names(metadata)
+                    for r in by_dandi_path.pop(conflicting_path, []):
+                        r.setdefault("_required_if_not_empty", []).append(field)
+                        _assign_dandi_name(r, unique_values)
+                        by_dandi_path.setdefault(r["dandi_path"], []).append(r)
             non_unique = _get_non_unique_paths(metadata)
             if not non_unique:
                 break
@@ -232,7 +267,149 @@ def create_unique_filenames_from_metadata(
             "Please adjust/provide metadata in your .nwb files to disambiguate"
             % (", ".join(additional_nonunique),)
         )
-    return metadata
+
+
+def _create_unique_filenames_incrementally(
+    metadata: list[dict],
+    organized: list[dict],
+    dandiset_path: str,
+    required_fields: Sequence[str] | None = None,
+) -> tuple[list[dict], list[tuple[dict, dict]]]:
+    """Create unique filenames for new files alongside already organized ones
+
+    The records in ``metadata`` are named like by
+    `create_unique_filenames_from_metadata()`, with the values of the layout
+    fields of the already organized files (given by their ``organized``
+    journal entries) taken into account, but without renaming the latter.
+    Only where a name is taken, by an organized file or by another new file,
+    is that group of files disambiguated, which might rename the organized
+    file in it as well.
+
+    Returns
+    -------
+    tuple of list of dict, list of (dict, dict)
+      The adjusted copy of ``metadata``, and the journal entries of the
+      organized files that need renaming paired with their renamed records
+    """
+    metadata = deepcopy(metadata)
+    _prepare_records(metadata, required_fields)
+    existing = [
+        # The organized file itself serves as the source, e.g., for obj_id
+        dict(
+            e["metadata"],
+            path=op.join(dandiset_path, e["dandi_path"]),
+            dandi_path=e["dandi_path"],
+        )
+        for e in organized
+    ]
+    unique_values = _get_unique_values(existing + metadata, dandi_layout_fields)
+    for r in metadata:
+        _assign_dandi_name(r, unique_values)
+    taken = {r["dandi_path"]: (e, r) for e, r in zip(organized, existing)}
+    renames = []
+    for path, records in _group_by(metadata, "dandi_path").items():
+        if path in taken:
+            entry, old = taken[path]
+            _disambiguate_dandi_names([old] + records, unique_values)
+            if old["dandi_path"] != path:
+                renames.append((entry, old))
+        elif len(records) > 1:
+            _disambiguate_dandi_names(records, unique_values)
+    # Disambiguating one group could have run into the names of others
+    final_paths = [r["dandi_path"] for r in metadata] + [
+        r["dandi_path"] for r in existing
+    ]
+    if len(set(final_paths)) != len(final_paths):
+        non_unique = [p for p, c in Counter(final_paths).items() if c > 1]
+        raise OrganizeImpossibleError(
+            "%d paths would not be unique when incrementally organizing: %s."
+            "  Please organize without --incremental"
+            % (len(non_unique), ", ".join(non_unique[:5]))
+        )
+    return metadata, renames
+
+
+def _journal_entry(r: dict, source: str, identity: dict[str, Any]) -> dict:
+    """The journal entry for the source file ``source`` organized as ``r``"""
+    return {
+        "path": op.abspath(source),
+        "size": identity["size"],
+        "mtime_ns": identity["mtime_ns"],
+        "dandi_path": r["dandi_path"],
+        "metadata": {k: v for k, v in r.items() if k not in _UNJOURNALED_FIELDS},
+    }
+
+
+def _source_identity(path: str) -> dict[str, int]:
+    """The properties of a source file that identify its version"""
+    s = os.stat(path)
+    return {"size": s.st_size, "mtime_ns": s.st_mtime_ns}
+
+
+def _load_organize_journal(dandiset_path: str) -> dict[str, dict]:
+    """
+    Load the `ORGANIZE_JOURNAL` of a Dandiset, keyed by the absolute paths of
+    the source files.  For each organized path, only the latest entry is
+    retained, and only if the organized file still exists.
+    """
+    entries: dict[str, dict] = {}
+    try:
+        with open(op.join(dandiset_path, ORGANIZE_JOURNAL)) as fp:
+            for line in fp:
+                try:
+                    e = json.loads(line)
+                except ValueError:
+                    # E.g., the last line written by an interrupted run
+                    lgr.warning("Skipping corrupted organize journal entry")
+                    continue
+                # Move to the end so that the latest entries win below
+                entries.pop(e["path"], None)
+                entries[e["path"]] = e
+    except FileNotFoundError:
+        return {}
+    by_target = {e["dandi_path"]: e for e in entries.values()}
+    return {
+        e["path"]: e
+        for e in by_target.values()
+        if op.lexists(op.join(dandiset_path, e["dandi_path"]))
+    }
+
+
+def _append_organize_journal(dandiset_path: str, entries: list[dict]) -> None:
+    if not entries:
+        return
+    journal_path = op.join(dandiset_path, ORGANIZE_JOURNAL)
+    os.makedirs(op.dirname(journal_path), exist_ok=True)
+    with open(journal_path, "a") as fp:
+        for e in entries:
+            fp.write(json.dumps(e, default=str) + "\n")
+
+
+def _split_organized(
+    paths: Sequence[str], journal: dict[str, dict], dandiset_path: str
+) -> tuple[list[str], list[dict]]:
+    """
+    Split source ``paths`` into those that are new or have changed since
+    they were organized, and the journal entries of the others.  A source
+    that is itself an organized file (as when organizing in-place) is
+    matched by its organized path.
+    """
+    by_target = {
+        op.abspath(op.join(dandiset_path, e["dandi_path"])): e for e in journal.values()
+    }
+    new: list[str] = []
+    organized: list[dict] = []
+    for p in paths:
+        abspath = op.abspath(p)
+        e = journal.get(abspath) or by_target.get(abspath)
+        if e is not None and _source_identity(p) == {
+            "size": e["size"],
+            "mtime_ns": e["mtime_ns"],
+        }:
+            organized.append(e)
+        else:
+            new.append(p)
+    return new, organized
 
 
 def _create_external_file_names(metadata: list[dict]) -> list[dict]:
@@ -369,15 +546,27 @@ def _get_hashable(v):
         return v
 
 
-def _get_unique_values_among_non_unique(metadata, non_unique_paths, field):
-    """Per each non-unique path return values"""
+def _get_unique_values_among_non_unique(by_path, non_unique_paths, field):
+    """Per each non-unique path return values
+
+    ``by_path`` maps each original path to its records (see `_group_by()`)
+    """
     return {
         _get_hashable(r.get(field))
-        for r in metadata
-        if (r["path"] in non_unique_paths) and not is_undefined(r.get(field))
+        for p in set(non_unique_paths)
+        for r in by_path.get(p, [])
+        if not is_undefined(r.get(field))
     }
 
 
+def _group_by(metadata, field):
+    """Map each value of ``field`` to the records with it, in order"""
+    groups = {}
+    for r in metadata:
+        groups.setdefault(r[field], []).append(r)
+    return groups
+
+
 def get_obj_id(object_id):
     """Given full object_id, get its shortened version"""
     # Avoid heavy import by importing within function:
@@ -392,35 +581,47 @@ def is_undefined(value):
 
 
 def _assign_dandi_names(metadata):
+    """
+    Assign ``dandi_filename`` & ``dandi_path`` to all records, and return the
+    unique values of the layout fields among them, which `_assign_dandi_name()`
+    can be passed to rename some of the records as long as none of the
+    (non-disambiguation) layout fields' values change.
+    """
     unique_values = _get_unique_values(metadata, dandi_layout_fields)
+    for r in metadata:
+        _assign_dandi_name(r, unique_values)
+    return unique_values
+
+
+def _assign_dandi_name(r, unique_values):
     # unless it is required, we would not include the fields with more than a
     # single unique field
-    for r in metadata:
-        dandi_filename = ""
-        for field, field_rec in dandi_layout_fields.items():
-            field_format = field_rec["format"]
-            field_type = field_rec.get("type", "additional")
-            if (
-                (field_type == "required")
-                or (field_type == "additional" and len(unique_values[field]) > 1)
-                or (
-                    field_type == "required_if_not_empty"
-                    or (field in r.get("_required_if_not_empty", []))
-                )
-            ):
-                value = r.get(field, None)
-                if is_undefined(value):
-                    # skip empty things
-                    continue
-                if isinstance(value, (list, tuple)):
-                    value = "+".join(map(str, value))
-                # sanitize value to avoid undesired characters
-                value = _sanitize_value(value, field)
-                # Format _key-value according to the "schema"
-                formatted_value = field_format.format(value)
-                dandi_filename += formatted_value
-        r["dandi_filename"] = dandi_filename
-        r["dandi_path"] = dandi_path.format(**r)
+    dandi_filename = ""
+    required_if_not_empty = r.get("_required_if_not_empty", [])
+    for field, field_rec in dandi_layout_fields.items():
+        field_format = field_rec["format"]
+        field_type = field_rec.get("type", "additional")
+        if (
+            (field_type == "required")
+            or (field_type == "additional" and len(unique_values[field]) > 1)
+            or (
+                field_type == "required_if_not_empty"
+                or (field in required_if_not_empty)
+            )
+        ):
+            value = r.get(field, None)
+            if is_undefined(value):
+                # skip empty things
+                continue
+            if isinstance(value, (list, tuple)):
+                value = "+".join(map(str, value))
+            # sanitize value to avoid undesired characters
+            value = _sanitize_value(value, field)
+            # Format _key-value according to the "schema"
+            formatted_value = field_format.format(value)
+            dandi_filename += formatted_value
+    r["dandi_filename"] = dandi_filename
+    r["dandi_path"] = dandi_path.format(**r)
 
 
 def _get_unique_values(metadata, fields, filter_=False):
@@ -432,13 +633,16 @@ def _get_unique_values(metadata, fields, filter_=False):
     return unique_values
 
 
+_NONCOMPLIANT_RGX = re.compile(r"[_*\\/<>:|\"'?%@;,\s]")
+
+
 def _sanitize_value(value, field):
     """Replace all "non-compliant" characters with -
 
     Of particular importance is _ which we use, as in BIDS, to separate
     _key-value entries
     """
-    value = re.sub(r"[_*\\/<>:|\"'?%@;,\s]", "-", value)
+    value = _NONCOMPLIANT_RGX.sub("-", value)
     if field != "extension":
         value = value.replace(".", "-")
     return value
@@ -706,20 +910,11 @@ def _get_non_unique_paths(metadata):
        of dandi_path: list(orig paths)
     """
     # Verify that we got unique paths
-    all_paths = [m["dandi_path"] for m in metadata]
-    all_paths_unique = set(all_paths)
-    non_unique = {}
-    if not len(all_paths) == len(all_paths_unique):
-        counts = Counter(all_paths)
-        non_unique = {p: c for p, c in counts.items() if c > 1}
-        # Let's prepare informative listing
-        for p in non_unique:
-            orig_paths = []
-            for e in metadata:
-                if e["dandi_path"] == p:
-                    orig_paths.append(e["path"])
-            non_unique[p] = orig_paths  # overload with the list instead of count
-    return non_unique
+    return {
+        p: [e["path"] for e in records]
+        for p, records in _group_by(metadata, "dandi_path").items()
+        if len(records) > 1
+    }
 
 
 def detect_link_type(srcfile: AnyPath, destdir: AnyPath) -> FileOperationMode:
@@ -727,7 +922,8 @@ def detect_link_type(srcfile: AnyPath, destdir: AnyPath) -> FileOperationMode:
     Determine what type of links the filesystem will let us make from the file
     ``srcfile`` to the directory ``destdir``.  If symlinks are allowed, returns
     ``"symlink"``.  Otherwise, if hard links are allowed, returns
-    ``"hardlink"``.  Otherwise, returns ``"copy"``.
+    ``"hardlink"``.  Otherwise, if reflinks (copy-on-write clones) are
+    supported, returns ``"reflink"``.  Otherwise, returns ``"copy"``.
     """
     destfile = Path(destdir, f".dandi.{os.getpid()}.dest")
     try:
@@ -737,10 +933,19 @@ def detect_link_type(srcfile: AnyPath, destdir: AnyPath) -> FileOperationMode:
             try:
                 os.link(srcfile, destfile)
             except OSError:
-                lgr.info(
-                    "Symlink and hardlink tests both failed; setting files_mode='copy'"
-                )
-                return FileOperationMode.COPY
+                try:
+                    clone_file(srcfile, destfile)
+                except OSError:
+                    lgr.info(
+                        "Symlink, hardlink, and reflink tests all failed;"
+                        " setting files_mode='copy'"
+                    )
+                    return FileOperationMode.COPY
+                else:
+                    lgr.info(
+                        "Reflink support autodetected; setting files_mode='reflink'"
+                    )
+                    return FileOperationMode.REFLINK
             else:
                 lgr.info(
                     "Hard link support autodetected; setting files_mode='hardlink'"
@@ -753,6 +958,58 @@ def detect_link_type(srcfile: AnyPath, destdir: AnyPath) -> FileOperationMode:
         destfile.unlink(missing_ok=True)
 
 
+def _is_same_file(path1: str, path2: str) -> bool:
+    """Return whether both paths exist and refer to the same file"""
+    try:
+        return op.samefile(path1, path2)
+    except OSError:
+        return False
+
+
+def _perform_file_operations(
+    ops: list[tuple[str, str]], files_mode: FileOperationMode, jobs: int | None
+) -> None:
+    """
+    Make the files at the destinations of ``ops`` (pairs of source &
+    destination paths) available per ``files_mode``, operating on up to
+    ``jobs`` files at once.  All destination directories are created before
+    any file is operated on.  If an operation fails, the ones that have not
+    started yet are cancelled, and the first error (in the order of ``ops``)
+    is raised.
+    """
+    func: Callable[[str, str], Any]
+    if files_mode is FileOperationMode.SIMULATE:
+        func = os.symlink
+    else:
+        func = files_mode.as_copy_mode().copy
+    # Sorted so that parents are created before their subdirectories
+    for dirpath in sorted({op.dirname(dst) for _, dst in ops}):
+        if not op.lexists(dirpath):
+            os.makedirs(dirpath)
+    if jobs == 1 or len(ops) < 2:
+        for src, dst in ops:
+            func(src, dst)
+        return
+    lgr.debug("Performing %d file operations in parallel", len(ops))
+    with ThreadPoolExecutor(
+        max_workers=jobs if jobs is not None and jobs > 0 else None
+    ) as pool:
+        futures = [pool.submit(func, src, dst) for src, dst in ops]
+        _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for fut in not_done:
+            fut.cancel()
+    for fut in futures:
+        if not fut.cancelled() and (exc := fut.exception()) is not None:
+            raise exc
+
+
+def _get_metadata(path: str) -> dict:
+    # Avoid heavy import by importing within function:
+    from .metadata.nwb import get_metadata
+
+    return get_metadata(path) or {}
+
+
 def organize(
     paths: Sequence[str],
     dandiset_path: str | None = None,
@@ -763,9 +1020,9 @@ def organize(
     media_files_mode: CopyMode | None = None,
     required_fields: Sequence[str] | None = None,
     jobs: int | None = None,
+    incremental: bool = False,
 ) -> None:
     in_place = False  # If we deduce that we are organizing in-place
-    jobs = jobs or -1
 
     # will come handy when dry becomes proper separate option
     def dry_print(msg):
@@ -833,6 +1090,13 @@ def organize(
         in_place = True
         paths = [dandiset_path]
 
+    # Journal entries of the files organized by previous incremental runs
+    journal: dict[str, dict] = {}
+    # Organized files of since modified sources, to be organized anew
+    stale: set[str] = set()
+    if incremental:
+        journal = _load_organize_journal(dandiset_path)
+
     if len(paths) == 1 and paths[0].endswith(".json"):
         # Our dumps of metadata
         metadata = load_jsonl(paths[0])
@@ -850,45 +1114,54 @@ def organize(
                 msg,
             )
             paths = list(set(paths))
+        if journal:
+            paths, organized = _split_organized(paths, journal, dandiset_path)
+            lgr.info(
+                "Skipping %d files already organized into %s",
+                len(organized),
+                dandiset_path,
+            )
+            if not paths:
+                lgr.info("No new or modified files to organize")
+                return
+            # Modified sources are organized anew, replacing their entries
+            # and (unless organizing in-place) their organized files
+            new_abspaths = {op.abspath(p) for p in paths}
+            unchanged = {}
+            for k, e in journal.items():
+                target = op.abspath(op.join(dandiset_path, e["dandi_path"]))
+                if target in new_abspaths:
+                    continue
+                elif k in new_abspaths:
+                    stale.add(target)
+                else:
+                    unchanged[k] = e
+            journal = unchanged
         link_test_file = paths[0] if paths else None
         lgr.info("Loading metadata from %d files", len(paths))
         # Done here so we could still reuse cached 'get_metadata'
         # without having two types of invocation and to guard against
         # problematic ones -- we have an explicit option on how to
         # react to those
-        # Doesn't play nice with Parallel
-        # with tqdm.tqdm(desc="Files", total=len(paths), unit="file", unit_scale=False) as pbar:
-
-        def _get_metadata(path):
-            # Avoid heavy import by importing within function:
-            from .metadata.nwb import get_metadata
-
-            meta, exc = {}, None
-            try:
-                meta = get_metadata(path)
-            except Exception as e:
-                exc = (
-                    e.__class__,
-                    str(e),
-                    traceback.TracebackException.from_exception(e),
-                )
-            # pbar.update(1)
-            meta["path"] = path
-            return meta, exc
-
-        if (
-            not devel_debug and jobs != 1 and not len(paths) == 1
-        ):  # Do not use joblib at all if number_of_jobs=1
-            # Note: It is Python (pynwb) intensive, not IO, so ATM there is little
-            # to no benefit from Parallel without using multiproc!  But that would
-            # complicate progress bar indication... TODO
-            metadata_excs = list(
-                Parallel(n_jobs=jobs, verbose=10)(
-                    delayed(_get_metadata)(path) for path in paths
-                )
-            )
+        # It is Python (pynwb) intensive, not IO, so extraction is done in
+        # separate processes
+        if devel_debug or len(paths) == 1:
+            extractor = MetadataExtractor(jobs=1)
         else:
-            metadata_excs = list(map(_get_metadata, paths))
+            extractor = get_metadata_extractor(jobs)
+        results: dict[str, Any] = {}
+        for r in extractor.map(_get_metadata, paths):
+            meta = r.value if r.value is not None else {}
+            meta["path"] = r.item
+            if r.error is not None:
+                results[r.item] = (
+                    meta,
+                    (r.error.exc_type, str(r.error.exc), r.error.traceback),
+                )
+            else:
+                results[r.item] = (meta, None)
+        # Restore the order of the paths so that the outcome is deterministic
+        metadata_excs = [results[path] for path in paths]
         exceptions = [e for _, e in metadata_excs if e]
         if exceptions:
             lgr.warning(
@@ -902,16 +1175,10 @@ def organize(
             for m, e in metadata_excs:
                 if not e:
                     continue
-                try:
-                    fmt = list(e[-1].format())
-                except AttributeError as exc:
-                    # Workaround:
-                    # https://github.com/agronholm/exceptiongroup/issues/144
-                    fmt = [f"Failed to get exception {e} format: {exc}"]
                 lgr.debug(
                     "Loading metadata for path %s resulted in following exception:\n%s",
                     m["path"],
-                    "\n".join(fmt),
+                    "".join(e[-1]),
                 )
 
     metadata, skip_invalid = filter_invalid_metadata_rows([m for m, _ in metadata_excs])
@@ -938,9 +1205,19 @@ def organize(
     if files_mode is FileOperationMode.AUTO:
         files_mode = detect_link_type(link_test_file, dandiset_path)
 
-    metadata = create_unique_filenames_from_metadata(
-        metadata, required_fields=required_fields
-    )
+    # (journal entry, renamed record) of organized files to rename
+    renames: list[tuple[dict, dict]] = []
+    if journal:
+        metadata, renames = _create_unique_filenames_incrementally(
+            metadata,
+            list(journal.values()),
+            dandiset_path,
+            required_fields=required_fields,
+        )
+    else:
+        metadata = create_unique_filenames_from_metadata(
+            metadata, required_fields=required_fields
+        )
 
     # update metadata with external_file information:
     external_files_missing_in_nwbfiles = [
@@ -985,18 +1262,39 @@ def organize(
 
     metadata = _create_external_file_names(metadata)
 
+    for entry, renamed in renames:
+        old_fullpath = op.join(dandiset_path, entry["dandi_path"])
+        new_fullpath = op.join(dandiset_path, renamed["dandi_path"])
+        if files_mode is FileOperationMode.DRY:
+            dry_print(f"{old_fullpath} -> {new_fullpath}")
+            continue
+        if op.lexists(new_fullpath):
+            raise AssertionError(f"{new_fullpath} already exists.  Remove it first.")
+        lgr.info(
+            "Renaming %s to %s to disambiguate it from new files",
+            old_fullpath,
+            new_fullpath,
+        )
+        # Disambiguation does not change the subject, and so the directory
+        os.rename(old_fullpath, new_fullpath)
+        _append_organize_journal(
+            dandiset_path, [_journal_entry(renamed, entry["path"], entry)]
+        )
+
+    if files_mode is not FileOperationMode.DRY:
+        for path in sorted(stale):
+            lgr.info("Removing %s organized from a since modified file", path)
+            os.unlink(path)
+
     # Verify first that the target paths do not exist yet, and fail if they do
     # Note: in "simulate" mode we do early check as well, so this would be
     # duplicate but shouldn't hurt
     existing = []
     for e in metadata:
         dandi_fullpath = op.join(dandiset_path, e["dandi_path"])
-        if op.lexists(dandi_fullpath):
+        if op.lexists(dandi_fullpath) and op.abspath(dandi_fullpath) not in stale:
             # It might be the same file, then we would not complain
-            if not (
-                op.realpath(e["path"])
-                == op.realpath(op.join(dandiset_path, e["dandi_path"]))
-            ):
+            if not _is_same_file(e["path"], dandi_fullpath):
                 existing.append(dandi_fullpath)
             # TODO: it might happen that with "move" we are renaming files
             # so there is an existing, which also gets moved away "first"
@@ -1018,7 +1316,17 @@ def organize(
         op.isabs(e["path"]) for e in metadata
     )
     skip_same = []
-    acted_upon = []
+    acted_upon: list[dict] = []
+    # (record, source path, destination path) of the files to operate on
+    planned: list[tuple[dict, str, str]] = []
+    journaling = incremental and files_mode not in (
+        FileOperationMode.DRY,
+        FileOperationMode.SIMULATE,
+    )
+    # Taken before any source is moved away
+    identities = (
+        {e["path"]: _source_identity(e["path"]) for e in metadata} if journaling else {}
+    )
     for e in metadata:
         dandi_path = e["dandi_path"]
         dandi_fullpath = op.join(dandiset_path, dandi_path)
@@ -1045,11 +1353,11 @@ def organize(
             lgr.debug("Skipping %s since the same in source/destination", e_path)
             skip_same.append(e)
             continue
-        elif files_mode is FileOperationMode.SYMLINK and op.realpath(
-            dandi_abs_fullpath
-        ) == op.realpath(e_abs_path):
+        elif _is_same_file(e_abs_path, dandi_abs_fullpath):
+            # E.g., the destination is a symlink or hard link to the source
+            # left by a previous run, possibly in a different mode
             lgr.debug(
-                "Skipping %s since mode is symlink and both resolve to the same path",
+                "Skipping %s since the destination is already the same file",
                 e_path,
             )
             skip_same.append(e)
@@ -1060,13 +1368,22 @@ def organize(
         ):  # TODO: this is actually a files_mode on top of modes!!!?
             dry_print(f"{e_path} -> {dandi_path}")
         else:
-            if not op.lexists(dandi_dirpath):
-                os.makedirs(dandi_dirpath)
-            if files_mode is FileOperationMode.SIMULATE:
-                os.symlink(e_path, dandi_fullpath)
-            else:
-                files_mode.as_copy_mode().copy(e_path, dandi_fullpath)
-                acted_upon.append(e)
+            planned.append((e, e_path, dandi_fullpath))
+
+    if planned:
+        _perform_file_operations(
+            [(src, dst) for _, src, dst in planned], files_mode, jobs
+        )
+        if files_mode is not FileOperationMode.SIMULATE:
+            acted_upon.extend(e for e, _, _ in planned)
+    if journaling:
+        _append_organize_journal(
+            dandiset_path,
+            [
+                _journal_entry(e, e["path"], identities[e["path"]])
+                for e in acted_upon + skip_same
+            ],
+        )
 
     if acted_upon and in_place:
         # We might need to cleanup a bit - e.g. prune empty directories left
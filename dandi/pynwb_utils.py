@@ -12,13 +12,15 @@ metadata from NWB files using PyNWB. Features include:
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Callable
-from datetime import timedelta
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 import inspect
 import os
 import os.path as op
 from pathlib import Path, PurePosixPath
 import re
+import threading
 from typing import IO, Any, TypeVar, cast
 import warnings
 
@@ -40,7 +42,7 @@ from .consts import (
     metadata_nwb_file_fields,
     metadata_nwb_subject_fields,
 )
-from .misctypes import Readable
+from .misctypes import LocalReadableFile, Readable
 from .utils import get_module_version, is_url
 from .validate._types import (
     Origin,
@@ -62,15 +64,165 @@ dandi_cache_tokens = [
     get_module_version(hdmf),
     get_module_version(h5py),
 ]
+#: Versions of the libraries that NWB metadata extraction depends on.  These
+#: are added to the fingerprints of `metadata_cache` entries and must be
+#: passed explicitly to functions memoized with ``metadata_cache.memoize``.
+metadata_cache_tokens = dandi_cache_tokens + [get_module_version(dandischema)]
 metadata_cache = PersistentCache(
-    name="dandi-metadata", tokens=dandi_cache_tokens, envvar="DANDI_CACHE"
+    name="dandi-metadata", tokens=metadata_cache_tokens, envvar="DANDI_CACHE"
 )
+#: Like `metadata_cache_tokens`, but for `validate_cache`
+validate_cache_tokens = dandi_cache_tokens + [get_module_version(dandischema)]
 validate_cache = PersistentCache(
-    name="dandi-validate",
-    tokens=dandi_cache_tokens + [get_module_version(dandischema)],
-    envvar="DANDI_CACHE",
+    name="dandi-validate", tokens=validate_cache_tokens, envvar="DANDI_CACHE"
 )
 
+T = TypeVar("T")
+
+
+class NWBFileSession:
+    """
+    An NWB file that is opened (at most) once and shared by everything that
+    needs to read it, along with the results derived from it.
+
+    Instances should be obtained via `nwb_file_session()`, which hands out the
+    same session to all nested users of the same file.  The file is only
+    opened on first access to `h5file`, `io`, or `nwbfile`, so errors opening
+    it are raised to the consumer rather than at session creation.
+    """
+
+    def __init__(self, path: str | Path | Readable) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._fp: IO[bytes] | None = None
+        self._h5file: h5py.File | None = None
+        self._io: NWBHDF5IO | None = None
+        self._validation_io: NWBHDF5IO | None = None
+        self._nwbfile: pynwb.NWBFile | None = None
+        self._results: dict[str, Any] = {}
+
+    @property
+    def h5file(self) -> h5py.File:
+        """The open `h5py.File`"""
+        with self._lock:
+            if self._h5file is None:
+                self._fp = open_readable(self.path)
+                try:
+                    self._h5file = h5py.File(self._fp, "r")
+                except BaseException:
+                    self._fp.close()
+                    self._fp = None
+                    raise
+            return self._h5file
+
+    @property
+    def io(self) -> NWBHDF5IO:
+        """An `NWBHDF5IO` for `h5file` with the file's cached namespaces loaded"""
+        with self._lock:
+            if self._io is None:
+                self._io = NWBHDF5IO(file=self.h5file, load_namespaces=True)
+            return self._io
+
+    @property
+    def validation_io(self) -> NWBHDF5IO:
+        """
+        An `NWBHDF5IO` for `h5file` whose build manager only knows the
+        namespaces cached in the file, as used by `pynwb.validate()` when
+        given a path
+        """
+        # Avoid heavy import by importing within function:
+        from pynwb.validation import get_cached_namespaces_to_validate
+
+        with self._lock:
+            if self._validation_io is None:
+                _, manager, _ = get_cached_namespaces_to_validate(io=self.io)
+                self._validation_io = NWBHDF5IO(
+                    file=self.h5file, mode="r", manager=manager
+                )
+            return self._validation_io
+
+    @property
+    def nwbfile(self) -> pynwb.NWBFile:
+        """
+        The `~pynwb.NWBFile` read from the file.  If reading fails, the file
+        is closed so that a later access (e.g., after importing a missing
+        extension) can retry from scratch.
+        """
+        with self._lock:
+            if self._nwbfile is None:
+                try:
+                    self._nwbfile = self.io.read()
+                except BaseException:
+                    self.close()
+                    raise
+            return self._nwbfile
+
+    def cached(self, key: str, func: Callable[[NWBFileSession], T]) -> T:
+        """
+        Return the result of ``func(self)``, computing it only the first time
+        ``key`` is requested for this session
+        """
+        with self._lock:
+            try:
+                return cast(T, self._results[key])
+            except KeyError:
+                value = self._results[key] = func(self)
+                return value
+
+    def close(self) -> None:
+        """Close the file.  Results already derived from it are kept."""
+        with self._lock:
+            # Closing either IO closes the shared h5py.File as well
+            for io in (self._validation_io, self._io):
+                if io is not None:
+                    io.close()
+            if self._h5file is not None:
+                self._h5file.close()
+            if self._fp is not None:
+                self._fp.close()
+            self._fp = self._h5file = self._io = self._validation_io = None
+            self._nwbfile = None
+
+
+_sessions: dict[Hashable, tuple[NWBFileSession, int]] = {}
+_sessions_lock = threading.Lock()
+
+
+def _file_identity(path: str | Path | Readable) -> Hashable:
+    if isinstance(path, LocalReadableFile):
+        path = path.filepath
+    elif isinstance(path, Readable):
+        # No cheap way to identify the content of a remote resource, so only
+        # share sessions between users of the same object
+        return ("readable", id(path))
+    st = os.stat(path)
+    return (op.realpath(path), st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+@contextmanager
+def nwb_file_session(path: str | Path | Readable) -> Iterator[NWBFileSession]:
+    """
+    Context manager providing an `NWBFileSession` for the given NWB file.  If
+    a session for the same file (as identified by its path, inode, size, and
+    modification time) is already open, e.g., further up the call stack, it
+    is reused; the file is closed when the outermost user exits.
+    """
+    key = _file_identity(path)
+    with _sessions_lock:
+        session, users = _sessions.get(key, (None, 0))
+        if session is None:
+            session = NWBFileSession(path)
+        _sessions[key] = (session, users + 1)
+    try:
+        yield session
+    finally:
+        with _sessions_lock:
+            session, users = _sessions.pop(key)
+            if users > 1:
+                _sessions[key] = (session, users - 1)
+            else:
+                session.close()
+
 
 def _sanitize_nwb_version(
     v: Any,
@@ -137,19 +289,27 @@ def get_nwb_version(
         def _sanitize(v: Any) -> str:
             return str(v)
 
-    with open_readable(filepath) as fp, h5py.File(fp, "r") as h5file:
-        # 2.x stored it as an attribute
-        try:
-            return _sanitize(h5file.attrs["nwb_version"])
-        except KeyError:
-            pass
+    with nwb_file_session(filepath) as session:
+        version = session.cached("nwb_version", _read_nwb_version)
+    if version is None:
+        lgr.debug("%s has no nwb_version", filepath)
+        return None
+    return _sanitize(version)
 
-        # 1.x stored it as a dataset
-        try:
-            return _sanitize(h5file["nwb_version"][...].tostring().decode())
-        except Exception:
-            lgr.debug("%s has no nwb_version", filepath)
-    return None
+
+def _read_nwb_version(session: NWBFileSession) -> Any:
+    h5file = session.h5file
+    # 2.x stored it as an attribute
+    try:
+        return h5file.attrs["nwb_version"]
+    except KeyError:
+        pass
+
+    # 1.x stored it as a dataset
+    try:
+        return h5file["nwb_version"][...].tostring().decode()
+    except Exception:
+        return None
 
 
 def get_neurodata_types_to_modalities_map() -> dict[str, str]:
@@ -195,8 +355,10 @@ def get_neurodata_types_to_modalities_map() -> dict[str, str]:
 
 @metadata_cache.memoize_path
 def get_neurodata_types(filepath: str | Path | Readable) -> list[str]:
-    with open_readable(filepath) as fp, h5py.File(fp, "r") as h5file:
-        all_pairs = _scan_neurodata_types(h5file)
+    with nwb_file_session(filepath) as session:
+        all_pairs = session.cached(
+            "neurodata_types", lambda s: _scan_neurodata_types(s.h5file)
+        )
 
     # so far descriptions are useless so let's just output actual names only
     # with a count if there is multiple
@@ -223,68 +385,445 @@ def _scan_neurodata_types(grp: h5py.File) -> list[tuple[Any, Any]]:
 
 
 def _get_pynwb_metadata(path: str | Path | Readable) -> dict[str, Any]:
+    with nwb_file_session(path) as session:
+        return dict(session.cached("pynwb_metadata", _read_nwb_metadata))
+
+
+def _read_nwb_metadata(session: NWBFileSession) -> dict[str, Any]:
+    """
+    Read the NWB metadata fields straight from HDF5 if possible, falling back
+    to constructing the full pynwb object graph only for the fields that could
+    not be resolved that way
+    """
+    try:
+        fast = _read_h5py_metadata(session)
+    except Exception as exc:
+        lgr.debug(
+            "%s: Failed to read metadata via h5py: %s: %s",
+            session.path,
+            type(exc).__name__,
+            exc,
+        )
+        fast = None
+    if fast is None:
+        return _read_pynwb_metadata(session)
+    out, unresolved = fast
+    if unresolved:
+        lgr.debug(
+            "%s: Reading %s via pynwb", session.path, ", ".join(sorted(unresolved))
+        )
+        full = _read_pynwb_metadata(session)
+        for key in unresolved:
+            if key in full:
+                out[key] = full[key]
+            else:
+                out.pop(key, None)
+    return out
+
+
+def _read_pynwb_metadata(session: NWBFileSession) -> dict[str, Any]:
     out = {}
-    with open_readable(path) as fp, h5py.File(fp, "r") as h5, NWBHDF5IO(
-        file=h5, load_namespaces=True
-    ) as io:
-        nwb = io.read()
-        for key in metadata_nwb_file_fields:
-            value = getattr(nwb, key)
-            if isinstance(value, h5py.Dataset):
-                # serialize into a basic container (list), since otherwise
-                # it would be a closed Dataset upon return
-                value = list(value)
-            if isinstance(value, (list, tuple)) and all(
-                isinstance(v, bytes) for v in value
-            ):
-                value = type(value)(v.decode("utf-8") for v in value)
-            out[key] = value
-
-        # .subject can be None as the test shows
-        for subject_feature in metadata_nwb_subject_fields:
-            out[subject_feature] = getattr(nwb.subject, subject_feature, None)
-        # Add a few additional useful fields
-
-        # "Custom" DANDI extension by Ben for now to contain additional metadata
-        # not present in nwb-schema
-        dandi_icephys = getattr(nwb, "lab_meta_data", {}).get(
-            "DandiIcephysMetadata", None
+    nwb = session.nwbfile
+    for key in metadata_nwb_file_fields:
+        value = getattr(nwb, key)
+        if isinstance(value, h5py.Dataset):
+            # serialize into a basic container (list), since otherwise
+            # it would be a closed Dataset upon return
+            value = list(value)
+        if isinstance(value, (list, tuple)) and all(
+            isinstance(v, bytes) for v in value
+        ):
+            value = type(value)(v.decode("utf-8") for v in value)
+        out[key] = value
+
+    # .subject can be None as the test shows
+    for subject_feature in metadata_nwb_subject_fields:
+        out[subject_feature] = getattr(nwb.subject, subject_feature, None)
+    # Add a few additional useful fields
+
+    # "Custom" DANDI extension by Ben for now to contain additional metadata
+    # not present in nwb-schema
+    dandi_icephys = getattr(nwb, "lab_meta_data", {}).get("DandiIcephysMetadata", None)
+    if dandi_icephys:
+        out.update(dandi_icephys.fields)
+    # Go through devices and see if there any probes used to record this file
+    probe_ids = [
+        v.probe_id.item()  # .item to avoid numpy types
+        for v in getattr(nwb, "devices", {}).values()
+        if hasattr(v, "probe_id")  # duck typing
+    ]
+    if probe_ids:
+        out["probe_ids"] = probe_ids
+
+    # Counts
+    for f in metadata_nwb_computed_fields:
+        if f in ("nwb_version", "nd_types"):
+            continue
+        if not f.startswith("number_of_"):
+            raise NotImplementedError(
+                f"ATM can only compute number_of_ fields. Got {f}"
+            )
+        key = f[len("number_of_") :]
+        out[f] = len(getattr(nwb, key, []) or [])
+
+    # get external_file data:
+    out["external_file_objects"] = _get_image_series(nwb)
+
+    # Calculate session duration for metadata
+    session_duration = _get_session_duration(nwb)
+    if session_duration is not None and out.get("session_start_time") is not None:
+        # Convert to absolute datetime by adding duration to session_start_time
+        start_time = out["session_start_time"]
+        out["session_end_time"] = start_time + timedelta(seconds=session_duration)
+
+    return out
+
+
+class _Unresolved(Exception):
+    """Raised when a field cannot be determined from HDF5 alone"""
+
+
+#: Locations of the NWBFile fields that are read as-is by pynwb, relative to
+#: the root of the file
+_NWB_FILE_FIELD_PATHS = {
+    "identifier": "identifier",
+    "session_description": "session_description",
+    "session_start_time": "session_start_time",
+    **{
+        f: f"general/{f}"
+        for f in metadata_nwb_file_fields
+        if f not in ("identifier", "session_description", "session_start_time")
+    },
+}
+
+#: NWBFile fields that pynwb always returns as tuples
+_NWB_TUPLE_FIELDS = ("experimenter", "related_publications")
+
+#: Locations of the tables whose lengths are reported by the ``number_of_*``
+#: computed fields
+_NWB_TABLE_PATHS = {
+    "electrodes": "general/extracellular_ephys/electrodes",
+    "units": "units",
+}
+
+
+def _read_h5py_metadata(
+    session: NWBFileSession,
+) -> tuple[dict[str, Any], set[str]] | None:
+    """
+    Read the fields returned by `_read_pynwb_metadata()` directly from the
+    HDF5 attributes & datasets of an NWB file without building the pynwb
+    object graph.
+
+    Returns `None` if the file cannot be handled this way at all (e.g., NWB
+    1.x files or files with DANDI icephys metadata); otherwise, returns the
+    metadata along with the set of keys whose values could not be resolved and
+    must be obtained from pynwb instead.
+    """
+    h5 = session.h5file
+    if _h5_str(h5.attrs.get("neurodata_type")) != "NWBFile":
+        return None
+    if "general/DandiIcephysMetadata" in h5:
+        # Its fields are only known to the extension
+        return None
+    out: dict[str, Any] = {}
+    unresolved: set[str] = set()
+    for key, path in _NWB_FILE_FIELD_PATHS.items():
+        value = _h5_read(h5.get(path))
+        if key == "session_start_time":
+            value = _h5_datetime(value)
+        elif key in _NWB_TUPLE_FIELDS and value is not None:
+            value = (value,) if isinstance(value, str) else tuple(value)
+        out[key] = value
+    subject = h5.get("general/subject")
+    for key in metadata_nwb_subject_fields:
+        value = _h5_read(subject.get(key)) if subject is not None else None
+        if key == "date_of_birth" and value is not None:
+            value = _h5_datetime(value)
+        out[key] = value
+    probe_ids = []
+    devices = h5.get("general/devices")
+    for dev in devices.values() if devices is not None else []:
+        if "probe_id" in dev.attrs:
+            probe_ids.append(dev.attrs["probe_id"].item())
+        elif "probe_id" in dev:
+            probe_ids.append(dev["probe_id"][()].item())
+    if probe_ids:
+        out["probe_ids"] = probe_ids
+    for f in metadata_nwb_computed_fields:
+        if f in ("nwb_version", "nd_types"):
+            continue
+        if not f.startswith("number_of_"):
+            raise NotImplementedError(
+                f"ATM can only compute number_of_ fields. Got {f}"
+            )
+        key = f[len("number_of_") :]
+        try:
+            table = h5.get(_NWB_TABLE_PATHS[key])
+        except KeyError:
+            unresolved.add(f)
+            continue
+        out[f] = len(table["id"]) if table is not None else 0
+    try:
+        out["external_file_objects"] = _h5py_image_series(session)
+    except _Unresolved as exc:
+        lgr.debug("%s: %s", session.path, exc)
+        unresolved.add("external_file_objects")
+    try:
+        session_duration = _h5py_session_duration(session)
+    except _Unresolved as exc:
+        lgr.debug("%s: %s", session.path, exc)
+        unresolved.add("session_end_time")
+    else:
+        if session_duration is not None and out["session_start_time"] is not None:
+            out["session_end_time"] = out["session_start_time"] + timedelta(
+                seconds=session_duration
+            )
+    return (out, unresolved)
+
+
+def _h5_str(value: Any) -> str | None:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return None if value is None else str(value)
+
+
+def _h5_read(ds: h5py.Dataset | None) -> Any:
+    # Read a dataset the way pynwb presents it to `_read_pynwb_metadata()`:
+    # scalars as Python values, arrays as lists, and strings decoded
+    if ds is None:
+        return None
+    if not isinstance(ds, h5py.Dataset):
+        raise _Unresolved(f"{ds.name} is not a dataset")
+    if h5py.check_string_dtype(ds.dtype) is not None:
+        ds = ds.asstr()
+    value = ds[()]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    elif isinstance(value, np.generic):
+        return value.item()
+    else:
+        return value
+
+
+def _h5_datetime(value: Any) -> datetime | None:
+    # Avoid heavy import by importing within function:
+    from dateutil.parser import parse as parse_date
+    from dateutil.tz import tzlocal
+
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise _Unresolved(f"Cannot parse non-string date {value!r}")
+    dt = parse_date(value)
+    if dt.tzinfo is None:
+        # pynwb assumes the local timezone for naive timestamps
+        dt = dt.replace(tzinfo=tzlocal())
+    assert isinstance(dt, datetime)
+    return dt
+
+
+def _h5_container_cls(session: NWBFileSession, obj: Any) -> type | None:
+    # Return the pynwb/hdmf class for the neurodata type of an HDF5 object
+    ndtype = _h5_str(obj.attrs.get("neurodata_type"))
+    if ndtype is None:
+        return None
+    namespace = _h5_str(obj.attrs.get("namespace"))
+    try:
+        cls = session.io.manager.type_map.get_dt_container_cls(ndtype, namespace)
+    except Exception as exc:
+        raise _Unresolved(
+            f"Cannot resolve neurodata type {namespace}:{ndtype} of {obj.name}:"
+            f" {type(exc).__name__}: {exc}"
         )
-        if dandi_icephys:
-            out.update(dandi_icephys.fields)
-        # Go through devices and see if there any probes used to record this file
-        probe_ids = [
-            v.probe_id.item()  # .item to avoid numpy types
-            for v in getattr(nwb, "devices", {}).values()
-            if hasattr(v, "probe_id")  # duck typing
-        ]
-        if probe_ids:
-            out["probe_ids"] = probe_ids
-
-        # Counts
-        for f in metadata_nwb_computed_fields:
-            if f in ("nwb_version", "nd_types"):
+    assert isinstance(cls, type)
+    return cls
+
+
+def _h5py_image_series(session: NWBFileSession) -> list[dict]:
+    """
+    Equivalent of `_get_image_series()` that reads the ImageSeries directly
+    from HDF5
+    """
+    out = []
+    for module_name in VIDEO_FILE_MODULES:
+        module = session.h5file.get(module_name)
+        if module is None:
+            continue
+        for name, obj in module.items():
+            cls = _h5_container_cls(session, obj)
+            if cls is None or not issubclass(cls, pynwb.image.ImageSeries):
                 continue
-            if not f.startswith("number_of_"):
-                raise NotImplementedError(
-                    f"ATM can only compute number_of_ fields. Got {f}"
+            if "external_file" not in obj:
+                continue
+            out_dict = dict(
+                id=_h5_str(obj.attrs["object_id"]), name=name, external_files=[]
+            )
+            for ext_file in _h5_read(obj["external_file"]):
+                if (path := PurePosixPath(ext_file)).suffix in VIDEO_FILE_EXTENSIONS:
+                    out_dict["external_files"].append(path)
+                else:
+                    lgr.warning(
+                        "external file %s should be one of: %s",
+                        ext_file,
+                        ", ".join(VIDEO_FILE_EXTENSIONS),
+                    )
+            out.append(out_dict)
+    return out
+
+
+def _h5py_session_duration(session: NWBFileSession) -> float | None:
+    """
+    Equivalent of `_get_session_duration()` that reads the time information
+    directly from HDF5
+    """
+    start_times: list[float] = []
+    end_times: list[float] = []
+    budget = _ReadBudget()
+    objects: list[tuple[type, h5py.Group]] = []
+
+    def collect(_name: str, obj: h5py.Group | h5py.Dataset) -> None:
+        if isinstance(obj, h5py.Group):
+            cls = _h5_container_cls(session, obj)
+            if cls is not None:
+                objects.append((cls, obj))
+
+    session.h5file.visititems(collect)
+    for cls, obj in objects:
+        if issubclass(cls, pynwb.base.TimeSeries):
+            if "timestamps" in obj and len(obj["timestamps"]) > 0:
+                start_times.append(float(obj["timestamps"][0]))
+                end_times.append(float(obj["timestamps"][-1]))
+            elif (
+                "starting_time" in obj
+                and "rate" in obj["starting_time"].attrs
+                and "data" in obj
+            ):
+                starting_time = float(obj["starting_time"][()])
+                rate = float(obj["starting_time"].attrs["rate"])
+                start_times.append(starting_time)
+                num_samples = len(obj["data"])
+                if rate == 0:
+                    continue
+                end_times.append(starting_time + num_samples / rate)
+        elif issubclass(cls, hdmf.common.DynamicTable):
+            colnames = [_h5_str(c) for c in obj.attrs.get("colnames", [])]
+            for col in ("start_time", "stop_time", "timestamp", "duration"):
+                if col in colnames and f"{col}_index" in obj:
+                    raise _Unresolved(f"Ragged {col} column in {obj.name}")
+            if "start_time" in colnames and len(obj["start_time"]):
+                start_times.append(float(obj["start_time"][0]))
+            if "stop_time" in colnames and len(obj["stop_time"]):
+                end_times.append(float(obj["stop_time"][-1]))
+            if "spike_times" in colnames and len(obj["spike_times_index"]):
+                bounds = _spike_time_bounds(
+                    obj["spike_times_index"], obj["spike_times"], budget
                 )
-            key = f[len("number_of_") :]
-            out[f] = len(getattr(nwb, key, []) or [])
+                if bounds is not None:
+                    start_times.append(bounds[0])
+                    end_times.append(bounds[1])
+            if "timestamp" in colnames and len(obj["timestamp"]):
+                start_times.append(float(obj["timestamp"][0]))
+                if "duration" in colnames:
+                    end_times.append(float(obj["timestamp"][-1] + obj["duration"][-1]))
+                else:
+                    end_times.append(float(obj["timestamp"][-1]))
+    return _duration_from_bounds(start_times, end_times, budget)
 
-        # get external_file data:
-        out["external_file_objects"] = _get_image_series(nwb)
 
-        # Calculate session duration for metadata
-        session_duration = _get_session_duration(nwb)
-        if session_duration is not None and out.get("session_start_time") is not None:
-            # Convert to absolute datetime by adding duration to session_start_time
-            start_time = out["session_start_time"]
-            out["session_end_time"] = start_time + timedelta(seconds=session_duration)
+#: The maximum number of bytes of spike time data & indices that will be read
+#: when calculating the duration of a session from a single NWB file; beyond
+#: that, the duration is estimated from the first & last spike times
+SESSION_DURATION_READ_LIMIT = 64 * 1024**2
 
+#: The number of elements read at a time when gathering values from a
+#: contiguous (non-chunked) dataset
+_CONTIGUOUS_BLOCK_SIZE = 1 << 16
+
+
+class _ReadBudget:
+    """Tracks the bytes read out of `SESSION_DURATION_READ_LIMIT`"""
+
+    def __init__(self) -> None:
+        self.remaining = SESSION_DURATION_READ_LIMIT
+        #: Whether any read was skipped because it would exceed the limit
+        self.exceeded = False
+
+    def take(self, nbytes: int) -> bool:
+        if nbytes > self.remaining:
+            self.exceeded = True
+            return False
+        self.remaining -= nbytes
+        return True
+
+
+def _read_all(ds: Any, budget: _ReadBudget) -> np.ndarray | None:
+    if not isinstance(ds, h5py.Dataset):
+        return np.asarray(ds)
+    if not budget.take(ds.size * ds.dtype.itemsize):
+        return None
+    return cast(np.ndarray, ds[()])
+
+
+def _gather(ds: Any, indices: np.ndarray, budget: _ReadBudget) -> np.ndarray | None:
+    """
+    Return ``ds[indices]`` for sorted, unique ``indices``, reading each
+    chunk-aligned block of the dataset containing any of them only once.
+    Returns `None` if that would exceed the read budget.
+    """
+    if not isinstance(ds, h5py.Dataset):
+        return cast(np.ndarray, np.asarray(ds)[indices])
+    n = len(ds)
+    block = ds.chunks[0] if ds.chunks else _CONTIGUOUS_BLOCK_SIZE
+    blocks = np.unique(indices // block)
+    nelems = int(np.minimum((blocks + 1) * block, n).sum() - (blocks * block).sum())
+    if nelems >= n:
+        values = _read_all(ds, budget)
+        return values[indices] if values is not None else None
+    if not budget.take(nelems * ds.dtype.itemsize):
+        return None
+    out = np.empty(len(indices), dtype=ds.dtype)
+    # Positions in `indices` at which each block's entries begin & end
+    edges = np.r_[blocks * block, (blocks[-1] + 1) * block]
+    bounds = cast("list[int]", np.searchsorted(indices, edges).tolist())
+    for b, lo, hi in zip(blocks.tolist(), bounds[:-1], bounds[1:]):
+        start = b * block
+        data = ds[start : min(start + block, n)]
+        out[lo:hi] = data[indices[lo:hi] - start]
     return out
 
 
+def _spike_time_bounds(
+    index: Any, spike_times: Any, budget: _ReadBudget
+) -> tuple[float, float] | None:
+    """
+    Return the earliest and latest spike times in a ragged ``spike_times``
+    column, given its index & target data, assuming spike times are ordered
+    within each unit.  Only the first & last spike of each unit are read; if
+    that (or reading the index) would exceed the read budget, the first &
+    last spike times of the whole column are used as an estimate instead.
+    """
+    idxs = _read_all(index, budget)
+    if idxs is not None:
+        # Keep only boundaries where cumulative spike count increases.
+        # Non-spiking units repeat the prior cumulative index and are skipped.
+        unit_end_idxs = idxs[np.diff(np.r_[0, idxs]) > 0]
+        if len(unit_end_idxs) == 0:
+            return None
+        firsts = np.r_[0, unit_end_idxs[:-1]]
+        lasts = unit_end_idxs - 1
+        wanted = np.unique(np.r_[firsts, lasts])
+        values = _gather(spike_times, wanted, budget)
+        if values is not None:
+            return (
+                float(values[np.searchsorted(wanted, firsts)].min()),
+                float(values[np.searchsorted(wanted, lasts)].max()),
+            )
+    if not len(spike_times):
+        return None
+    return (float(spike_times[0]), float(spike_times[-1]))
+
+
 def _get_session_duration(nwb: pynwb.NWBFile) -> float | None:
     """Calculate the duration of a recording session from NWB file contents.
 
@@ -305,6 +844,7 @@ def _get_session_duration(nwb: pynwb.NWBFile) -> float | None:
     """
     start_times: list[float] = []
     end_times: list[float] = []
+    budget = _ReadBudget()
 
     # Iterate through all objects in the NWB file
     for obj in nwb.objects.values():
@@ -338,24 +878,12 @@ def _get_session_duration(nwb: pynwb.NWBFile) -> float | None:
             # Assume spike times are ordered within each unit
             # Read only the first and last spike time from each unit
             if "spike_times" in obj.colnames and len(obj["spike_times"]):
-                idxs = obj["spike_times"].data[:]
-                # Keep only boundaries where cumulative spike count increases.
-                # Non-spiking units repeat the prior cumulative index and are skipped.
-                unit_end_idxs = idxs[np.diff(np.r_[0, idxs]) > 0]
-
-                if len(unit_end_idxs) == 0:
-                    continue
-
-                st_data = obj["spike_times"].target
-
-                if len(unit_end_idxs) > 1:
-                    start = float(np.min(np.r_[st_data[0], st_data[unit_end_idxs[:-1]]]))
-                else:
-                    start = float(st_data[0])
-
-                end = float(np.max(st_data[unit_end_idxs - 1]))
-                start_times.append(float(start))
-                end_times.append(float(end))
+                bounds = _spike_time_bounds(
+                    obj["spike_times"].data, obj["spike_times"].target.data, budget
+                )
+                if bounds is not None:
+                    start_times.append(bounds[0])
+                    end_times.append(bounds[1])
 
             # Handle timestamp column (e.g., EventsTable)
             if "timestamp" in obj.colnames and len(obj["timestamp"]):
@@ -369,6 +897,18 @@ def _get_session_duration(nwb: pynwb.NWBFile) -> float | None:
                     # No duration, use max timestamp as end
                     end_times.append(float(timestamp_data[-1]))
 
+    return _duration_from_bounds(start_times, end_times, budget)
+
+
+def _duration_from_bounds(
+    start_times: list[float], end_times: list[float], budget: _ReadBudget
+) -> float | None:
+    if budget.exceeded:
+        lgr.info(
+            "Session duration was estimated: reading all spike time boundaries"
+            " would exceed the %d MiB I/O limit",
+            SESSION_DURATION_READ_LIMIT // 1024**2,
+        )
     # Return duration as max - min
     if start_times and end_times:
         duration = max(end_times) - min(start_times)
@@ -537,7 +1077,9 @@ def validate(path: str | Path, devel_debug: bool = False) -> list[ValidationResu
 
     try:
         if Version(pynwb.__version__) >= Version("3.0.0"):
-            error_outputs = pynwb.validate(path=path)
+            # Reuse the file if it is already open, e.g. by NWBAsset validation
+            with nwb_file_session(path) as session:
+                error_outputs = pynwb.validate(io=session.validation_io)
         elif Version(pynwb.__version__) >= Version(
             "2.2.0"
         ):  # Use cached namespace feature
@@ -615,8 +1157,8 @@ def get_object_id(path: str | Path | Readable) -> Any:
 
     if not available -- would simply raise a corresponding exception
     """
-    with open_readable(path) as fp, h5py.File(fp, "r") as f:
-        return f.attrs["object_id"]
+    with nwb_file_session(path) as session:
+        return session.h5file.attrs["object_id"]
 
 
 StrPath = TypeVar("StrPath", str, Path)
@@ -677,26 +1219,31 @@ def copy_nwb_file(src: str | Path, dest: str | Path) -> str:
 
 @metadata_cache.memoize_path
 def nwb_has_external_links(filepath: str | Path | Readable) -> bool:
-    with open_readable(filepath) as f, h5py.File(f, "r") as fp:
-        visited = set()
-
-        # cannot use `file.visititems` because it skips external links
-        # (https://github.com/h5py/h5py/issues/671)
-        def visit(path: str = "/") -> bool:
-            if isinstance(fp[path], h5py.Group):
-                for key in fp[path].keys():
-                    key_path = path + "/" + key
-                    if key_path not in visited:
-                        visited.add(key_path)
-                        if isinstance(
-                            fp.get(key_path, getlink=True), h5py.ExternalLink
-                        ) or visit(key_path):
-                            return True
-            elif isinstance(fp.get(path, getlink=True), h5py.ExternalLink):
-                return True
-            return False
-
-        return visit()
+    with nwb_file_session(filepath) as session:
+        return session.cached("has_external_links", _has_external_links)
+
+
+def _has_external_links(session: NWBFileSession) -> bool:
+    fp = session.h5file
+    visited = set()
+
+    # cannot use `file.visititems` because it skips external links
+    # (https://github.com/h5py/h5py/issues/671)
+    def visit(path: str = "/") -> bool:
+        if isinstance(fp[path], h5py.Group):
+            for key in fp[path].keys():
+                key_path = path + "/" + key
+                if key_path not in visited:
+                    visited.add(key_path)
+                    if isinstance(
+                        fp.get(key_path, getlink=True), h5py.ExternalLink
+                    ) or visit(key_path):
+                        return True
+        elif isinstance(fp.get(path, getlink=True), h5py.ExternalLink):
+            return True
+        return False
+
+    return visit()
 
 
 def open_readable(r: str | Path | Readable) -> IO[bytes]:
@@ -0,0 +1,117 @@
+"""Scanning of BIDS dataset trees"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import hashlib
+import os
+from pathlib import Path
+import time
+from typing import NamedTuple
+
+
+class TreeFingerprint(NamedTuple):
+    """
+    A fingerprint of a directory tree, computed from the relative paths,
+    sizes, and modification times of all of the files in it (excluding those
+    under hidden directories, like :file:`.git`).  It does not depend on the
+    location of the tree, and so it survives copies that preserve mtimes.
+    """
+
+    #: MD5 digest of the sorted ``(path, size, mtime_ns)`` entries
+    md5: str
+    #: The number of files in the tree
+    nfiles: int
+    #: The most recent modification time of any file in the tree
+    newest_mtime_ns: int
+
+    def modified_recently(self, min_dtime: float = 0.01) -> bool:
+        """
+        Whether any file in the tree was modified too recently for the
+        fingerprint to be trusted for caching
+        """
+        return abs(time.time() - self.newest_mtime_ns * 1e-9) < min_dtime
+
+
+@dataclass
+class BIDSTreeScan:
+    """The result of a single walk over a BIDS dataset with `scan_bids_tree()`"""
+
+    #: The root directory of the dataset
+    root: Path
+
+    #: ``/``-separated paths, relative to `root`, of the dataset's files that
+    #: are subject to BIDS path matching: files & pseudofile directories
+    #: (which end with a ``/``) outside of hidden directories & nested
+    #: datasets, excluding hidden & explicitly excluded files
+    paths: list[str]
+
+    #: Fingerprint of the whole tree, including nested datasets and hidden
+    #: files like :file:`.bidsignore`
+    fingerprint: TreeFingerprint
+
+
+def scan_bids_tree(
+    root: str | Path,
+    pseudofile_suffixes: Iterable[str] = (),
+    exclude_files: Iterable[str] = (),
+) -> BIDSTreeScan:
+    """
+    Walk the BIDS dataset at ``root`` once, listing the paths to match
+    against BIDS naming patterns and fingerprinting the tree.  Directories
+    with names ending in one of ``pseudofile_suffixes`` (e.g.,
+    ``".ome.zarr"``) are listed as single paths, though their contents are
+    still fingerprinted.  The fingerprint does not depend on
+    ``pseudofile_suffixes`` or ``exclude_files``.
+    """
+    root = Path(root)
+    suffixes = tuple(pseudofile_suffixes)
+    excluded = set(exclude_files)
+    paths: list[str] = []
+    entries: list[str] = []
+    newest = 0
+    # Stack of (directory, relative path prefix, whether to list its files)
+    stack: list[tuple[str, str, bool]] = [(os.fspath(root), "", True)]
+    while stack:
+        dirpath, prefix, listed = stack.pop()
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                relpath = prefix + entry.name
+                if entry.is_dir():
+                    if entry.name.startswith("."):
+                        continue
+                    sublisted = listed
+                    if listed and entry.name.endswith(suffixes):
+                        paths.append(relpath + "/")
+                        sublisted = False
+                    elif listed and os.path.exists(
+                        os.path.join(entry.path, "dataset_description.json")
+                    ):
+                        # Nested datasets are validated separately
+                        sublisted = False
+                    stack.append((entry.path, relpath + "/", sublisted))
+                else:
+                    try:
+                        s = entry.stat()
+                    except FileNotFoundError:
+                        # Broken symlink
+                        s = entry.stat(follow_symlinks=False)
+                    entries.append(f"{relpath}\0{s.st_size}\0{s.st_mtime_ns}")
+                    newest = max(newest, s.st_mtime_ns)
+                    if (
+                        listed
+                        and not entry.name.startswith(".")
+                        and entry.name not in excluded
+                    ):
+                        paths.append(relpath)
+    hasher = hashlib.md5()
+    for e in sorted(entries):
+        hasher.update(e.encode("utf-8") + b"\n")
+    return BIDSTreeScan(
+        root=root,
+        paths=sorted(paths),
+        fingerprint=TreeFingerprint(
+            md5=hasher.hexdigest(), nfiles=len(entries), newest_mtime_ns=newest
+        ),
+    )
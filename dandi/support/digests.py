@@ -15,12 +15,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
+from functools import cache
 import hashlib
 import logging
+import os
 import os.path
 from pathlib import Path
+import platform
+import ssl
+import threading
+import time
+from typing import NamedTuple
 
 from dandischema.digests.dandietag import DandiETag
 from fscacher import PersistentCache
@@ -81,21 +89,255 @@ class Digester:
 checksums = PersistentCache(name="dandi-checksums", envvar="DANDI_CACHE")
 
 
-@checksums.memoize_path
-def get_digest(filepath: str | Path, digest: str = "sha256") -> str:
+class FileFingerprint(NamedTuple):
+    """
+    A cheap fingerprint of a file's content, consisting of its size, its
+    modification time, and an MD5 digest of a sample of its blocks (the head,
+    the tail, and a few strided blocks in between).  Unlike the fingerprint
+    used by `PersistentCache.memoize_path`, it does not depend on the path,
+    inode, or ctime of the file, and so it survives copies that preserve
+    mtimes.
+    """
+
+    size: int
+    mtime_ns: int
+    sampled_md5: str
+
+    def modified_recently(self, min_dtime: float = 0.01) -> bool:
+        """
+        Whether the file was modified too recently for its fingerprint to be
+        trusted for caching
+        """
+        return abs(time.time() - self.mtime_ns * 1e-9) < min_dtime
+
+
+def get_file_fingerprint(
+    filepath: str | Path, blocksize: int = 1 << 16, strides: int = 4
+) -> FileFingerprint:
+    """
+    Compute a `FileFingerprint` for the file at ``filepath`` by reading at
+    most ``strides + 2`` blocks of ``blocksize`` bytes.  Files smaller than
+    that are sampled in full.
+    """
+    s = os.stat(filepath)
+    size = s.st_size
+    hasher = hashlib.md5()
+    with open(filepath, "rb") as f:
+        if size <= (strides + 2) * blocksize:
+            hasher.update(f.read())
+        else:
+            step = (size - blocksize) // (strides + 1)
+            offsets = [i * step for i in range(strides + 1)] + [size - blocksize]
+            for offset in offsets:
+                f.seek(offset)
+                hasher.update(f.read(blocksize))
+    return FileFingerprint(
+        size=size, mtime_ns=s.st_mtime_ns, sampled_md5=hasher.hexdigest()
+    )
+
+
+#: Per-thread record of whether the last digest lookup had to be computed
+#: rather than being retrieved from `checksums`; see `digest_file()`
+_digest_state = threading.local()
+
+
+@checksums.memoize_path(exclude_kwargs=["executor"])
+def get_digest(
+    filepath: str | Path, digest: str = "sha256", executor: Executor | None = None
+) -> str:
+    """
+    Compute the digest of type ``digest`` of the file (or, for
+    ``"zarr-checksum"``, directory) at ``filepath``, caching the result.  If
+    ``executor`` is given, the parts of a ``"dandi-etag"`` digest are hashed
+    in parallel with it.
+    """
+    if digest == "zarr-checksum":
+        _digest_state.computed = True
+        return get_zarr_checksum(Path(filepath))
+    # Only called when the path-based cache missed (e.g., the file was copied
+    # or moved); consult the content fingerprint before reading the whole file
+    fprint = get_file_fingerprint(filepath)
+    if fprint.modified_recently():
+        return _compute_digest(filepath, digest, executor)
+    s = _get_fingerprinted_digest(fprint, digest, filepath=filepath, executor=executor)
+    assert isinstance(s, str)
+    return s
+
+
+@checksums.memoize(exclude_kwargs=["filepath", "executor"])
+def _get_fingerprinted_digest(
+    fingerprint: FileFingerprint,
+    digest: str,
+    filepath: str | Path,
+    executor: Executor | None = None,
+) -> str:
+    lgr.debug("No cached %s digest for fingerprint of %s", digest, filepath)
+    return _compute_digest(filepath, digest, executor)
+
+
+def _compute_digest(
+    filepath: str | Path, digest: str, executor: Executor | None = None
+) -> str:
     if digest == "dandi-etag":
-        s = get_dandietag(filepath).as_str()
+        s = get_dandietag(filepath, executor=executor).as_str()
         assert isinstance(s, str)
         return s
-    elif digest == "zarr-checksum":
-        return get_zarr_checksum(Path(filepath))
     else:
+        _digest_state.computed = True
         return Digester([digest])(filepath)[digest]
 
 
-@checksums.memoize_path
-def get_dandietag(filepath: str | Path) -> DandiETag:
-    return DandiETag.from_file(filepath)
+@checksums.memoize_path(exclude_kwargs=["executor"])
+def get_dandietag(
+    filepath: str | Path, executor: Executor | None = None
+) -> DandiETag:
+    fprint = get_file_fingerprint(filepath)
+    if fprint.modified_recently():
+        return _compute_dandietag(filepath, executor)
+    etag = _get_fingerprinted_dandietag(fprint, filepath=filepath, executor=executor)
+    assert isinstance(etag, DandiETag)
+    return etag
+
+
+@checksums.memoize(exclude_kwargs=["filepath", "executor"])
+def _get_fingerprinted_dandietag(
+    fingerprint: FileFingerprint,
+    filepath: str | Path,
+    executor: Executor | None = None,
+) -> DandiETag:
+    lgr.debug("No cached dandi-etag for fingerprint of %s", filepath)
+    return _compute_dandietag(filepath, executor)
+
+
+def _compute_dandietag(
+    filepath: str | Path, executor: Executor | None = None
+) -> DandiETag:
+    _digest_state.computed = True
+    etag = DandiETag(file_size=os.path.getsize(filepath))
+    if executor is None or etag.part_qty < 2:
+        with open(filepath, "rb") as f:
+            for part in etag.get_parts():
+                etag.update(f.read(part.size))
+        return etag
+    parts = list(etag.get_parts())
+    part_digests = executor.map(
+        _md5_file_part,
+        [str(filepath)] * len(parts),
+        [p.offset for p in parts],
+        [p.size for p in parts],
+    )
+    for part, part_digest in zip(parts, part_digests):
+        # DandiETag has no public method for submitting an already-computed
+        # part digest
+        etag._add_digest(part, part_digest)
+    return etag
+
+
+def _md5_file_part(filepath: str, offset: int, size: int) -> bytes:
+    # Module-level so that it can be sent to a process pool
+    hasher = hashlib.md5()
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        while size > 0:
+            block = f.read(min(size, 1 << 20))
+            if not block:
+                raise RuntimeError(f"{filepath}: unexpected end of file")
+            hasher.update(block)
+            size -= len(block)
+    return hasher.digest()
+
+
+def digest_file(
+    filepath: str | Path, digest: str = "sha256", executor: Executor | None = None
+) -> tuple[str, bool]:
+    """
+    Like `get_digest()`, but also returns whether the digest was retrieved
+    from the persistent cache instead of being computed
+    """
+    _digest_state.computed = False
+    value = get_digest(filepath, digest, executor=executor)
+    return (value, not _digest_state.computed)
+
+
+def is_digest_cached(filepath: str | Path, digest: str) -> bool:
+    """
+    Return whether a ``digest`` digest of the file at ``filepath`` can be
+    retrieved from the persistent cache by the file's content fingerprint,
+    i.e., without reading the whole file
+    """
+    check = getattr(_get_fingerprinted_digest, "check_call_in_cache", None)
+    if check is None:
+        # Caching is disabled
+        return False
+    fprint = get_file_fingerprint(filepath)
+    if fprint.modified_recently():
+        return False
+    return bool(check(fprint, digest, filepath=filepath))
+
+
+#: Digest algorithms, as named by `get_digest()`, whose hashing speeds are
+#: measured by `get_digest_speeds()`
+SPEED_RANKED_DIGESTS = ("dandi-etag", "md5", "sha1", "sha256", "sha512")
+
+
+def rank_digests(algorithms: Iterable[str]) -> list[str]:
+    """
+    Sort the given digest algorithm names from the fastest to the slowest to
+    compute on this host.  Algorithms whose speeds are not measured are placed
+    at the end, in their original order.
+    """
+    speeds = get_digest_speeds()
+    return sorted(
+        algorithms,
+        key=lambda a: (
+            -speeds.get(a, 0.0),
+            # Ties (e.g., between MD5 and dandi-etag) are broken in the order
+            # of SPEED_RANKED_DIGESTS
+            SPEED_RANKED_DIGESTS.index(a) if a in SPEED_RANKED_DIGESTS else 0,
+        ),
+    )
+
+
+@cache
+def get_digest_speeds() -> dict[str, float]:
+    """
+    Return a mapping from the names of the `SPEED_RANKED_DIGESTS` to their
+    measured hashing throughputs (in bytes per second) on this host.  The
+    measurements are taken once per host (and Python & OpenSSL version) and
+    then cached, both on disk and for the rest of the process.
+    """
+    speeds = _measure_digest_speeds(
+        platform.node(),
+        platform.machine(),
+        platform.python_version(),
+        ssl.OPENSSL_VERSION,
+    )
+    assert isinstance(speeds, dict)
+    return speeds
+
+
+@checksums.memoize
+def _measure_digest_speeds(*_host_key: str) -> dict[str, float]:
+    # The arguments only serve as the cache key.
+    block = os.urandom(1 << 22)
+    speeds: dict[str, float] = {}
+    for algo in SPEED_RANKED_DIGESTS:
+        if algo == "dandi-etag":
+            # A dandi-etag is the MD5 of the MD5s of 64 MiB parts, so the cost
+            # of computing one is that of MD5
+            continue
+        hasher = getattr(hashlib, algo)
+        best = float("inf")
+        for _ in range(3):
+            h = hasher()
+            start = time.perf_counter()
+            for _ in range(4):
+                h.update(block)
+            best = min(best, time.perf_counter() - start)
+        speeds[algo] = 4 * len(block) / max(best, 1e-9)
+    speeds["dandi-etag"] = speeds["md5"]
+    lgr.debug("Measured digest speeds (bytes/second): %s", speeds)
+    return speeds
 
 
 def get_zarr_checksum(path: Path, known: dict[str, str] | None = None) -> str:
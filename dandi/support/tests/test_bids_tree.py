@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+
+from ..bids_tree import scan_bids_tree
+
+
+def test_scan_bids_tree(tmp_path: Path) -> None:
+    ds = tmp_path / "ds"
+    for p in [
+        "dataset_description.json",
+        ".bidsignore",
+        "dandiset.yaml",
+        "sub-01/anat/sub-01_T1w.nii.gz",
+        "sub-01/micr/sub-01_sample-A_SPIM.ome.zarr/0/0",
+        "derivatives/pipe/dataset_description.json",
+        "derivatives/pipe/sub-01/out.txt",
+        ".git/HEAD",
+    ]:
+        (ds / p).parent.mkdir(parents=True, exist_ok=True)
+        (ds / p).write_text(p)
+    scan = scan_bids_tree(
+        ds, pseudofile_suffixes=[".ome.zarr"], exclude_files=["dandiset.yaml"]
+    )
+    assert scan.root == ds
+    assert scan.paths == [
+        "dataset_description.json",
+        "sub-01/anat/sub-01_T1w.nii.gz",
+        "sub-01/micr/sub-01_sample-A_SPIM.ome.zarr/",
+    ]
+    # Everything but the contents of .git is fingerprinted
+    assert scan.fingerprint.nfiles == 7
+    assert scan_bids_tree(ds).fingerprint == scan.fingerprint
+
+    # The fingerprint survives copies that preserve mtimes ...
+    shutil.copytree(ds, tmp_path / "copy")
+    assert scan_bids_tree(tmp_path / "copy").fingerprint == scan.fingerprint
+    # ... but not changes to files in the tree, even in pseudofile directories
+    (ds / "sub-01/micr/sub-01_sample-A_SPIM.ome.zarr/0/0").write_text("changed!")
+    assert scan_bids_tree(ds).fingerprint != scan.fingerprint
@@ -9,13 +9,21 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+import shutil
 
 import pytest
 from pytest_mock import MockerFixture
 
 from .. import digests
-from ..digests import Digester, checksum_zarr_dir, get_zarr_checksum
+from ..digests import (
+    Digester,
+    checksum_zarr_dir,
+    get_digest,
+    get_file_fingerprint,
+    get_zarr_checksum,
+)
 
 
 def test_digester(tmp_path):
@@ -55,6 +63,41 @@ def test_digester(tmp_path):
     }
 
 
+def test_get_file_fingerprint(tmp_path: Path) -> None:
+    f = tmp_path / "sample.bin"
+    f.write_bytes(bytes(1 << 20))
+    fp = get_file_fingerprint(f, blocksize=1024, strides=3)
+    assert fp.size == 1 << 20
+    assert fp.mtime_ns == f.stat().st_mtime_ns
+    # A change in a sampled block (here: the tail) changes the fingerprint
+    with f.open("r+b") as fh:
+        fh.seek(-1, os.SEEK_END)
+        fh.write(b"\x01")
+    os.utime(f, ns=(fp.mtime_ns, fp.mtime_ns))
+    fp2 = get_file_fingerprint(f, blocksize=1024, strides=3)
+    assert fp2.size == fp.size
+    assert fp2.mtime_ns == fp.mtime_ns
+    assert fp2.sampled_md5 != fp.sampled_md5
+
+
+def test_get_digest_reuses_fingerprint(mocker: MockerFixture, tmp_path: Path) -> None:
+    src = tmp_path / "src.bin"
+    src.write_bytes(os.urandom(300 * 1024))
+    os.utime(src, (1600000000, 1600000000))
+    spy = mocker.spy(digests, "_compute_digest")
+    sha = get_digest(src, "sha256")
+    assert sha == Digester(["sha256"])(src)["sha256"]
+    if digests.checksums._ignore_cache:
+        pytest.skip("Caching is disabled")
+    spy.assert_called_once()
+    # A copy with preserved mtime has a new inode and ctime but the same
+    # content fingerprint, so the full digest is not recomputed
+    dest = tmp_path / "dest.bin"
+    shutil.copy2(src, dest)
+    assert get_digest(dest, "sha256") == sha
+    spy.assert_called_once()
+
+
 def test_get_zarr_checksum(mocker: MockerFixture, tmp_path: Path) -> None:
     # Use write_bytes() so that the line endings are the same on POSIX and
     # Windows.
@@ -157,3 +200,39 @@ def test_checksum_zarr_dir(
     checksum: str,
 ) -> None:
     assert checksum_zarr_dir(files=files, directories=directories) == checksum
+
+
+def test_rank_digests(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        digests,
+        "get_digest_speeds",
+        return_value={
+            "dandi-etag": 500.0,
+            "md5": 500.0,
+            "sha1": 900.0,
+            "sha256": 1000.0,
+            "sha512": 300.0,
+        },
+    )
+    assert digests.rank_digests(["md5", "unknown", "dandi-etag", "sha256"]) == [
+        "sha256",
+        "dandi-etag",
+        "md5",
+        "unknown",
+    ]
+
+
+def test_get_digest_speeds() -> None:
+    speeds = digests.get_digest_speeds()
+    assert set(speeds) == set(digests.SPEED_RANKED_DIGESTS)
+    assert all(v > 0 for v in speeds.values())
+
+
+def test_is_digest_cached(tmp_path: Path) -> None:
+    f = tmp_path / "sample.bin"
+    f.write_bytes(os.urandom(1 << 16))
+    os.utime(f, (0, 0))
+    assert not digests.is_digest_cached(f, "md5")
+    get_digest(f, "md5")
+    assert digests.is_digest_cached(f, "md5")
+    assert not digests.is_digest_cached(f, "sha256")
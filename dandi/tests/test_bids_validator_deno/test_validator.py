@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from subprocess import CompletedProcess, TimeoutExpired
 from typing import Any, Optional
@@ -285,6 +286,43 @@ class TestBidsValidate:
         assert result.origin.type == OriginType.VALIDATION
         assert result.origin.validator == Validator.bids_validator_deno
 
+    def test_cache(self, tmp_path: Path) -> None:
+        """
+        Test that the results of validating an unchanged tree are retrieved from
+        the cache, and that changing the tree or the options invalidates them
+        """
+        from dandi.files.bases import validation_cache_disabled
+
+        (tmp_path / "dataset_description.json").write_text('{"Name": "test"}')
+        (tmp_path / "README").write_text("Test dataset\n")
+
+        def age_tree() -> None:
+            for p in tmp_path.iterdir():
+                os.utime(p, (1e9, 1e9))
+
+        age_tree()
+        with patch(
+            "dandi.bids_validator_deno._validator._bids_validate",
+            wraps=_bids_validate,
+        ) as mock_validate:
+            results = bids_validate(tmp_path)
+            assert mock_validate.call_count == 1
+            cached = bids_validate(tmp_path)
+            assert mock_validate.call_count == 1
+            assert [r.model_dump() for r in cached] == [r.model_dump() for r in results]
+
+            bids_validate(tmp_path, ignore_nifti_headers=True)
+            assert mock_validate.call_count == 2
+
+            with validation_cache_disabled():
+                bids_validate(tmp_path)
+            assert mock_validate.call_count == 3
+
+            (tmp_path / "README").write_text("Test dataset, revised\n")
+            age_tree()
+            bids_validate(tmp_path)
+            assert mock_validate.call_count == 4
+
     def test_validator_failure(self, tmp_path):
         """
         Test the case where the deno-compiled BIDS validator fails in execution, and
@@ -32,6 +32,7 @@ from ..dandiapi import (
     RemoteAsset,
     RemoteBlobAsset,
     RemoteZarrAsset,
+    RESTFullAPIClient,
     Version,
 )
 from ..download import download
@@ -697,6 +698,24 @@ def test_retry_logging(caplog: pytest.LogCaptureFixture) -> None:
     assert ("dandi", logging.DEBUG, "Response: 200") in caplog.record_tuples
 
 
+@responses.activate
+def test_retry_hook() -> None:
+    responses.add(responses.GET, "https://test.nil/api/info/", status=503)
+    responses.add(responses.GET, "https://test.nil/api/info/", json={"foo": "bar"})
+    client = RESTFullAPIClient("https://test.nil/api")
+    errors: list[BaseException] = []
+    with client.retry_hook(errors.append):
+        assert client.get("/info/") == {"foo": "bar"}
+    assert len(errors) == 1
+    assert isinstance(errors[0], requests.HTTPError)
+    assert errors[0].response is not None
+    assert errors[0].response.status_code == 503
+    responses.add(responses.GET, "https://test.nil/api/info/", status=503)
+    responses.add(responses.GET, "https://test.nil/api/info/", json={"foo": "bar"})
+    assert client.get("/info/") == {"foo": "bar"}
+    assert len(errors) == 1
+
+
 def test_get_assets_order(text_dandiset: SampleDandiset) -> None:
     assert [
         asset.path for asset in text_dandiset.dandiset.get_assets(order="path")
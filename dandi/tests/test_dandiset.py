@@ -1,4 +1,11 @@
+from pathlib import Path, PurePosixPath
+
+from pytest_mock import MockerFixture
+
+from .. import dandiset
+from ..consts import dandiset_metadata_file
 from ..dandiset import Dandiset
+from ..files import GenericBIDSAsset, NWBAsset
 
 
 def test_get_dandiset_record() -> None:
@@ -6,3 +13,49 @@ def test_get_dandiset_record() -> None:
     # Should have only header with "DO NOT EDIT"
     assert out.startswith("# DO NOT EDIT")
     assert "000000" in out
+
+
+def test_asset_view_under_paths(tmp_path: Path, mocker: MockerFixture) -> None:
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000000'\n")
+    for p in [
+        "sub-1/a.nwb",
+        "sub-2/b.nwb",
+        "sub-2/notes.txt",
+        "bids/dataset_description.json",
+        "bids/sub-01/anat/x.nii.gz",
+        "bids/sub-02/anat/y.nii.gz",
+        "data.zarr/arr/0",
+        ".hidden/c.nwb",
+    ]:
+        (tmp_path / p).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / p).touch()
+    spy = mocker.spy(dandiset, "find_dandi_files")
+    assets = Dandiset(tmp_path).assets()
+
+    assert [a.path for a in assets.under_paths(["sub-2", "sub-2/b.nwb"])] == [
+        "sub-2/b.nwb"
+    ]
+    assert [c.args[0] for c in spy.call_args_list] == [tmp_path / "sub-2"]
+
+    # A path within a BIDS dataset causes the whole dataset to be discovered
+    found = list(assets.under_paths(["bids/sub-01"]))
+    assert [a.path for a in found] == ["bids/sub-01/anat/x.nii.gz"]
+    assert isinstance(found[0], GenericBIDSAsset)
+    assert found[0].bids_dataset_description.path == "bids/dataset_description.json"
+    assert [a.path for a in assets.under_paths(["bids/sub-02"])] == [
+        "bids/sub-02/anat/y.nii.gz"
+    ]
+    assert spy.call_count == 2
+
+    # Paths that a walk from the root would not reach yield nothing
+    assert list(assets.under_paths(["data.zarr/arr", ".hidden/c.nwb"])) == []
+
+    assert sorted(map(str, assets.data)) == [
+        "bids/dataset_description.json",
+        "bids/sub-01/anat/x.nii.gz",
+        "bids/sub-02/anat/y.nii.gz",
+        "data.zarr",
+        "sub-1/a.nwb",
+        "sub-2/b.nwb",
+    ]
+    assert isinstance(assets.data[PurePosixPath("sub-1/a.nwb")], NWBAsset)
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
 
 import pytest
 from pytest_mock import MockerFixture
+import requests
 
 from .fixtures import DandiAPI, SampleDandiset
-from ..consts import DRAFT, dandiset_metadata_file
-from ..dandiapi import RESTFullAPIClient
-from ..delete import delete, is_same_url
+from ..consts import DRAFT, DandiInstance, dandiset_metadata_file
+from ..dandiapi import (
+    DandiAPIClient,
+    RemoteAsset,
+    RemoteDandiset,
+    RESTFullAPIClient,
+)
+from ..delete import (
+    ConcurrencyLimit,
+    Deleter,
+    delete,
+    delete_assets,
+    is_same_url,
+)
 from ..download import download
-from ..exceptions import NotFoundError
+from ..exceptions import HTTP404Error, NotFoundError
 from ..utils import list_paths
 
 
@@ -455,3 +471,152 @@ def test_delete_zarr_path(
 )
 def test_is_same_url(url1: str, url2: str, r: bool) -> None:
     assert is_same_url(url1, url2) is r
+
+
+def test_concurrency_limit() -> None:
+    limit = ConcurrencyLimit(4)
+    limit.throttle()
+    assert limit.limit == 2
+    limit.throttle()
+    limit.throttle()
+    assert limit.limit == 1
+    limit.succeeded()
+    assert limit.limit == 2
+    limit.succeeded()
+    assert limit.limit == 2
+    limit.succeeded()
+    assert limit.limit == 3
+    for _ in range(10):
+        limit.succeeded()
+    assert limit.limit == 4
+
+
+def test_delete_assets_retry(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: dict[str, int] = {}
+    limits: list[ConcurrencyLimit] = []
+
+    def make_asset(path: str, errors: list[Exception]) -> RemoteAsset:
+        hooks: list[Callable[[BaseException], Any]] = []
+
+        @contextmanager
+        def retry_hook(hook: Callable[[BaseException], Any]) -> Iterator[None]:
+            hooks.append(hook)
+            try:
+                yield
+            finally:
+                hooks.remove(hook)
+
+        def delete() -> None:
+            # Simulates a client that makes up to three attempts
+            for i in range(3):
+                attempts[path] = attempts.get(path, 0) + 1
+                if not errors:
+                    return
+                e = errors.pop(0)
+                if i == 2 or not is_transient(e):
+                    raise e
+                for hook in hooks:
+                    hook(e)
+
+        return cast(
+            RemoteAsset,
+            SimpleNamespace(
+                path=path,
+                delete=delete,
+                client=SimpleNamespace(retry_hook=retry_hook),
+            ),
+        )
+
+    def is_transient(e: Exception) -> bool:
+        return not isinstance(e, requests.HTTPError) or (
+            e.response is not None and e.response.status_code >= 500
+        )
+
+    def http_error(status: int) -> requests.HTTPError:
+        r = requests.Response()
+        r.status_code = status
+        cls = HTTP404Error if status == 404 else requests.HTTPError
+        return cls(f"Error {status}", response=r)
+
+    real_limit = ConcurrencyLimit
+
+    def make_limit(maximum: int) -> ConcurrencyLimit:
+        limits.append(real_limit(maximum))
+        return limits[-1]
+
+    assets = [
+        make_asset("ok.txt", []),
+        make_asset("flaky.txt", [requests.ConnectionError("Connection reset")]),
+        make_asset("lost.txt", [http_error(503), http_error(404)]),
+        make_asset("missing.txt", [http_error(404)]),
+        make_asset("forbidden.txt", [http_error(403)]),
+        make_asset("down.txt", [http_error(503)] * 3),
+    ]
+    monkeypatch.setattr("dandi.delete.ConcurrencyLimit", make_limit)
+    results = {a.path: e for a, e in delete_assets(assets, jobs=4)}
+    assert results["ok.txt"] is None
+    assert results["flaky.txt"] is None
+    assert results["lost.txt"] is None
+    assert isinstance(results["missing.txt"], HTTP404Error)
+    assert isinstance(results["forbidden.txt"], requests.HTTPError)
+    assert isinstance(results["down.txt"], requests.HTTPError)
+    assert attempts == {
+        "ok.txt": 1,
+        "flaky.txt": 2,
+        "lost.txt": 2,
+        "missing.txt": 1,
+        "forbidden.txt": 1,
+        "down.txt": 3,
+    }
+    # The retried 503s throttled the limit
+    assert limits[0].limit < 4
+
+
+@pytest.mark.parametrize("asset_count", [5, 1000])
+def test_deleter_resolve(asset_count: int) -> None:
+    paths = ["a.txt", "sub/b.txt", "sub/c.txt", "sub2/d.txt"]
+    assets = {p: SimpleNamespace(path=p, identifier=f"id-{p}") for p in paths}
+    listings = 0
+
+    def get_assets() -> Iterator[SimpleNamespace]:
+        nonlocal listings
+        listings += 1
+        return iter(assets.values())
+
+    def get_asset_by_path(path: str) -> SimpleNamespace:
+        try:
+            return assets[path]
+        except KeyError:
+            raise NotFoundError(path)
+
+    dandiset = SimpleNamespace(
+        identifier="000000",
+        version=SimpleNamespace(asset_count=asset_count),
+        get_assets=get_assets,
+        get_asset_by_path=get_asset_by_path,
+        get_assets_with_path_prefix=lambda prefix: (
+            a for p, a in assets.items() if p.startswith(prefix)
+        ),
+    )
+    instance = DandiInstance(name="test", gui=None, api="http://localhost/api")
+    deleter = Deleter(
+        client=cast(DandiAPIClient, SimpleNamespace(api_url=instance.api)),
+        dandiset=cast(RemoteDandiset, dandiset),
+        jobs=2,
+    )
+    deleter.register_asset_folder(instance, "000000", DRAFT, "sub/")
+    deleter.register_asset(instance, "000000", DRAFT, "a.txt")
+    deleter.register_asset(instance, "000000", DRAFT, "sub/b.txt")
+    deleter.resolve()
+    assert listings == (asset_count == 5)
+    assert [a.path for a in deleter.remote_assets] == [
+        "sub/b.txt",
+        "sub/c.txt",
+        "a.txt",
+    ]
+    deleter.register_asset(instance, "000000", DRAFT, "nonexistent.txt")
+    with pytest.raises(NotFoundError) as excinfo:
+        deleter.resolve()
+    assert str(excinfo.value) == (
+        "Asset at path 'nonexistent.txt' not found in Dandiset 000000"
+    )
@@ -4,11 +4,13 @@ from operator import attrgetter
 import os
 from pathlib import Path
 import subprocess
+from typing import Any
 from unittest.mock import ANY
 
 from dandischema.models import get_schema_version
 import numpy as np
 import pytest
+from pytest_mock import MockerFixture
 import zarr
 
 from .fixtures import SampleDandiset
@@ -27,9 +29,18 @@ from ..files import (
     VideoAsset,
     ZarrAsset,
     ZarrBIDSAsset,
+    ZarrSnapshot,
     dandi_file,
     find_dandi_files,
 )
+from ..support import digests
+from ..support.digests import get_zarr_checksum
+from ..validate._types import (
+    ORIGIN_VALIDATION_DANDI_LAYOUT,
+    Scope,
+    Severity,
+    ValidationResult,
+)
 
 lgr = get_logger()
 
@@ -174,6 +185,32 @@ def test_find_dandi_files(tmp_path: Path) -> None:
     ]
 
 
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_find_dandi_files_symlinks(tmp_path: Path, jobs: int) -> None:
+    mkpaths(tmp_path, "real/sample.nwb", "empty/", "sub/deeper/other.nwb")
+    (tmp_path / "linked").symlink_to(tmp_path / "real", target_is_directory=True)
+    (tmp_path / "link.nwb").symlink_to(tmp_path / "real" / "sample.nwb")
+    files = sorted(
+        find_dandi_files(tmp_path, dandiset_path=tmp_path, jobs=jobs),
+        key=attrgetter("filepath"),
+    )
+    assert files == [
+        NWBAsset(
+            filepath=tmp_path / "link.nwb", path="link.nwb", dandiset_path=tmp_path
+        ),
+        NWBAsset(
+            filepath=tmp_path / "real" / "sample.nwb",
+            path="real/sample.nwb",
+            dandiset_path=tmp_path,
+        ),
+        NWBAsset(
+            filepath=tmp_path / "sub" / "deeper" / "other.nwb",
+            path="sub/deeper/other.nwb",
+            dandiset_path=tmp_path,
+        ),
+    ]
+
+
 def test_find_dandi_files_with_bids(tmp_path: Path) -> None:
     mkpaths(
         tmp_path,
@@ -514,6 +551,44 @@ def test_zarr_properties(tmp_path: Path) -> None:
     ]
 
 
+def test_zarr_snapshot(mocker: MockerFixture, tmp_path: Path) -> None:
+    filepath = tmp_path / "example.zarr"
+    zarr.save(filepath, np.arange(1000), np.arange(1000, 0, -1))
+    (filepath / ".git").mkdir()
+    (filepath / ".git" / "config").write_text("Not in the Zarr\n")
+    zf = dandi_file(filepath)
+    assert isinstance(zf, ZarrAsset)
+    scan = mocker.spy(ZarrSnapshot, "scan")
+    md5 = mocker.spy(digests, "md5file_nocache")
+    with zf.hold_snapshot() as snapshot:
+        size = zf.size
+        assert not zf._is_too_deep()
+        assert zf.get_digest().value == get_zarr_checksum(filepath)
+        assert zf.stat().size == size
+        assert zf.snapshot() is snapshot
+    assert scan.call_count == 1
+    assert snapshot.size == size
+    assert not any(p.startswith(".git") for p in snapshot.files)
+    # The digests from get_digest() were reused by stat():
+    nfiles = len(snapshot.files)
+    assert md5.call_count == 2 * nfiles  # (once more by get_zarr_checksum())
+    # Without a held snapshot, each operation rescans the tree, but digests of
+    # unchanged files are kept
+    (filepath / "extra").write_bytes(b"More data\n")
+    assert zf.size == size + 10
+    assert scan.call_count == 2
+    zf.get_digest()
+    assert scan.call_count == 3
+    assert md5.call_count == 2 * nfiles + 1
+    # Files rewritten in place are digested anew
+    chunk = next(p for p in snapshot.files if not p.rsplit("/", 1)[-1].startswith("."))
+    st = os.stat(filepath / chunk)
+    (filepath / chunk).write_bytes(b"Different data\n")
+    os.utime(filepath / chunk, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert zf.get_digest().value == get_zarr_checksum(filepath)
+    assert md5.call_count == 2 * nfiles + 2 + (nfiles + 1)
+
+
 def test_upload_zarr_with_excluded_dotfiles(
     new_dandiset: SampleDandiset, tmp_path: Path
 ) -> None:
@@ -635,3 +710,71 @@ def test_validate_invalid_zarr3(path: str, expected_result_ids: set[str]) -> Non
 
     result_ids = {r.id for r in zf.get_validation_errors()}
     assert result_ids == expected_result_ids
+
+
+def test_bids_dataset_analysis_shared(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from ..files import bids
+
+    mkpaths(
+        tmp_path,
+        dandiset_metadata_file,
+        "dataset_description.json",
+        "participants.tsv",
+        "sub-01/ses-1/anat/sub-01_ses-1_T1w.nii.gz",
+        "sub-01/ses-1/anat/notes.txt",
+    )
+    notes = tmp_path / "sub-01" / "ses-1" / "anat" / "notes.txt"
+    calls: list[Path] = []
+
+    def mock_bids_validate(dir_: Path, **_kwargs: Any) -> list[ValidationResult]:
+        calls.append(dir_)
+        return [
+            ValidationResult(
+                id="BIDS.NOT_INCLUDED",
+                origin=ORIGIN_VALIDATION_DANDI_LAYOUT,
+                scope=Scope.FILE,
+                severity=Severity.ERROR,
+                dataset_path=dir_,
+                path=notes,
+            )
+        ]
+
+    monkeypatch.setattr(bids, "bids_validate", mock_bids_validate)
+
+    def age_tree() -> None:
+        for p in tmp_path.rglob("*"):
+            os.utime(p, (1e9, 1e9))
+
+    def check() -> None:
+        # Keep references to all files, as BIDS assets only hold weak
+        # references to their dataset descriptions
+        files = {
+            df.filepath.relative_to(tmp_path).as_posix(): df
+            for df in find_dandi_files(tmp_path, dandiset_path=tmp_path)
+        }
+        nifti = files["sub-01/ses-1/anat/sub-01_ses-1_T1w.nii.gz"]
+        assert isinstance(nifti, GenericBIDSAsset)
+        metadata = nifti.get_metadata()
+        assert metadata.wasAttributedTo is not None
+        assert metadata.wasAttributedTo[0].identifier == "01"
+        assert metadata.wasGeneratedBy is not None
+        assert metadata.wasGeneratedBy[0].identifier == "1"
+        notes_asset = files["sub-01/ses-1/anat/notes.txt"]
+        assert isinstance(notes_asset, GenericBIDSAsset)
+        assert not notes_asset.get_metadata().wasAttributedTo
+        ddesc = nifti.bids_dataset_description
+        assert ddesc.get_asset_errors(nifti) == []
+        assert [r.id for r in ddesc.get_asset_errors(notes_asset)] == [
+            "BIDS.NOT_INCLUDED"
+        ]
+
+    age_tree()
+    check()
+    check()
+    assert calls == [tmp_path]
+    (tmp_path / "participants.tsv").write_text("participant_id\nsub-01\n")
+    age_tree()
+    check()
+    assert calls == [tmp_path, tmp_path]
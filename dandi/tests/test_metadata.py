@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from itertools import chain
 import json
+import os
 from pathlib import Path
 import shutil
 from typing import Any
@@ -34,6 +35,7 @@ import numpy as np
 from pydantic import ByteSize
 from pynwb import NWBHDF5IO, NWBFile, TimeSeries
 import pytest
+from pytest_mock import MockerFixture
 import requests
 from semantic_version import Version
 
@@ -43,6 +45,8 @@ from .. import __version__
 from ..consts import metadata_nwb_subject_fields
 from ..dandiapi import RemoteBlobAsset
 from ..metadata.core import prepare_metadata
+from ..metadata.extractor import MetadataExtractor
+from ..metadata import nwb as metadata_nwb
 from ..metadata.nwb import get_metadata, nwb2asset
 from ..metadata.util import (
     extract_age,
@@ -55,6 +59,7 @@ from ..metadata.util import (
     timedelta2duration,
 )
 from ..misctypes import DUMMY_DANDI_ETAG
+from ..pynwb_utils import metadata_cache
 from ..utils import ensure_datetime
 
 METADATA_DIR = Path(__file__).with_name("data") / "metadata"
@@ -1295,3 +1300,49 @@ def test_nwb2asset_remote_asset(nwb_dandiset: SampleDandiset) -> None:
         approach=[],
         relatedResource=[],
     )
+
+
+def test_get_metadata_survives_move(
+    mocker: MockerFixture, simple1_nwb: Path, tmp_path: Path
+) -> None:
+    src = tmp_path / "src.nwb"
+    shutil.copy2(simple1_nwb, src)
+    os.utime(src, (1600000000, 1600000000))
+    expected = get_metadata(simple1_nwb)
+    spy = mocker.spy(metadata_nwb, "_read_nwb_metadata")
+    meta = get_metadata(src)
+    assert meta == expected
+    if metadata_cache._ignore_cache:
+        pytest.skip("Caching is disabled")
+    assert spy.call_count == 1
+    # The renamed file has the same content fingerprint, so the metadata
+    # extracted before the move is reused
+    dest = tmp_path / "sub-01" / "sub-01_ses-1.nwb"
+    dest.parent.mkdir()
+    src.rename(dest)
+    assert get_metadata(dest) == meta
+    assert spy.call_count == 1
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_metadata_extractor(
+    jobs: int, simple1_nwb: Path, simple2_nwb: Path, tmp_path: Path
+) -> None:
+    bad = tmp_path / "bad.nwb"
+    bad.write_text("Not an NWB file\n")
+    paths = [str(simple1_nwb), str(simple2_nwb), str(bad)]
+    with MetadataExtractor(jobs=jobs) as extractor:
+        results = {r.item: r for r in extractor.map(get_metadata, paths)}
+        assert results.keys() == set(paths)
+        for p in paths[:2]:
+            r = results[p]
+            assert r.error is None
+            assert r.value == get_metadata(p)
+            assert extractor.run(get_metadata, p) == r.value
+        r = results[str(bad)]
+        assert r.value is None
+        assert r.error is not None
+        assert isinstance(r.error.exc, OSError)
+        assert any("get_metadata" in line for line in r.error.traceback)
+        with pytest.raises(OSError):
+            r.unwrap()
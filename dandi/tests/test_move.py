@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import replace
 import logging
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, cast
 
 import pytest
+import requests
 
 from .fixtures import SampleDandiset
-from ..dandiapi import RemoteAsset
+from ..consts import dandiset_metadata_file
+from ..dandiapi import RemoteAsset, RemoteDandiset
 from ..exceptions import NotFoundError
-from ..move import AssetMismatchError, MoveExisting, MoveWorkOn, move
+from ..move import (
+    AssetMismatchError,
+    AssetPath,
+    File,
+    Folder,
+    LocalMover,
+    MoveExisting,
+    MoveJournal,
+    Movement,
+    MoveProgress,
+    MoveWorkOn,
+    RemoteMover,
+    move,
+    order_movements,
+)
 
 
 @pytest.fixture()
@@ -1083,3 +1103,276 @@ def test_move_both_dest_is_local_dir_sans_slash(
         MoveWorkOn.BOTH,
         {"file.txt": "newdir/file.txt"},
     )
+
+
+@pytest.mark.parametrize("where", ["local", "remote"])
+def test_mover_lookups(tmp_path: Path, where: str) -> None:
+    paths = [
+        "file.txt",
+        "subdir1/apple.txt",
+        "subdir2/banana.txt",
+        "subdir2/sub/coconut.txt",
+        "subdir3/red.dat",
+    ]
+    mover: LocalMover | RemoteMover
+    if where == "local":
+        (tmp_path / dandiset_metadata_file).write_text("identifier: '000000'\n")
+        for path in paths:
+            p = tmp_path / path
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(f"{path}\n")
+        mover = LocalMover(dandiset_path=tmp_path, subpath=Path("subdir2"))
+    else:
+        dandiset = SimpleNamespace(
+            identifier="000000",
+            get_assets=lambda: iter(SimpleNamespace(path=p) for p in paths),
+        )
+        mover = RemoteMover(
+            dandiset=cast(RemoteDandiset, dandiset), subpath=Path("subdir2")
+        )
+    assert list(mover.get_assets(subpath_only=True)) == [
+        ("subdir2/banana.txt", "banana.txt"),
+        ("subdir2/sub/coconut.txt", "sub/coconut.txt"),
+    ]
+    assert mover.get_path("banana.txt") == File(AssetPath("subdir2/banana.txt"))
+    assert mover.get_path("../subdir3/") == Folder("subdir3", ["red.dat"])
+    assert mover.get_path("sub", is_src=False) == Folder("subdir2/sub", [])
+    with pytest.raises(NotFoundError):
+        mover.get_path("nonexistent")
+    assert mover.is_dir(AssetPath("subdir2/sub"))
+    assert not mover.is_dir(AssetPath("file.txt"))
+    assert mover.is_file(AssetPath("file.txt"))
+    assert not mover.is_file(AssetPath("subdir1"))
+    assert mover.calculate_moves(
+        "sub", "../file.txt", dest="../subdir1", existing=MoveExisting.ERROR
+    ) == [
+        Movement(AssetPath("file.txt"), AssetPath("subdir1/file.txt")),
+        Movement(
+            AssetPath("subdir2/sub/coconut.txt"),
+            AssetPath("subdir1/sub/coconut.txt"),
+        ),
+    ]
+
+
+def test_order_movements() -> None:
+    plan = [
+        Movement(AssetPath("a"), AssetPath("b")),
+        Movement(AssetPath("b"), AssetPath("c")),
+        Movement(AssetPath("d"), AssetPath("e"), skip=True),
+        Movement(AssetPath("sub/x.txt"), AssetPath("sub/y.txt")),
+        Movement(AssetPath("sub/y.txt"), AssetPath("sub/x.txt")),
+    ]
+    ordered = order_movements(plan)
+    assert ordered[:3] == [
+        Movement(AssetPath("b"), AssetPath("c")),
+        Movement(AssetPath("a"), AssetPath("b"), after=AssetPath("b")),
+        Movement(AssetPath("d"), AssetPath("e"), skip=True),
+    ]
+    tmp = ordered[3].dest
+    assert tmp.startswith("sub/dandi-move-") and tmp.endswith("-x.txt")
+    assert ordered[3:] == [
+        Movement(AssetPath("sub/x.txt"), tmp),
+        Movement(
+            AssetPath("sub/y.txt"), AssetPath("sub/x.txt"), after=AssetPath("sub/x.txt")
+        ),
+        Movement(tmp, AssetPath("sub/y.txt"), after=AssetPath("sub/y.txt")),
+    ]
+
+
+@pytest.mark.parametrize("existing", [MoveExisting.ERROR, MoveExisting.SKIP])
+def test_compile_moves_vacated_dest(existing: MoveExisting) -> None:
+    dandiset = SimpleNamespace(
+        identifier="000000",
+        get_assets=lambda: iter(SimpleNamespace(path=p) for p in ["a", "b", "d"]),
+    )
+    mover = RemoteMover(dandiset=cast(RemoteDandiset, dandiset), subpath=Path())
+    moves = {AssetPath("a"): AssetPath("b"), AssetPath("b"): AssetPath("c")}
+    assert mover.compile_moves(moves, existing) == [
+        Movement(AssetPath("a"), AssetPath("b")),
+        Movement(AssetPath("b"), AssetPath("c")),
+    ]
+    # When "b" cannot be moved to "d", it is not vacated for "a"
+    moves[AssetPath("b")] = AssetPath("d")
+    assert mover.compile_moves(moves, MoveExisting.SKIP) == [
+        Movement(AssetPath("a"), AssetPath("b"), skip=True),
+        Movement(AssetPath("b"), AssetPath("d"), skip=True),
+    ]
+    with pytest.raises(ValueError) as excinfo:
+        mover.compile_moves(moves, MoveExisting.ERROR)
+    assert str(excinfo.value) == (
+        "Cannot move 'b' to 'd', as remote destination already exists"
+    )
+
+
+def test_move_local_cycle(tmp_path: Path) -> None:
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000000'\n")
+    for name in ["x.txt", "y.txt", "z.txt"]:
+        (tmp_path / name).write_text(f"{name}\n")
+    mover = LocalMover(dandiset_path=tmp_path, subpath=Path())
+    plan = order_movements(
+        mover.compile_moves(
+            {
+                AssetPath("x.txt"): AssetPath("y.txt"),
+                AssetPath("y.txt"): AssetPath("z.txt"),
+                AssetPath("z.txt"): AssetPath("x.txt"),
+            },
+            MoveExisting.ERROR,
+        )
+    )
+    assert len(plan) == 4
+    journal = MoveJournal(tmp_path / "journal.jsonl")
+    journal.start(plan)
+    progress = MoveProgress(plan, journal)
+    for gen in mover.process_moves_debug(plan, progress=progress):
+        for r in gen:
+            assert r["local"] != "Error"
+    assert progress.nfailed == 0
+    assert journal.load() == []
+    assert (tmp_path / "x.txt").read_text() == "z.txt\n"
+    assert (tmp_path / "y.txt").read_text() == "x.txt\n"
+    assert (tmp_path / "z.txt").read_text() == "y.txt\n"
+    assert sorted(p for p, _ in mover.get_assets()) == ["x.txt", "y.txt", "z.txt"]
+
+
+def test_move_journal_resume(tmp_path: Path) -> None:
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000000'\n")
+    for name in ["a.txt", "b.txt"]:
+        (tmp_path / name).write_text(f"{name}\n")
+    plan = [
+        Movement(AssetPath("b.txt"), AssetPath("c.txt")),
+        Movement(AssetPath("a.txt"), AssetPath("b.txt"), after=AssetPath("b.txt")),
+    ]
+    journal = MoveJournal(tmp_path / "journal.jsonl")
+    assert journal.load() is None
+    journal.start(plan)
+    # Simulate an interruption after "b.txt" was moved but before its
+    # completion was recorded
+    (tmp_path / "b.txt").rename(tmp_path / "c.txt")
+    pending = journal.load()
+    assert pending == [replace(m, resumed=True) for m in plan]
+    assert pending is not None
+    mover = LocalMover(dandiset_path=tmp_path, subpath=Path())
+    progress = MoveProgress(pending, journal)
+    states = [
+        list(gen) for gen in mover.process_moves_debug(pending, progress=progress)
+    ]
+    assert states[0][-1]["message"] == "Already moved"
+    assert states[1][-1]["local"] == "Moved"
+    assert journal.load() == []
+    journal.finish()
+    assert not journal.path.exists()
+    assert (tmp_path / "b.txt").read_text() == "a.txt\n"
+    assert (tmp_path / "c.txt").read_text() == "b.txt\n"
+
+
+def test_move_failure_skips_dependents(tmp_path: Path) -> None:
+    (tmp_path / dandiset_metadata_file).write_text("identifier: '000000'\n")
+    (tmp_path / "a.txt").write_text("a.txt\n")
+    plan = [
+        Movement(AssetPath("b.txt"), AssetPath("c.txt")),
+        Movement(AssetPath("a.txt"), AssetPath("b.txt"), after=AssetPath("b.txt")),
+    ]
+    mover = LocalMover(dandiset_path=tmp_path, subpath=Path())
+    progress = MoveProgress(plan)
+    states = [list(gen) for gen in mover.process_moves_debug(plan, progress=progress)]
+    assert states[0][-1]["local"] == "Error"
+    assert states[1] == [
+        {
+            "source": "a.txt",
+            "target": "b.txt",
+            "local": "skipped",
+            "message": "Moving 'b.txt' failed",
+        }
+    ]
+    assert progress.nfailed == 2
+    assert (tmp_path / "a.txt").exists()
+
+
+class FakeClient:
+    """A client whose requests are simulated by the assets using it"""
+
+    def __init__(self) -> None:
+        self.hooks: list[Callable[[BaseException], Any]] = []
+
+    @contextmanager
+    def retry_hook(self, hook: Callable[[BaseException], Any]) -> Iterator[None]:
+        self.hooks.append(hook)
+        try:
+            yield
+        finally:
+            self.hooks.remove(hook)
+
+    def retried(self, e: BaseException) -> None:
+        for hook in self.hooks:
+            hook(e)
+
+
+def make_remote_mover(
+    rename: Callable[[str], None], moved: bool
+) -> tuple[RemoteMover, list[str], FakeClient]:
+    client = FakeClient()
+    lookups: list[str] = []
+    asset = SimpleNamespace(path="a.txt", rename=rename)
+
+    def get_asset_by_path(path: str) -> Any:
+        lookups.append(path)
+        if moved:
+            return SimpleNamespace(path=path)
+        raise NotFoundError(path)
+
+    dandiset = SimpleNamespace(
+        identifier="000000",
+        client=client,
+        get_assets=lambda: iter([asset]),
+        get_asset_by_path=get_asset_by_path,
+    )
+    mover = RemoteMover(dandiset=cast(RemoteDandiset, dandiset), subpath=Path())
+    return mover, lookups, client
+
+
+def test_remote_move_lost_response() -> None:
+    def rename(_dest: str) -> None:
+        raise requests.ConnectionError("Connection reset")
+
+    mover, lookups, _ = make_remote_mover(rename, moved=True)
+    mover.move(AssetPath("a.txt"), AssetPath("b.txt"))
+    assert lookups == ["b.txt"]
+    assert not mover.is_file(AssetPath("a.txt"))
+    assert mover.is_file(AssetPath("b.txt"))
+
+
+def test_remote_move_retried() -> None:
+    def rename(_dest: str) -> None:
+        # The first attempt went through but its response was lost, so the
+        # retry finds nothing to rename
+        client.retried(requests.ConnectionError("Connection reset"))
+        raise requests.HTTPError("404 Not Found")
+
+    mover, lookups, client = make_remote_mover(rename, moved=True)
+    mover.move(AssetPath("a.txt"), AssetPath("b.txt"))
+    assert lookups == ["b.txt"]
+    assert mover.is_file(AssetPath("b.txt"))
+    assert client.hooks == []
+
+
+def test_remote_move_error() -> None:
+    def rename(_dest: str) -> None:
+        raise requests.HTTPError("400 Bad Request")
+
+    mover, lookups, _ = make_remote_mover(rename, moved=True)
+    with pytest.raises(requests.HTTPError):
+        mover.move(AssetPath("a.txt"), AssetPath("b.txt"))
+    assert lookups == []
+    assert mover.is_file(AssetPath("a.txt"))
+    assert not mover.is_file(AssetPath("b.txt"))
+
+
+def test_remote_move_not_moved() -> None:
+    def rename(_dest: str) -> None:
+        raise requests.ConnectionError("Connection reset")
+
+    mover, lookups, _ = make_remote_mover(rename, moved=False)
+    with pytest.raises(requests.ConnectionError):
+        mover.move(AssetPath("a.txt"), AssetPath("b.txt"))
+    assert lookups == ["b.txt"]
+    assert mover.is_file(AssetPath("a.txt"))
@@ -11,12 +11,16 @@ from pynwb import NWBHDF5IO
 import pytest
 import ruamel.yaml
 
+from .skip import mark
 from .xfail import mark_xfail_windows_python313_posixsubprocess
+from .. import organize as organize_mod
 from ..cli.cmd_organize import organize
 from ..consts import dandiset_metadata_file
 from ..organize import (
+    ORGANIZE_JOURNAL,
     CopyMode,
     FileOperationMode,
+    _perform_file_operations,
     _sanitize_value,
     create_dataset_yml_template,
     create_unique_filenames_from_metadata,
@@ -293,13 +297,43 @@ def test_ambiguous_desc() -> None:
     ]
 
 
+def test_ambiguous_many_groups() -> None:
+    # Only the conflicting groups get disambiguated, each by the fields that
+    # help within it
+    extras: list[dict[str, Any]] = [
+        {"probe_ids": [1]},
+        {"probe_ids": [2]},
+        {"description": "a"},
+        {"description": "b", "probe_ids": [1]},
+        {},
+    ]
+    metadata: list[dict[str, Any]] = []
+    for s in range(200):
+        for i, extra in enumerate(extras if s % 2 else [{"modalities": ["ecephys"]}]):
+            metadata.append(
+                {"path": f"{s}-{i}.nwb", "subject_id": str(s), "extension": ".nwb"}
+                | extra
+            )
+    metadata_ = create_unique_filenames_from_metadata(metadata)
+    assert [m["dandi_path"] for m in metadata_[:6]] == [
+        op.join("sub-0", "sub-0_ecephys.nwb"),
+        op.join("sub-1", "sub-1_probe-1.nwb"),
+        op.join("sub-1", "sub-1_probe-2.nwb"),
+        op.join("sub-1", "sub-1_desc-a.nwb"),
+        op.join("sub-1", "sub-1_desc-b.nwb"),
+        op.join("sub-1", "sub-1.nwb"),
+    ]
+    assert len({m["dandi_path"] for m in metadata_}) == len(metadata)
+
+
 @pytest.mark.parametrize(
-    "sym_success,hard_success,result",
+    "sym_success,hard_success,clone_success,result",
     [
-        (True, True, "symlink"),
-        (True, False, "symlink"),
-        (False, True, "hardlink"),
-        (False, False, "copy"),
+        (True, True, True, "symlink"),
+        (True, False, False, "symlink"),
+        (False, True, True, "hardlink"),
+        (False, False, True, "reflink"),
+        (False, False, False, "copy"),
     ],
 )
 def test_detect_link_type(
@@ -307,6 +341,7 @@ def test_detect_link_type(
     tmp_path: Path,
     sym_success: bool,
     hard_success: bool,
+    clone_success: bool,
     result: str,
 ) -> None:
     def succeed_link(src: Any, dest: Any) -> None:
@@ -317,11 +352,34 @@ def test_detect_link_type(
 
     monkeypatch.setattr(os, "symlink", succeed_link if sym_success else error_link)
     monkeypatch.setattr(os, "link", succeed_link if hard_success else error_link)
+    monkeypatch.setattr(
+        "dandi.organize.clone_file", succeed_link if clone_success else error_link
+    )
     p = tmp_path / "file"
     p.touch()
     assert detect_link_type(p, tmp_path) == result
 
 
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_perform_file_operations(tmp_path: Path, jobs: int) -> None:
+    ops = []
+    for i in range(20):
+        src = tmp_path / "src" / f"{i}.nwb"
+        src.parent.mkdir(exist_ok=True)
+        src.write_text(str(i))
+        ops.append((str(src), str(tmp_path / "out" / f"sub-{i % 3}" / f"{i}.nwb")))
+    _perform_file_operations(ops, FileOperationMode.COPY, jobs)
+    for i, (_, dst) in enumerate(ops):
+        assert Path(dst).read_text() == str(i)
+
+    # The first failure is raised
+    ops = [(str(tmp_path / "src" / "0.nwb"), str(tmp_path / "new" / "0.nwb"))] + ops
+    with pytest.raises(FileExistsError) as excinfo:
+        _perform_file_operations(ops, FileOperationMode.HARDLINK, jobs)
+    assert excinfo.value.filename2 == ops[1][1]
+    assert (tmp_path / "new" / "0.nwb").exists()
+
+
 @mark_xfail_windows_python313_posixsubprocess
 @pytest.mark.parametrize("mode", [FileOperationMode.COPY, FileOperationMode.MOVE])
 @pytest.mark.parametrize("video_mode", list(CopyMode))
@@ -434,3 +492,114 @@ def test_organize_required_field(simple2_nwb: Path, tmp_path: Path) -> None:
         tmp_path / dandiset_metadata_file,
         tmp_path / "sub-mouse001" / "sub-mouse001_ses-session-id1.nwb",
     ]
+
+
+@mark_xfail_windows_python313_posixsubprocess
+@mark.skipif_on_windows
+@pytest.mark.parametrize("mode", ["copy", "hardlink", "reflink"])
+def test_organize_over_symlinks(simple2_nwb: Path, tmp_path: Path, mode: str) -> None:
+    # Re-organizing in another mode must not write through the symlinks left
+    # by a previous run into the source files
+    src = tmp_path / "src" / "data.nwb"
+    src.parent.mkdir()
+    copy_nwb_file(simple2_nwb, src)
+    content = src.read_bytes()
+    outdir = tmp_path / "out"
+    outdir.mkdir()
+    (outdir / dandiset_metadata_file).write_text("{}\n")
+    for files_mode in ["symlink", mode]:
+        r = CliRunner().invoke(
+            organize,
+            ["-f", files_mode, "--dandiset-path", str(outdir), str(src)],
+        )
+        assert r.exit_code == 0, r.output
+    assert src.read_bytes() == content
+
+
+def test_organize_incremental(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    outdir = tmp_path / "organized"
+    file_metadata: dict[str, dict[str, Any]] = {}
+    extracted: list[str] = []
+
+    def get_metadata(path: str) -> dict:
+        extracted.append(Path(path).name)
+        return dict(
+            file_metadata[Path(path).name],
+            nwb_version="2.0.1",
+            external_file_objects=[],
+        )
+
+    monkeypatch.setattr("dandi.organize._get_metadata", get_metadata)
+
+    def add_file(name: str, **metadata: Any) -> None:
+        (src / name).write_text(name)
+        file_metadata[name] = metadata
+
+    def organized() -> list[str]:
+        return sorted(
+            Path(p).relative_to(outdir).as_posix()
+            for p in find_files(".*", paths=outdir)
+        )
+
+    def run() -> list[str]:
+        extracted.clear()
+        organize_mod.organize(
+            [str(src)],
+            dandiset_path=str(outdir),
+            files_mode=FileOperationMode.COPY,
+            devel_debug=True,
+            incremental=True,
+        )
+        return sorted(extracted)
+
+    add_file("a.nwb", subject_id="1", probe_ids=[1])
+    add_file("b.nwb", subject_id="2")
+    assert run() == ["a.nwb", "b.nwb"]
+    assert (outdir / ORGANIZE_JOURNAL).exists()
+    assert organized() == ["sub-1/sub-1.nwb", "sub-2/sub-2.nwb"]
+
+    # Nothing new
+    assert run() == []
+
+    # A new file is named alongside the organized ones
+    add_file("c.nwb", subject_id="3")
+    assert run() == ["c.nwb"]
+    assert (outdir / "sub-3" / "sub-3.nwb").read_text() == "c.nwb"
+
+    # A new file that collides with an organized one is disambiguated
+    # together with it
+    add_file("d.nwb", subject_id="1", probe_ids=[2])
+    assert run() == ["d.nwb"]
+    assert organized() == [
+        "sub-1/sub-1_probe-1.nwb",
+        "sub-1/sub-1_probe-2.nwb",
+        "sub-2/sub-2.nwb",
+        "sub-3/sub-3.nwb",
+    ]
+    assert (outdir / "sub-1" / "sub-1_probe-1.nwb").read_text() == "a.nwb"
+    assert run() == []
+
+    # Removed organized files are organized again
+    (outdir / "sub-2" / "sub-2.nwb").unlink()
+    assert run() == ["b.nwb"]
+    assert (outdir / "sub-2" / "sub-2.nwb").read_text() == "b.nwb"
+
+    # Modified files replace their organized versions
+    (src / "c.nwb").write_text("c.nwb modified")
+    os.utime(src / "c.nwb", ns=(1_000_000_000, 1_000_000_000))
+    assert run() == ["c.nwb"]
+    assert (outdir / "sub-3" / "sub-3.nwb").read_text() == "c.nwb modified"
+    assert run() == []
+    (src / "b.nwb").write_text("b.nwb modified")
+    os.utime(src / "b.nwb", ns=(1_000_000_000, 1_000_000_000))
+    file_metadata["b.nwb"] = {"subject_id": "4"}
+    assert run() == ["b.nwb"]
+    assert organized() == [
+        "sub-1/sub-1_probe-1.nwb",
+        "sub-1/sub-1_probe-2.nwb",
+        "sub-3/sub-3.nwb",
+        "sub-4/sub-4.nwb",
+    ]
+    assert run() == []
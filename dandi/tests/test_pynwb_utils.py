@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import re
 from typing import Any, NoReturn
 
+import h5py
 import numpy as np
 from pynwb import NWBHDF5IO, NWBFile, TimeSeries
-
-from ..pynwb_utils import _sanitize_nwb_version, nwb_has_external_links
+from pynwb.file import Subject
+import pytest
+from pytest_mock import MockerFixture
+
+from .. import pynwb_utils
+from ..pynwb_utils import (
+    _get_pynwb_metadata,
+    _ReadBudget,
+    _sanitize_nwb_version,
+    _spike_time_bounds,
+    get_nwb_version,
+    get_object_id,
+    nwb_file_session,
+    nwb_has_external_links,
+    validate,
+)
 
 
 def test_pynwb_io(simple1_nwb: Path) -> None:
@@ -103,3 +118,81 @@ def test_nwb_has_external_links(tmp_path):
 
     assert not nwb_has_external_links(filename1)
     assert nwb_has_external_links(filename4)
+
+
+def test_nwb_file_session(mocker: MockerFixture, simple1_nwb: Path) -> None:
+    spy = mocker.spy(pynwb_utils, "open_readable")
+    with nwb_file_session(simple1_nwb) as session:
+        meta = _get_pynwb_metadata(simple1_nwb)
+        # Nested sessions for the same file are shared:
+        with nwb_file_session(str(simple1_nwb)) as session2:
+            assert session2 is session
+            assert get_nwb_version(simple1_nwb) is not None
+        assert get_object_id(simple1_nwb) == session.nwbfile.object_id
+        assert _get_pynwb_metadata(simple1_nwb) == meta
+        assert validate(simple1_nwb) == []
+    assert spy.call_count == 1
+    # The file is reopened by a new session once the old one has been closed:
+    assert _get_pynwb_metadata(simple1_nwb) == meta
+    assert spy.call_count == 2
+
+
+def test_read_h5py_metadata(mocker: MockerFixture, tmp_path: Path) -> None:
+    nwbfile = NWBFile(
+        session_description="fast path",
+        identifier="NWBFAST",
+        session_start_time=datetime(2017, 4, 3, 11, tzinfo=timezone.utc),
+        experimenter="Experimenter A",
+        keywords=["one", "two"],
+        subject=Subject(subject_id="mouse001", species="Mus musculus", sex="M"),
+    )
+    nwbfile.add_acquisition(
+        TimeSeries(name="ts", data=np.arange(100.0), unit="m", rate=10.0)
+    )
+    device = nwbfile.create_device("probe")
+    group = nwbfile.create_electrode_group("shank", "desc", "loc", device)
+    for _ in range(3):
+        nwbfile.add_electrode(group=group, location="CA1")
+    nwbfile.add_unit(spike_times=[1.0, 2.0, 15.0])
+    nwbfile.add_unit(spike_times=[0.5, 7.0])
+    nwbfile.add_trial(start_time=0.2, stop_time=9.0)
+    path = tmp_path / "fast.nwb"
+    with NWBHDF5IO(path, "w") as io:
+        io.write(nwbfile)
+
+    with nwb_file_session(path) as session:
+        full = pynwb_utils._read_pynwb_metadata(session)
+    assert full["session_end_time"] - full["session_start_time"] == timedelta(
+        seconds=15
+    )
+    spy = mocker.spy(pynwb_utils, "_read_pynwb_metadata")
+    with nwb_file_session(path) as session:
+        r = pynwb_utils._read_h5py_metadata(session)
+        assert r is not None
+        fast, unresolved = r
+        assert unresolved == set()
+        assert fast == full
+        assert pynwb_utils._read_nwb_metadata(session) == full
+    spy.assert_not_called()
+
+
+def test_spike_time_bounds(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # 20 units with 50000 spikes each; unit i spikes over [i, i + 500]
+    spikes = np.concatenate([np.linspace(i, i + 500, 50_000) for i in range(20)])
+    spikes[0] = 0.5
+    index = np.arange(50_000, 1_000_001, 50_000)
+    with h5py.File(tmp_path / "spikes.h5", "w") as f:
+        data = f.create_dataset("spike_times", data=spikes, chunks=(4096,))
+        idx = f.create_dataset("spike_times_index", data=index)
+        budget = _ReadBudget()
+        assert _spike_time_bounds(idx, data, budget) == (0.5, 519.0)
+        assert not budget.exceeded
+        # Only the chunks holding the first & last spike of each unit are read
+        read = pynwb_utils.SESSION_DURATION_READ_LIMIT - budget.remaining
+        assert read < spikes.nbytes / 4
+        monkeypatch.setattr(pynwb_utils, "SESSION_DURATION_READ_LIMIT", 4096)
+        budget = _ReadBudget()
+        assert _spike_time_bounds(idx, data, budget) == (0.5, 519.0)
+        assert budget.exceeded
+    assert _spike_time_bounds([0, 2, 2], [1.0, 3.0], _ReadBudget()) == (1.0, 3.0)
+    assert _spike_time_bounds([0, 0], [], _ReadBudget()) is None
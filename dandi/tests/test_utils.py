@@ -3,8 +3,10 @@ from __future__ import annotations
 from collections.abc import Iterable
 import inspect
 import logging
+import os
 import os.path as op
 from pathlib import Path
+import shutil
 import time
 
 import pytest
@@ -17,6 +19,7 @@ from .. import __version__
 from ..consts import DandiInstance, known_instances
 from ..exceptions import BadCliVersionError, CliVersionTooOldError
 from ..utils import (
+    PathTrie,
     _get_instance,
     ensure_datetime,
     ensure_strtime,
@@ -32,6 +35,7 @@ from ..utils import (
     is_url,
     on_windows,
     post_upload_size_check,
+    reflink_file,
     under_paths,
 )
 
@@ -566,6 +570,40 @@ def test_under_paths(
     assert list(map(str, under_paths(paths, filter_paths))) == results
 
 
+def test_path_trie() -> None:
+    trie: PathTrie[int] = PathTrie()
+    trie["a/b/c"] = 1
+    trie["a/b/d"] = 2
+    trie["a/e"] = 3
+    trie["f"] = 4
+    assert len(trie) == 4
+    assert trie["a/b/c"] == 1
+    assert "a/b" not in trie
+    assert trie.get("a/b") is None
+    assert trie.is_dir("a/b")
+    assert not trie.is_dir("a/b/c")
+    assert not trie.is_dir("nonexistent")
+    assert [(str(p), v) for p, v in trie.items_under("a")] == [
+        ("a/b/c", 1),
+        ("a/b/d", 2),
+        ("a/e", 3),
+    ]
+    assert [str(p) for p, _ in trie.items_under("")] == ["a/b/c", "a/b/d", "a/e", "f"]
+    assert list(trie.items_under("a/x")) == []
+    trie.prune("a/b")
+    assert len(trie) == 2
+    assert not trie.is_dir("a/b")
+    with pytest.raises(KeyError):
+        trie["a/b/c"]
+    trie["g/h/i"] = 5
+    trie.prune("g/h/i")
+    assert len(trie) == 2
+    assert not trie.is_dir("g")
+    assert trie.is_dir("a")
+    with pytest.raises(ValueError):
+        trie["../x"] = 5
+
+
 def test_post_upload_size_check_not_erroring(tmp_path: Path) -> None:
     p = tmp_path / "file.txt"
     # Write bytes so the size is the same on Unix and Windows:
@@ -592,6 +630,41 @@ def test_post_upload_size_check_erroring(
     ) in caplog.record_tuples
 
 
+@pytest.mark.parametrize("clone_works", [True, False])
+def test_reflink_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, clone_works: bool
+) -> None:
+    src = tmp_path / "src.dat"
+    src.write_bytes(b"0123456789" * 100_000)
+    os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+    if not clone_works:
+
+        def no_clone(*_args: object) -> None:
+            raise OSError("Operation not supported")
+
+        monkeypatch.setattr("dandi.utils.clone_file", no_clone)
+    dst = tmp_path / "dst.dat"
+    reflink_file(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == 1_000_000_000
+
+
+@mark.skipif_on_windows
+def test_reflink_file_existing_dst(tmp_path: Path) -> None:
+    src = tmp_path / "src.dat"
+    src.write_bytes(b"0123456789")
+    link = tmp_path / "link.dat"
+    link.symlink_to(src)
+    with pytest.raises(shutil.SameFileError):
+        reflink_file(src, link)
+    other = tmp_path / "other.dat"
+    other.write_bytes(b"other")
+    with pytest.raises(FileExistsError):
+        reflink_file(src, other)
+    assert src.read_bytes() == b"0123456789"
+    assert other.read_bytes() == b"other"
+
+
 class TestIsUrl:
     @pytest.mark.parametrize(
         "s",
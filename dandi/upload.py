@@ -16,6 +16,7 @@ from collections.abc import Iterator, Sequence
 from contextlib import ExitStack
 from enum import StrEnum
 import io
+import logging
 import os.path
 from pathlib import Path
 import re
@@ -38,14 +39,17 @@ from .consts import (
 )
 from .dandiapi import DandiAPIClient, RemoteAsset
 from .dandiset import Dandiset
+from .delete import delete_assets
 from .exceptions import NotFoundError, UploadError
 from .files import (
     DandiFile,
     DandisetMetadataFile,
     LocalAsset,
     LocalDirectoryAsset,
+    NWBAsset,
     ZarrAsset,
 )
+from .metadata.extractor import MetadataExtractor, get_metadata_extractor
 from .misctypes import Digest
 from .support import pyout as pyouts
 from .support.pyout import naturalsize
@@ -225,10 +229,16 @@ def upload(
             )
 
         # Avoid heavy import by importing within function:
-        from .pynwb_utils import ignore_benign_pynwb_warnings
+        from .pynwb_utils import ignore_benign_pynwb_warnings, nwb_file_session
 
         ignore_benign_pynwb_warnings()  # so validate doesn't whine
 
+        # NWB metadata extraction is CPU-bound, so it is done in worker
+        # processes rather than in the pyout worker threads
+        extractor = (
+            MetadataExtractor(jobs=1) if devel_debug else get_metadata_extractor()
+        )
+
         if not paths:
             paths = [dandiset.path]
 
@@ -274,6 +284,13 @@ def upload(
             """
             nonlocal upload_err, validate_ok
             strpath = str(dfile.filepath)
+            # Holds the NWBFileSession shared by pynwb & nwbinspector
+            # validation, which is closed before metadata extraction
+            nwb_session = ExitStack()
+            # Holds the snapshot of a Zarr's file tree shared by validation &
+            # metadata extraction, which is released before the upload, as
+            # that scans the tree anew
+            zarr_snapshot = ExitStack()
             try:
                 if not isinstance(dfile, LocalDirectoryAsset):
                     try:
@@ -287,6 +304,11 @@ def upload(
                 # Check for .dandidownload paths that indicate incomplete downloads
                 _check_dandidownload_paths(dfile)
 
+                if isinstance(dfile, NWBAsset):
+                    nwb_session.enter_context(nwb_file_session(dfile.filepath))
+                elif isinstance(dfile, ZarrAsset):
+                    zarr_snapshot.enter_context(dfile.hold_snapshot(jobs=jobs_per_file))
+
                 #
                 # Validate first, so we do not bother server at all if not kosher
                 #
@@ -383,10 +405,19 @@ def upload(
                 # TODO: allow for for non-nwb files to skip this step
                 # ad-hoc for dandiset.yaml for now
                 yield {"status": "extracting metadata"}
+                nwb_session.close()
                 try:
-                    metadata = dfile.get_metadata(
-                        digest=file_etag, ignore_errors=allow_any_path
-                    ).model_dump(mode="json", exclude_none=True)
+                    if isinstance(dfile, NWBAsset):
+                        metadata = extractor.run(
+                            _get_asset_metadata,
+                            dfile,
+                            digest=file_etag,
+                            ignore_errors=allow_any_path,
+                        )
+                    else:
+                        metadata = _get_asset_metadata(
+                            dfile, digest=file_etag, ignore_errors=allow_any_path
+                        )
                 except Exception as e:
                     raise UploadError("failed to extract metadata: %s" % str(e))
 
@@ -394,6 +425,7 @@ def upload(
                 # Upload file
                 #
                 yield {"status": "uploading"}
+                zarr_snapshot.close()
                 validating = False
                 for r in dfile.iter_upload(
                     remote_dandiset, metadata, jobs=jobs_per_file, replacing=extant
@@ -423,6 +455,8 @@ def upload(
                 uploaded_paths[strpath]["errors"].append(message)
                 yield error_file(message)
             finally:
+                nwb_session.close()
+                zarr_snapshot.close()
                 process_paths.remove(strpath)
 
         # We will again use pyout to provide a neat table summarizing our progress
@@ -520,8 +554,41 @@ def upload(
                     f"Delete {pluralize(len(to_delete), 'asset')} on server?"
                 )
             ):
-                for asset in to_delete:
-                    asset.delete()
+                failed = 0
+                step = max(len(to_delete) // 10, 1)
+                for done, (asset, error) in enumerate(
+                    delete_assets(to_delete, jobs=jobs), start=1
+                ):
+                    if error is not None:
+                        lgr.error(
+                            "Failed to delete asset %r on server: %s: %s",
+                            asset.path,
+                            type(error).__name__,
+                            error,
+                        )
+                        failed += 1
+                    lgr.log(
+                        (
+                            logging.INFO
+                            if done % step == 0 or done == len(to_delete)
+                            else logging.DEBUG
+                        ),
+                        "Processed %d out of %d assets to delete on server",
+                        done,
+                        len(to_delete),
+                    )
+                if failed:
+                    raise UploadError(
+                        f"Failed to delete {pluralize(failed, 'asset')} on server"
+                    )
+
+
+def _get_asset_metadata(
+    dfile: LocalAsset, digest: Digest | None, ignore_errors: bool
+) -> dict:
+    return dfile.get_metadata(digest=digest, ignore_errors=ignore_errors).model_dump(
+        mode="json", exclude_none=True
+    )
 
 
 def check_replace_asset(
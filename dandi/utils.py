@@ -5,6 +5,7 @@ from collections.abc import Iterable, Iterator
 import datetime
 from email.utils import parsedate_to_datetime
 from enum import Enum
+import errno
 from functools import lru_cache
 from importlib.metadata import version as importlib_version
 import inspect
@@ -24,7 +25,7 @@ import sys
 from time import sleep
 import traceback
 import types
-from typing import IO, Any, List, Optional, Protocol, TypeVar, Union
+from typing import IO, Any, Generic, List, Optional, Protocol, TypeVar, Union, cast
 
 import dateutil.parser
 from multidict import MultiDict  # dependency of yarl
@@ -393,6 +394,81 @@ def copy_file(src: AnyPath, dst: AnyPath) -> None:
         shutil.copy2(src, dst)
 
 
+#: The ``FICLONE`` ioctl request (from ``linux/fs.h``)
+_FICLONE = 0x40049409
+
+
+def clone_file(src: AnyPath, dst: AnyPath) -> None:
+    """
+    Make dst a reflink (a copy-on-write clone sharing its data blocks) of src
+    and copy src's permission bits & timestamps like `shutil.copy2`.  dst must
+    not exist yet.  Raises `OSError` if the platform or filesystem does not
+    support reflinks, in which case dst is not left behind.
+    """
+    if sys.platform != "linux":
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are only supported on Linux")
+    import fcntl
+
+    with open(src, "rb") as fsrc:
+        with _open_new_file(dst) as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except BaseException:
+                fdst.close()
+                os.unlink(dst)
+                raise
+    shutil.copystat(src, dst)
+
+
+def reflink_file(src: AnyPath, dst: AnyPath) -> None:
+    """
+    Copy file from src to dst as cheaply as the filesystem allows: as a
+    reflink if supported (e.g., on btrfs & XFS), else with
+    :func:`os.copy_file_range` (which lets the kernel copy without a round
+    trip through userspace, and NFS 4.2 servers copy server-side), else with a
+    regular `shutil.copy2`.
+
+    Unlike `shutil.copy2`, dst must not exist yet; in particular, a symlink at
+    dst is never followed, so that src cannot be truncated through it.
+    """
+    if op.lexists(dst):
+        if op.exists(dst) and op.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        raise FileExistsError(errno.EEXIST, "Destination already exists", str(dst))
+    try:
+        clone_file(src, dst)
+        return
+    except FileExistsError:
+        raise
+    except OSError as e:
+        lgr.debug("Could not reflink %s to %s: %s", src, dst, e)
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, _open_new_file(dst) as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+        except FileExistsError:
+            raise
+        except OSError as e:
+            # E.g., EXDEV across filesystems on older kernels
+            lgr.debug("Could not copy_file_range %s to %s: %s", src, dst, e)
+            # Only a regular file created by us can be left at dst here
+            Path(dst).unlink(missing_ok=True)
+        else:
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
+def _open_new_file(path: AnyPath) -> IO[bytes]:
+    """
+    Create a file at ``path`` and open it for writing in binary mode, failing
+    if anything (including a symlink) is already there
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0)
+    return os.fdopen(os.open(path, flags, 0o666), "wb")
+
+
 def move_file(src: AnyPath, dst: AnyPath) -> Any:
     """Move file from src to dst"""
     return shutil.move(str(src), str(dst))
@@ -863,23 +939,140 @@ def under_paths(
 
 
 def _prepare_path_parts(paths: Iterable[str | PurePath]) -> list[tuple[str, ...]]:
-    path_parts: list[tuple[str, ...]] = []
-    for p in paths:
-        pp = PurePosixPath(p)
-        if pp.is_absolute():
-            raise ValueError(f"Absolute path: {p!r}")
-        parts = pp.parts
-        if ".." in parts or "." in parts:
-            raise ValueError(f"Non-normalized path: {p!r}")
-        path_parts.append(parts)
+    path_parts = [split_relpath(p) for p in paths]
     path_parts.sort()
     return path_parts
 
 
+def split_relpath(path: str | PurePath) -> tuple[str, ...]:
+    """
+    Split a relative & normalized path into its POSIX path components, raising
+    a `ValueError` if it is absolute or contains '.' or '..'
+    """
+    pp = PurePosixPath(path)
+    if pp.is_absolute():
+        raise ValueError(f"Absolute path: {path!r}")
+    parts = pp.parts
+    if ".." in parts or "." in parts:
+        raise ValueError(f"Non-normalized path: {path!r}")
+    return parts
+
+
 def _starts_with(t: tuple[str, ...], prefix: tuple[str, ...]) -> bool:
     return t[: len(prefix)] == prefix
 
 
+class _PathTrieNode:
+    __slots__ = ("children", "has_value", "value")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PathTrieNode] = {}
+        self.has_value = False
+        self.value: Any = None
+
+    def iter_values(
+        self, prefix: tuple[str, ...]
+    ) -> Iterator[tuple[tuple[str, ...], Any]]:
+        if self.has_value:
+            yield (prefix, self.value)
+        for name in sorted(self.children):
+            yield from self.children[name].iter_values(prefix + (name,))
+
+
+class PathTrie(Generic[T]):
+    """
+    A prefix tree mapping relative & normalized POSIX paths to values, which
+    supports querying for all values at or under a given path without
+    scanning all the keys.  Paths that have values stored under them (but not
+    necessarily at them) are treated as (implicit) directories.
+    """
+
+    def __init__(self) -> None:
+        self._root = _PathTrieNode()
+        self._size = 0
+
+    def _find(self, path: str | PurePath) -> _PathTrieNode | None:
+        node = self._root
+        for name in split_relpath(path):
+            try:
+                node = node.children[name]
+            except KeyError:
+                return None
+        return node
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, path: str | PurePath) -> bool:
+        node = self._find(path)
+        return node is not None and node.has_value
+
+    def __getitem__(self, path: str | PurePath) -> T:
+        node = self._find(path)
+        if node is None or not node.has_value:
+            raise KeyError(path)
+        return cast(T, node.value)
+
+    def get(self, path: str | PurePath, default: T | None = None) -> T | None:
+        try:
+            return self[path]
+        except KeyError:
+            return default
+
+    def __setitem__(self, path: str | PurePath, value: T) -> None:
+        node = self._root
+        for name in split_relpath(path):
+            node = node.children.setdefault(name, _PathTrieNode())
+        if not node.has_value:
+            self._size += 1
+        node.has_value = True
+        node.value = value
+
+    def is_dir(self, path: str | PurePath) -> bool:
+        """
+        Returns true iff any values are stored strictly under ``path``
+        """
+        node = self._find(path)
+        return node is not None and bool(node.children)
+
+    def items_under(self, path: str | PurePath) -> Iterator[tuple[PurePosixPath, T]]:
+        """
+        Yield all ``(path, value)`` pairs at or under ``path`` in sorted order
+        of the paths' components
+        """
+        prefix = split_relpath(path)
+        node = self._find(path)
+        if node is not None:
+            for parts, value in node.iter_values(prefix):
+                yield (PurePosixPath(*parts), value)
+
+    def prune(self, path: str | PurePath) -> None:
+        """Remove all values at or under ``path``"""
+        parts = split_relpath(path)
+        if not parts:
+            self._root = _PathTrieNode()
+            self._size = 0
+            return
+        # nodes[i] is the node for parts[:i]
+        nodes = [self._root]
+        for name in parts[:-1]:
+            child = nodes[-1].children.get(name)
+            if child is None:
+                return
+            nodes.append(child)
+        node = nodes[-1].children.pop(parts[-1], None)
+        if node is None:
+            return
+        self._size -= sum(1 for _ in node.iter_values(()))
+        # Remove ancestors that no longer have any values under them so that
+        # they stop being treated as directories
+        for i in reversed(range(len(parts) - 1)):
+            child = nodes[i + 1]
+            if child.has_value or child.children:
+                break
+            del nodes[i].children[parts[i]]
+
+
 def pre_upload_size_check(path: Path) -> int:
     # If the filesystem reports a size of zero for a file we're about to
     # upload, double-check the size in case we're on a flaky NFS system.
@@ -10,13 +10,16 @@ Private submodules:
 - _core: Main validation functions (validate, validate_bids)
 - _types: Data types and models (ValidationResult, Origin, Severity, etc.)
 - _io: JSONL read/write utilities for validation results
+- _compact: Compact in-memory storage of many validation results
 
 Note: _core is NOT eagerly imported here to avoid circular imports
 (_core → dandi.files → dandi.validate._types → dandi.validate.__init__).
 Import from dandi.validate._core directly for validate/validate_bids.
 """
 
+from ._compact import ValidationResultStore
 from ._io import (
+    iter_validation_jsonl,
     load_validation_jsonl,
     validation_companion_path,
     write_validation_jsonl,
@@ -52,7 +55,9 @@ __all__ = [
     "Severity_",
     "Standard",
     "ValidationResult",
+    "ValidationResultStore",
     "Validator",
+    "iter_validation_jsonl",
     "load_validation_jsonl",
     "validation_companion_path",
     "write_validation_jsonl",
@@ -0,0 +1,159 @@
+"""Compact in-memory storage of large numbers of validation results."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Union
+
+from ._types import CURRENT_RECORD_VERSION, Origin, Scope, Severity, ValidationResult
+
+#: Fields of `ValidationResult` that are rarely set and so are stored
+#: together in a `dict` (or not at all) rather than in a column of their own
+_SPARSE_FIELDS = (
+    "asset_paths",
+    "within_asset_paths",
+    "metadata",
+    "origin_result",
+    "path_regex",
+    "record_version",
+)
+
+# id, origin index, scope, severity, message, path, dataset_path,
+# dandiset_path, sparse fields
+_Row = tuple[
+    str,
+    int,
+    Scope,
+    Union[Severity, None],
+    Union[str, None],
+    Union[Path, None],
+    Union[Path, None],
+    Union[Path, None],
+    Union[dict[str, Any], None],
+]
+
+
+class ValidationResultStore:
+    """
+    An append-only sequence of `ValidationResult`\\s stored compactly
+
+    Each result is kept as a tuple of its field values in which equal
+    `Origin`\\s, paths, IDs, and messages are shared, and rarely-set fields
+    take no space when unset.  `ValidationResult` objects are constructed
+    (without re-validation) only when accessed, so holding hundreds of
+    thousands of results costs a fraction of the memory of a list of them.
+
+    The ``origin_result`` of a result is retained by reference, and the
+    `ValidationResult`\\s produced for results with the same origin share the
+    same `Origin` instance, which must therefore not be modified.
+    """
+
+    __slots__ = ("_rows", "_origins", "_origin_index", "_interned")
+
+    def __init__(self, results: Iterable[ValidationResult] = ()) -> None:
+        self._rows: list[_Row] = []
+        self._origins: list[Origin] = []
+        self._origin_index: dict[tuple, int] = {}
+        self._interned: dict[Any, Any] = {}
+        self.extend(results)
+
+    def _intern(self, value: Any) -> Any:
+        if value is None:
+            return None
+        return self._interned.setdefault(value, value)
+
+    def _intern_origin(self, origin: Origin) -> int:
+        key = (
+            origin.type,
+            origin.validator,
+            origin.validator_version,
+            origin.standard,
+            origin.standard_version,
+            origin.standard_schema_version,
+        )
+        try:
+            return self._origin_index[key]
+        except KeyError:
+            self._origins.append(origin.model_copy())
+            i = self._origin_index[key] = len(self._origins) - 1
+            return i
+
+    def append(self, r: ValidationResult) -> None:
+        sparse = {
+            f: v
+            for f in _SPARSE_FIELDS
+            if (v := getattr(r, f)) is not None
+            and not (f == "record_version" and v == CURRENT_RECORD_VERSION)
+        }
+        self._rows.append(
+            (
+                self._intern(r.id),
+                self._intern_origin(r.origin),
+                r.scope,
+                r.severity,
+                self._intern(r.message),
+                self._intern(r.path),
+                self._intern(r.dataset_path),
+                self._intern(r.dandiset_path),
+                sparse or None,
+            )
+        )
+
+    def extend(self, results: Iterable[ValidationResult]) -> None:
+        for r in results:
+            self.append(r)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _build(self, row: _Row) -> ValidationResult:
+        (
+            id_,
+            origin,
+            scope,
+            severity,
+            message,
+            path,
+            dataset_path,
+            dandiset_path,
+            sparse,
+        ) = row
+        return ValidationResult.model_construct(
+            id=id_,
+            origin=self._origins[origin],
+            scope=scope,
+            severity=severity,
+            message=message,
+            path=path,
+            dataset_path=dataset_path,
+            dandiset_path=dandiset_path,
+            **(sparse or {}),
+        )
+
+    def __getitem__(self, i: int) -> ValidationResult:
+        return self._build(self._rows[i])
+
+    def __iter__(self) -> Iterator[ValidationResult]:
+        for row in self._rows:
+            yield self._build(row)
+
+    def select(self, indices: Iterable[int]) -> list[ValidationResult]:
+        """Return the results at the given indices"""
+        return [self._build(self._rows[i]) for i in indices]
+
+    def index_by_path(self, root: Path) -> dict[str, list[int]]:
+        """
+        Return the indices of the results that have a path, keyed by the
+        ``/``-separated path relative to *root*
+        """
+        index: dict[str, list[int]] = {}
+        relpaths: dict[Path, str] = {}
+        for i, row in enumerate(self._rows):
+            if (path := row[5]) is not None:
+                try:
+                    rel = relpaths[path]
+                except KeyError:
+                    rel = relpaths[path] = path.relative_to(root).as_posix()
+                index.setdefault(rel, []).append(i)
+        return index
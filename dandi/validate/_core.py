@@ -9,9 +9,13 @@ This module provides validation functionality for dandisets, including:
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext
 import os
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Any
 
 from ._types import (
@@ -25,10 +29,19 @@ from ._types import (
     ValidationResult,
     Validator,
 )
+from .. import get_logger
 from ..consts import dandiset_metadata_file
-from ..files import find_dandi_files
+from ..files import DandiFile, NWBAsset, find_dandi_files
+from ..files.bases import validation_cache_disabled
+from ..metadata.extractor import (
+    ExtractionResult,
+    MetadataExtractor,
+    get_metadata_extractor,
+)
 from ..utils import find_parent_directory_containing
 
+lgr = get_logger()
+
 BIDS_TO_DANDI = {
     "subject": "subject_id",
     "session": "session_id",
@@ -73,6 +86,10 @@ def validate_bids(
         standard_version=validation_result["bids_version"],
     )
 
+    # Each result's `origin_result` is only its own item of `validation_result`,
+    # as referencing the whole of it would keep every listing in it alive for as
+    # long as any of the results.
+
     # Storing variable to not re-compute set paths for each individual file.
     parent_path = None
     for path in validation_result["path_tracking"]:
@@ -94,7 +111,7 @@ def validate_bids(
                 severity=Severity.ERROR,
                 id="BIDS.NON_BIDS_PATH_PLACEHOLDER",
                 scope=Scope.FILE,
-                origin_result=validation_result,
+                origin_result=path,
                 path=Path(path),
                 message="File does not match any pattern known to BIDS.",
                 dataset_path=dataset_path,
@@ -114,7 +131,7 @@ def validate_bids(
                     severity=Severity.ERROR,
                     id="BIDS.MANDATORY_FILE_MISSING_PLACEHOLDER",
                     scope=Scope.DATASET,
-                    origin_result=validation_result,
+                    origin_result=pattern,
                     path_regex=pattern["regex"],
                     message="BIDS-required file is not present.",
                 )
@@ -122,7 +139,8 @@ def validate_bids(
 
     # Storing variable to not re-compute set paths for each individual file.
     parent_path = None
-    for meta in validation_result["match_listing"]:
+    for match in validation_result["match_listing"]:
+        meta = dict(match)
         file_path = meta.pop("path")
         meta = {BIDS_TO_DANDI[k]: v for k, v in meta.items() if k in BIDS_TO_DANDI}
         if parent_path != os.path.dirname(file_path):
@@ -138,7 +156,7 @@ def validate_bids(
                 origin=origin,
                 id="BIDS.MATCH",
                 scope=Scope.FILE,
-                origin_result=validation_result,
+                origin_result=match,
                 path=Path(file_path),
                 metadata=meta,
                 dataset_path=dataset_path,
@@ -170,6 +188,9 @@ def validate(
     devel_debug: bool = False,
     allow_any_path: bool = False,
     missing_file_content: MissingFileContent = MissingFileContent.error,
+    jobs: int | None = None,
+    cache: bool = True,
+    ordered: bool = False,
 ) -> Iterator[ValidationResult]:
     """Validate content
 
@@ -182,6 +203,17 @@ def validate(
       datalad dataset without fetched data).  ``error`` emits a concise error,
       ``skip`` skips the file with a warning, ``only-non-data`` skips
       content-dependent validators but still validates path layout.
+    jobs : int, optional
+      Number of worker processes in which to validate NWB files.  If not
+      given, all files are validated in the calling process.  Results are
+      yielded as soon as each file has been validated.
+    cache : bool
+      Whether to reuse (and store) the results of validating unchanged files
+      from (in) the persistent validation cache.
+    ordered : bool
+      If true, the files under each path are validated, and their results
+      yielded, in order of their paths.  Otherwise, results are yielded in
+      the order in which the files are found and finish validating.
 
     Yields
     ------
@@ -198,6 +230,19 @@ def validate(
     # The ids of the objects in `df_results` obtain through the `id()` built-in function
     df_result_ids: set[int] = set()
 
+    def dedup(results: Iterable[ValidationResult]) -> Iterator[ValidationResult]:
+        for r in results:
+            r_id = id(r)
+            if r_id not in df_result_ids:
+                df_results.append(r)
+                df_result_ids.add(r_id)
+                yield r
+
+    if jobs is None or devel_debug:
+        extractor = MetadataExtractor(jobs=1)
+    else:
+        extractor = get_metadata_extractor(jobs)
+
     for p in paths:
         p = os.path.abspath(p)
         dandiset_path = find_parent_directory_containing(dandiset_metadata_file, p)
@@ -210,18 +255,24 @@ def validate(
                 path=Path(p),
                 message="Path is not inside a Dandiset",
             )
-        for df in find_dandi_files(
+        dandi_files: Iterable[DandiFile] = find_dandi_files(
             p, dandiset_path=dandiset_path, allow_all=allow_any_path
-        ):
+        )
+        if ordered:
+            dandi_files = sorted(dandi_files, key=lambda df: df.filepath)
+        # The results for each file, in the order in which they are to be
+        # yielded; NWB files validated in worker processes are represented by
+        # futures until they are done
+        slots: deque[list[ValidationResult] | _ValidationFuture] = deque()
+        # Futures are put here by worker threads when they are done
+        completed: SimpleQueue[_ValidationFuture] = SimpleQueue()
+        npending = 0
+        for df in dandi_files:
             # Handle broken symlinks (missing file content)
             if _is_broken_symlink(df.filepath):
                 r = _handle_missing_content(df, missing_file_content)
                 if r is not None:
-                    r_id = id(r)
-                    if r_id not in df_result_ids:
-                        df_results.append(r)
-                        df_result_ids.add(r_id)
-                        yield r
+                    slots.append([r])
                 if missing_file_content in (
                     MissingFileContent.skip,
                     MissingFileContent.error,
@@ -230,11 +281,31 @@ def validate(
                 # only-non-data: fall through but pass the flag to validators
 
             is_broken = _is_broken_symlink(df.filepath)
-            for r in df.get_validation_errors(
-                schema_version=schema_version,
-                devel_debug=devel_debug,
-                missing_file_content=(missing_file_content if is_broken else None),
-            ):
+            if extractor.jobs > 1 and not is_broken and type(df) is NWBAsset:
+                # pynwb validation & nwbinspector are CPU-bound; BIDS assets
+                # are left in this process, as they share the validation of
+                # their whole dataset
+                item: DandiFile = df
+                fut = extractor.submit(
+                    _get_validation_errors,
+                    item,
+                    schema_version=schema_version,
+                    cache=cache,
+                )
+                if ordered:
+                    slots.append(fut)
+                else:
+                    npending += 1
+                    fut.add_done_callback(completed.put)
+            else:
+                with _cache_context(cache):
+                    results = df.get_validation_errors(
+                        schema_version=schema_version,
+                        devel_debug=devel_debug,
+                        missing_file_content=(
+                            missing_file_content if is_broken else None
+                        ),
+                    )
                 # For broken-symlink files under only-non-data, suppress
                 # BIDS errors that require reading file content (e.g.
                 # NIFTI_HEADER_UNREADABLE).  The validator ran in full so
@@ -242,14 +313,71 @@ def validate(
                 if (
                     is_broken
                     and missing_file_content == MissingFileContent.only_non_data
-                    and r.id in _BIDS_CONTENT_DEPENDENT_CODES
                 ):
-                    continue
-                r_id = id(r)
-                if r_id not in df_result_ids:
-                    df_results.append(r)
-                    df_result_ids.add(r_id)
-                    yield r
+                    results = [
+                        r for r in results if r.id not in _BIDS_CONTENT_DEPENDENT_CODES
+                    ]
+                slots.append(results)
+            if ordered:
+                # Yield the results of the leading files that are done
+                while slots and (isinstance(slots[0], list) or slots[0].done()):
+                    yield from dedup(
+                        _slot_results(slots.popleft(), schema_version, cache)
+                    )
+            else:
+                while slots:
+                    yield from dedup(
+                        _slot_results(slots.popleft(), schema_version, cache)
+                    )
+                while not completed.empty():
+                    npending -= 1
+                    yield from dedup(
+                        _slot_results(completed.get(), schema_version, cache)
+                    )
+        while slots:
+            yield from dedup(_slot_results(slots.popleft(), schema_version, cache))
+        while npending:
+            npending -= 1
+            yield from dedup(_slot_results(completed.get(), schema_version, cache))
+
+
+_ValidationFuture = Future[ExtractionResult[DandiFile, list[ValidationResult]]]
+
+
+def _slot_results(
+    slot: list[ValidationResult] | _ValidationFuture,
+    schema_version: str | None,
+    cache: bool,
+) -> list[ValidationResult]:
+    """
+    Return the results in a slot of `validate()`, waiting for them if they
+    are being computed in a worker process
+    """
+    if isinstance(slot, list):
+        return slot
+    res = slot.result()
+    if res.error is None:
+        assert res.value is not None
+        return res.value
+    # E.g., the results could not be transferred from the worker process, so
+    # validate again here to get them
+    lgr.debug(
+        "Failed to validate %s in a worker process: %s",
+        res.item.filepath,
+        "".join(res.error.traceback),
+    )
+    return _get_validation_errors(res.item, schema_version, cache)
+
+
+def _get_validation_errors(
+    df: DandiFile, schema_version: str | None, cache: bool
+) -> list[ValidationResult]:
+    with _cache_context(cache):
+        return df.get_validation_errors(schema_version=schema_version)
+
+
+def _cache_context(cache: bool) -> AbstractContextManager[None]:
+    return nullcontext() if cache else validation_cache_disabled()
 
 
 def _handle_missing_content(
@@ -261,8 +389,6 @@ def _handle_missing_content(
     Returns ``None`` when *policy* is ``only-non-data`` (a warning is not
     needed because validation still proceeds on the non-data aspects).
     """
-    from ..files import DandiFile
-
     assert isinstance(df, DandiFile)
     filepath = df.filepath
 
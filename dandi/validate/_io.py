@@ -2,18 +2,219 @@
 
 Provides functions for writing, appending, and loading validation results
 as JSONL (JSON Lines) files — one ValidationResult per line.
+
+Files whose names end in ``.gz`` or ``.zst`` are compressed (the latter
+requires the ``zstandard`` package) as a sequence of independently
+decompressible blocks.  Each file is accompanied by a sidecar index
+(`validation_index_path()`) recording, for every result, its location in the
+file along with its severity, ID, and path, so that readers can select
+results without parsing the whole file.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+import gzip
+import json
+import os
 from pathlib import Path
+import re
+import threading
+from types import TracebackType
+from typing import IO, Any, Union
+import zlib
+
+from fasteners import InterProcessLock
+
+from ._types import Severity, ValidationResult
+
+#: Once a compressed file's buffered block of results reaches this
+#: (uncompressed) size, it is compressed and written out
+BLOCK_SIZE = 1 << 22
+
+#: Locks serializing appends to each file (keyed by its absolute path) by
+#: threads of this process, which the inter-process lock files do not
+_append_locks: dict[str, threading.Lock] = {}
+_append_locks_guard = threading.Lock()
+
+#: An entry in a validation index: the offset of the record (or, in a
+#: compressed file, of its block), the offset of the record within its
+#: decompressed block, the value of its severity, its ID, and its path
+IndexEntry = tuple[int, int, Union[int, None], str, Union[str, None]]
+
+
+def _get_append_lock(path: Path) -> threading.Lock:
+    with _append_locks_guard:
+        return _append_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def validation_index_path(path: str | Path) -> Path:
+    """Return the path of the sidecar index for the validation results file
+    at *path*"""
+    path = Path(path)
+    return path.with_name(path.name + ".idx")
+
+
+def _get_compression(path: Path) -> str | None:
+    if path.suffix == ".gz":
+        return "gzip"
+    elif path.suffix == ".zst":
+        return "zstd"
+    else:
+        return None
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(data)
+    else:
+        return _zstd().ZstdCompressor().compress(data)  # type: ignore[no-any-return]
 
-from ._types import ValidationResult
+
+def _decompressobj(compression: str) -> Any:
+    if compression == "gzip":
+        return zlib.decompressobj(wbits=31)
+    else:
+        return _zstd().ZstdDecompressor().decompressobj()
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(
+            "The zstandard package is required for reading or writing"
+            " zstd-compressed validation results"
+        )
+    return zstandard
+
+
+class ValidationLogWriter:
+    """Writes validation results to a JSONL file and its sidecar index.
+
+    Use as a context manager.  When appending, an inter-process lock is held
+    for the duration, so concurrent writers (e.g., parallel upload workers)
+    can safely append to the same file.
+    """
+
+    def __init__(self, path: str | Path, *, append: bool = False) -> None:
+        self.path = Path(path)
+        self.append = append
+        self.compression = _get_compression(self.path)
+        self._lock: InterProcessLock | None = None
+        self._thread_lock: threading.Lock | None = None
+        self._fp: IO[bytes] | None = None
+        self._index: IO[str] | None = None
+        #: Offset in the file at which the next record or block is written
+        self._offset = 0
+        self._block = bytearray()
+        self._block_entries: list[IndexEntry] = []
+
+    def __enter__(self) -> ValidationLogWriter:
+        if self.append:
+            thread_lock = _get_append_lock(self.path)
+            thread_lock.acquire()
+            lock = InterProcessLock(str(self.path) + ".lock")
+            try:
+                lock.acquire()
+            except BaseException:
+                thread_lock.release()
+                raise
+            self._thread_lock = thread_lock
+            self._lock = lock
+        try:
+            index_path = validation_index_path(self.path)
+            if self.append and self.path.exists():
+                # Only extend an index that is known to match the file
+                index_valid = _load_index(self.path) is not None
+                index_mode = "a"
+            else:
+                # Discard any index left behind by a since deleted file
+                index_valid = True
+                index_mode = "w"
+            self._fp = self.path.open("ab" if self.append else "wb")
+            self._offset = self._fp.tell()
+            if index_valid:
+                self._index = index_path.open(index_mode)
+            else:
+                # Results appended to a file without a (valid) index can't be
+                # indexed either, so readers will have to scan the file
+                index_path.unlink(missing_ok=True)
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, r: ValidationResult) -> None:
+        """Write a single result"""
+        assert self._fp is not None, "Writer used outside of its context"
+        line = r.model_dump_json().encode("utf-8") + b"\n"
+        entry: IndexEntry = (
+            self._offset,
+            len(self._block),
+            r.severity.value if r.severity is not None else None,
+            r.id,
+            r.path.as_posix() if r.path is not None else None,
+        )
+        if self.compression is None:
+            self._fp.write(line)
+            self._offset += len(line)
+            self._write_entries([entry])
+        else:
+            self._block += line
+            self._block_entries.append(entry)
+            if len(self._block) >= BLOCK_SIZE:
+                self._flush_block()
+
+    def _flush_block(self) -> None:
+        assert self._fp is not None
+        if self._block:
+            assert self.compression is not None
+            data = _compress(bytes(self._block), self.compression)
+            self._fp.write(data)
+            self._offset += len(data)
+            self._write_entries(self._block_entries)
+            self._block.clear()
+            self._block_entries.clear()
+
+    def _write_entries(self, entries: list[IndexEntry]) -> None:
+        if self._index is not None:
+            for e in entries:
+                self._index.write(json.dumps(e) + "\n")
+
+    def close(self) -> None:
+        """Flush all results and index entries, and release the lock"""
+        try:
+            if self._fp is not None:
+                self._flush_block()
+                self._fp.close()
+                self._fp = None
+                if self._index is not None:
+                    # Record the size of the file covered by the index, by
+                    # which readers can tell whether the index is current
+                    self._index.write(json.dumps({"size": self._offset}) + "\n")
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+        finally:
+            if self._lock is not None:
+                self._lock.release()
+                self._lock = None
+            if self._thread_lock is not None:
+                self._thread_lock.release()
+                self._thread_lock = None
 
 
 def write_validation_jsonl(
-    results: list[ValidationResult],
+    results: Iterable[ValidationResult],
     path: str | Path,
     *,
     append: bool = False,
@@ -23,23 +224,163 @@ def write_validation_jsonl(
     Parameters
     ----------
     results
-        List of ValidationResult objects to write.
+        ValidationResult objects to write.
     path
-        File path to write to.  Created if it does not exist.
+        File path to write to.  Created if it does not exist.  If it ends in
+        ``.gz`` or ``.zst``, the results are compressed.
     append
-        If True, append to an existing file instead of overwriting.
+        If True, append to an existing file instead of overwriting.  Appends
+        are serialized across processes with a lock file next to *path*.
 
     Returns
     -------
     Path
         The path written to (as a Path object).
     """
-    path = Path(path)
-    with path.open("a" if append else "w") as f:
+    with ValidationLogWriter(path, append=append) as writer:
         for r in results:
-            f.write(r.model_dump_json())
-            f.write("\n")
-    return path
+            writer.write(r)
+    return writer.path
+
+
+def _load_index(path: Path) -> list[IndexEntry] | None:
+    """Load the sidecar index for *path*, or return `None` if there is no
+    index or it does not cover the whole file"""
+    entries: list[IndexEntry] = []
+    size: int | None = None
+    try:
+        with validation_index_path(path).open() as f:
+            for line in f:
+                if line := line.strip():
+                    e = json.loads(line)
+                    if isinstance(e, dict):
+                        size = e["size"]
+                    else:
+                        entries.append(tuple(e))  # type: ignore[arg-type]
+    except (OSError, ValueError, KeyError):
+        return None
+    if size is None or size != os.path.getsize(path):
+        return None
+    return entries
+
+
+def _matches(
+    severity: int | None,
+    id_: str,
+    path: str | None,
+    min_severity: Severity | None,
+    ignore_re: re.Pattern[str] | None,
+    path_prefix: str | None,
+) -> bool:
+    if min_severity is not None and (severity is None or severity < min_severity):
+        return False
+    if ignore_re is not None and ignore_re.search(id_):
+        return False
+    if path_prefix is not None:
+        prefix = path_prefix.rstrip("/")
+        if path is None or not (path == prefix or path.startswith(prefix + "/")):
+            return False
+    return True
+
+
+def _read_block(f: IO[bytes], offset: int, compression: str) -> bytes:
+    """Decompress the single compressed block starting at *offset*"""
+    f.seek(offset)
+    d = _decompressobj(compression)
+    chunks: list[bytes] = []
+    while not d.eof:
+        data = f.read(1 << 16)
+        if not data:
+            break
+        chunks.append(d.decompress(data))
+    return b"".join(chunks)
+
+
+def _iter_indexed(path: Path, entries: list[IndexEntry]) -> Iterator[ValidationResult]:
+    compression = _get_compression(path)
+    with path.open("rb") as f:
+        block_offset: int | None = None
+        block = b""
+        for offset, inner, _, _, _ in entries:
+            if compression is None:
+                f.seek(offset)
+                line = f.readline()
+            else:
+                if offset != block_offset:
+                    block = _read_block(f, offset, compression)
+                    block_offset = offset
+                line = block[inner : block.index(b"\n", inner)]
+            yield ValidationResult.model_validate_json(line)
+
+
+def _iter_all(path: Path) -> Iterator[ValidationResult]:
+    compression = _get_compression(path)
+    f: IO[Any]
+    if compression == "gzip":
+        f = gzip.open(path, "rt")
+    elif compression == "zstd":
+        f = _zstd().open(path, "rt")
+    else:
+        f = path.open()
+    with f:
+        for line in f:
+            if line := line.strip():
+                yield ValidationResult.model_validate_json(line)
+
+
+def iter_validation_jsonl(
+    paths: Iterable[str | Path],
+    *,
+    min_severity: Severity | None = None,
+    ignore: str | None = None,
+    path_prefix: str | None = None,
+) -> Iterator[ValidationResult]:
+    """Lazily load validation results from one or more JSONL files.
+
+    When a file has a current sidecar index, only the results that pass the
+    filters are read & parsed; otherwise, every result is parsed and then
+    filtered.
+
+    Parameters
+    ----------
+    paths
+        Iterable of file paths to load from.
+    min_severity
+        Only yield results with at least this severity.
+    ignore
+        Regex; skip results with IDs matching it.
+    path_prefix
+        Only yield results for this path or paths under it.
+
+    Yields
+    ------
+    ValidationResult
+        The matching results from all files, in order.
+    """
+    ignore_re = re.compile(ignore) if ignore is not None else None
+    for p in paths:
+        p = Path(p)
+        entries = _load_index(p)
+        if entries is not None:
+            yield from _iter_indexed(
+                p,
+                [
+                    e
+                    for e in entries
+                    if _matches(e[2], e[3], e[4], min_severity, ignore_re, path_prefix)
+                ],
+            )
+        else:
+            for r in _iter_all(p):
+                if _matches(
+                    r.severity.value if r.severity is not None else None,
+                    r.id,
+                    r.path.as_posix() if r.path is not None else None,
+                    min_severity,
+                    ignore_re,
+                    path_prefix,
+                ):
+                    yield r
 
 
 def load_validation_jsonl(paths: Iterable[str | Path]) -> list[ValidationResult]:
@@ -55,14 +396,7 @@ def load_validation_jsonl(paths: Iterable[str | Path]) -> list[ValidationResult]
     list[ValidationResult]
         All results from all files, in order.
     """
-    results: list[ValidationResult] = []
-    for p in paths:
-        p = Path(p)
-        with p.open() as f:
-            for line in f:
-                if line := line.strip():
-                    results.append(ValidationResult.model_validate_json(line))
-    return results
+    return list(iter_validation_jsonl(paths))
 
 
 def validation_companion_path(logfile: str | Path) -> Path:
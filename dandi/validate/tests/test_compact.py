@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from dandi.validate._compact import ValidationResultStore
+from dandi.validate._types import (
+    Origin,
+    OriginType,
+    Scope,
+    Severity,
+    Standard,
+    ValidationResult,
+    Validator,
+)
+
+
+def _origin() -> Origin:
+    return Origin(
+        type=OriginType.VALIDATION,
+        validator=Validator.bids_validator_deno,
+        validator_version="2.0.0",
+        standard=Standard.BIDS,
+        standard_schema_version="1.0.0",
+    )
+
+
+def test_validation_result_store() -> None:
+    root = Path("/data/ds")
+    results = [
+        ValidationResult(
+            id=f"BIDS.CODE{i % 3}",
+            origin=_origin(),
+            scope=Scope.FILE,
+            origin_result={"big": list(range(100))},
+            severity=Severity.ERROR if i % 2 else Severity.HINT,
+            message=f"Message {i % 3}",
+            path=root / f"sub-{i % 4:02d}" / "anat.nii.gz",
+            dataset_path=root,
+        )
+        for i in range(20)
+    ]
+    results.append(
+        ValidationResult(
+            id="BIDS.MISSING",
+            origin=Origin(
+                type=OriginType.INTERNAL,
+                validator=Validator.dandi,
+                validator_version="1.0",
+            ),
+            scope=Scope.DATASET,
+            path_regex="^README$",
+            metadata={"subject_id": "01"},
+        )
+    )
+    store = ValidationResultStore(results)
+    assert len(store) == 21
+    assert [r.model_dump() for r in store] == [r.model_dump() for r in results]
+    assert store[-1].path_regex == "^README$"
+    assert store[-1].metadata == {"subject_id": "01"}
+    assert [r.origin_result for r in store] == [r.origin_result for r in results]
+    assert store[0].origin_result is results[0].origin_result
+
+    # Equal values are shared
+    assert store[0].origin is store[1].origin
+    assert store[0].origin is not store[-1].origin
+    assert store[0].path is store[4].path
+    assert store[0].message is store[3].message
+
+    by_path = store.index_by_path(root)
+    assert sorted(by_path) == [f"sub-{i:02d}/anat.nii.gz" for i in range(4)]
+    assert by_path["sub-01/anat.nii.gz"] == [1, 5, 9, 13, 17]
+    assert [r.model_dump() for r in store.select(by_path["sub-01/anat.nii.gz"])] == [
+        results[i].model_dump() for i in (1, 5, 9, 13, 17)
+    ]
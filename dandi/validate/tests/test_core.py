@@ -1,8 +1,11 @@
 import json
+import os
 from pathlib import Path
+import shutil
 from typing import Any
 
 import pytest
+from pytest_mock import MockerFixture
 
 from .._core import validate
 from .._types import (
@@ -17,6 +20,8 @@ from .._types import (
 )
 from ... import __version__
 from ...consts import dandiset_metadata_file
+from ...files import bases
+from ...pynwb_utils import validate_cache
 from ...tests.fixtures import BIDS_TESTDATA_SELECTION
 
 
@@ -26,6 +31,38 @@ def test_validate_nwb_error(simple3_nwb: Path) -> None:
     assert len([i for i in validation_result if i.severity]) > 0
 
 
+def test_validate_nwb_jobs(organized_nwb_dir: Path) -> None:
+    serial = validate(organized_nwb_dir)
+    parallel = validate(organized_nwb_dir, jobs=2)
+    assert sorted(r.model_dump_json() for r in parallel) == sorted(
+        r.model_dump_json() for r in serial
+    )
+
+
+def test_validate_cache(
+    mocker: MockerFixture, simple1_nwb: Path, tmp_path: Path
+) -> None:
+    (tmp_path / dandiset_metadata_file).write_text(
+        "identifier: 12346\nname: Foo\ndescription: Dandiset Foo\n"
+    )
+    nwb = tmp_path / "sub-01" / "sub-01.nwb"
+    nwb.parent.mkdir()
+    shutil.copy2(simple1_nwb, nwb)
+    os.utime(nwb, (1600000000, 1600000000))
+    spy = mocker.spy(bases, "_inspect_nwb_session")
+    results = [r.model_dump_json() for r in validate(tmp_path)]
+    assert any(r.id.startswith("NWBI.") for r in validate(tmp_path, cache=False))
+    assert spy.call_count == 2
+    if validate_cache._ignore_cache:
+        pytest.skip("Caching is disabled")
+    # Unchanged files are not validated again
+    assert [r.model_dump_json() for r in validate(tmp_path)] == results
+    assert spy.call_count == 2
+    os.utime(nwb, (1600000001, 1600000001))
+    assert [r.model_dump_json() for r in validate(tmp_path)] == results
+    assert spy.call_count == 3
+
+
 def test_validate_relative_path(
     bids_examples: Path,
     monkeypatch: pytest.MonkeyPatch,
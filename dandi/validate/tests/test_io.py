@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from dandi.validate import _io
 from dandi.validate._io import (
+    iter_validation_jsonl,
     load_validation_jsonl,
     validation_companion_path,
+    validation_index_path,
     write_validation_jsonl,
 )
 from dandi.validate._types import (
@@ -100,6 +104,96 @@ class TestWriteAndLoad:
         assert len(loaded) == 1
 
 
+class TestIndexedStore:
+    @pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz", ".jsonl.zst"])
+    def test_filtered_read(
+        self, suffix: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Indexed reads parse only the selected results, across blocks."""
+        if suffix.endswith(".zst"):
+            pytest.importorskip("zstandard")
+        monkeypatch.setattr(_io, "BLOCK_SIZE", 512)
+        out = tmp_path / f"results{suffix}"
+        results = [
+            _make_result(f"X.{i}", Severity.ERROR if i % 5 == 0 else Severity.HINT)
+            for i in range(40)
+        ]
+        write_validation_jsonl(results[:25], out)
+        write_validation_jsonl(results[25:], out, append=True)
+        assert validation_index_path(out).exists()
+        assert [r.id for r in load_validation_jsonl([out])] == [r.id for r in results]
+
+        parsed: list[str] = []
+        validate_json = ValidationResult.model_validate_json
+
+        def spy(data: str | bytes) -> ValidationResult:
+            r = validate_json(data)
+            parsed.append(r.id)
+            return r
+
+        monkeypatch.setattr(ValidationResult, "model_validate_json", spy)
+        errors = list(
+            iter_validation_jsonl([out], min_severity=Severity.ERROR, ignore=r"\.35$")
+        )
+        assert [r.id for r in errors] == [
+            "X.0",
+            "X.5",
+            "X.10",
+            "X.15",
+            "X.20",
+            "X.25",
+            "X.30",
+        ]
+        assert parsed == [r.id for r in errors]
+        assert [
+            r.id for r in iter_validation_jsonl([out], path_prefix="/tmp/X.7.nwb")
+        ] == ["X.7"]
+
+    def test_stale_index(self, tmp_path: Path) -> None:
+        """Results written behind the index's back are still read."""
+        out = tmp_path / "results.jsonl"
+        write_validation_jsonl([_make_result("A")], out)
+        with out.open("a") as f:
+            f.write(_make_result("B", Severity.ERROR).model_dump_json() + "\n")
+        assert [
+            r.id for r in iter_validation_jsonl([out], min_severity=Severity.ERROR)
+        ] == ["B"]
+        # Appending to a file with a stale index drops the index
+        write_validation_jsonl([_make_result("C")], out, append=True)
+        assert not validation_index_path(out).exists()
+        assert [r.id for r in load_validation_jsonl([out])] == ["A", "B", "C"]
+
+    def test_orphaned_index(self, tmp_path: Path) -> None:
+        """An index left behind by a deleted file is not extended."""
+        out = tmp_path / "results.jsonl"
+        write_validation_jsonl(
+            [_make_result("A", Severity.ERROR), _make_result("B", Severity.ERROR)],
+            out,
+        )
+        out.unlink()
+        assert validation_index_path(out).exists()
+        write_validation_jsonl([_make_result("C", Severity.ERROR)], out, append=True)
+        assert [
+            r.id for r in iter_validation_jsonl([out], min_severity=Severity.ERROR)
+        ] == ["C"]
+
+    def test_concurrent_appends(self, tmp_path: Path) -> None:
+        out = tmp_path / "results.jsonl.gz"
+
+        def append(i: int) -> None:
+            write_validation_jsonl(
+                [_make_result(f"T{i}.{j}") for j in range(10)], out, append=True
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(append, range(8)))
+        loaded = load_validation_jsonl([out])
+        assert sorted(r.id for r in loaded) == sorted(
+            f"T{i}.{j}" for i in range(8) for j in range(10)
+        )
+        assert len(list(iter_validation_jsonl([out], path_prefix="/tmp"))) == 80
+
+
 @pytest.mark.ai_generated
 class TestCompanionPath:
     def test_derives_from_logfile(self) -> None: